@@ -21,6 +21,7 @@ static PyObject * Adaptive_Contouring_Linear_wrapper(PyObject *self, PyObject *a
 
   if (!PyArg_ParseTuple(args, "dddddddd", &d, &q, &y1, &y2, &rho, &gamma, &acc, &ld_acc)) return NULL;
 
+  Py_BEGIN_ALLOW_THREADS
   if (gamma == 0.0) {
     mag = mag_binext(y1, y2, rho, d, q, NULL, -1, NULL, acc, ld_acc);
   }
@@ -28,6 +29,7 @@ static PyObject * Adaptive_Contouring_Linear_wrapper(PyObject *self, PyObject *a
     gam[0] = gamma;
     mag = mag_binext(y1, y2, rho, d, q, ld_linear, 1, gam, acc, ld_acc);
   }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
@@ -1,17 +1,20 @@
 from os import path
 
 from MulensModel.binarylens import BinaryLensPointSourceWM95Magnification,\
-    BinaryLensPointSourceVBBLMagnification, \
+    BinaryLensPointSourceVectorizedMagnification, BinaryLensPointSourceVBBLMagnification, \
     BinaryLensQuadrupoleMagnification, BinaryLensHexadecapoleMagnification, \
-    BinaryLensVBBLMagnification, BinaryLensAdaptiveContouringMagnification
+    BinaryLensVBBLMagnification, BinaryLensAdaptiveContouringMagnification, BinaryLensAdaptiveMagnification
 from MulensModel.binarylenswithshear import \
     BinaryLensPointSourceWithShearWM95Magnification, \
+    BinaryLensPointSourceWithShearVectorizedMagnification, \
     BinaryLensPointSourceWithShearVBBLMagnification
 from MulensModel.causticsbinary import CausticsBinary
 from MulensModel.causticspointwithshear import CausticsPointWithShear
 from MulensModel.causticsbinarywithshear import CausticsBinaryWithShear
 from MulensModel.coordinates import Coordinates
+from MulensModel.earthephemeris import EarthEphemeris
 from MulensModel.event import Event
+from MulensModel.eventpool import EventPool
 from MulensModel.fitdata import FitData
 from MulensModel.horizons import Horizons
 from MulensModel.limbdarkeningcoeffs import LimbDarkeningCoeffs
@@ -29,20 +32,25 @@ from MulensModel.elliputils import EllipUtils
 from MulensModel.satelliteskycoord import SatelliteSkyCoord
 from MulensModel.trajectory import Trajectory
 from MulensModel.uniformcausticsampling import UniformCausticSampling
-from MulensModel.utils import MAG_ZEROPOINT, Utils
+from MulensModel.utils import MAG_ZEROPOINT, Utils, ResultsCache
 
 from .version import __version__
 
 __all__ = [
-    'BinaryLensPointSourceWM95Magnification', 'BinaryLensPointSourceVBBLMagnification',
+    'BinaryLensPointSourceWM95Magnification', 'BinaryLensPointSourceVectorizedMagnification',
+    'BinaryLensPointSourceVBBLMagnification',
     'BinaryLensQuadrupoleMagnification', 'BinaryLensHexadecapoleMagnification', 'BinaryLensVBBLMagnification',
-    'BinaryLensAdaptiveContouringMagnification', 'BinaryLensPointSourceWithShearWM95Magnification',
-    'BinaryLensPointSourceWithShearVBBLMagnification', 'CausticsBinary', 'CausticsPointWithShear',
-    'CausticsBinaryWithShear', 'Coordinates', 'Event', 'FitData', 'Horizons', 'LimbDarkeningCoeffs',
+    'BinaryLensAdaptiveContouringMagnification', 'BinaryLensAdaptiveMagnification',
+    'BinaryLensPointSourceWithShearWM95Magnification',
+    'BinaryLensPointSourceWithShearVectorizedMagnification', 'BinaryLensPointSourceWithShearVBBLMagnification',
+    'CausticsBinary', 'CausticsPointWithShear',
+    'CausticsBinaryWithShear', 'Coordinates', 'EarthEphemeris', 'Event', 'EventPool', 'FitData', 'Horizons',
+    'LimbDarkeningCoeffs',
     'MagnificationCurve', 'Model', 'ModelParameters', 'MulensData', 'Lens', 'Source', 'MulensSystem', 'orbits',
     'PointSourcePointLensMagnification', 'FiniteSourceUniformGould94Magnification',
     'FiniteSourceLDYoo04Magnification', 'PointSourcePointLensWithShearMagnification', 'B0B1Utils', 'EllipUtils',
-    'SatelliteSkyCoord', 'Trajectory', 'UniformCausticSampling', 'MAG_ZEROPOINT', 'Utils', '__version__']
+    'SatelliteSkyCoord', 'Trajectory', 'UniformCausticSampling', 'MAG_ZEROPOINT', 'Utils', 'ResultsCache',
+    '__version__']
 
 MODULE_PATH = path.abspath(__file__)
 for i in range(3):
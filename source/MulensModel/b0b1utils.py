@@ -1,6 +1,6 @@
 from os.path import join, exists
 import numpy as np
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 
 import MulensModel as mm
 
@@ -10,40 +10,91 @@ class B0B1Utils(object):
     Data and methods used for interpolation for finite-source point-lens
     magnification calculations.
 
+    The tabulated functions B_0(z), B_0(z)-B_1(z), B_1(z), d B_0(z)/d z,
+    and d B_1(z)/d z are interpolated using cubic splines (the same as
+    *scipy.interpolate.interp1d(kind='cubic')*). Polynomial coefficients
+    of the splines are calculated only once, when the interpolation is
+    used for the first time.
+
     There are no parameters of `__init__()`. In general, this class is not
     directly used by a user.
     """
     _B0B1_file_read = False
+    _fill_values = np.array([1., 0., 0., 0., 0.])
 
     def __init__(self):
         self._B0B1_file = join(mm.DATA_PATH, 'interpolation_table_b0b1_v3.dat')
 
-        if not B0B1Utils._B0B1_file_read:
-            self._read_B0B1_file()
-
     def _read_B0B1_file(self):
-        """Read file with pre-computed function values"""
+        """
+        Read the file with pre-computed function values and calculate
+        spline coefficients.
+        """
         if not exists(self._B0B1_file):
             raise ValueError(
                 'File with FSPL data does not exist.\n' + self._B0B1_file)
 
-        file_info = np.loadtxt(self._B0B1_file, unpack=True)
-        (z, B0, B0_minus_B1, B1, B0_prime, B1_prime) = file_info
-
-        kwargs = {'kind': 'cubic', 'bounds_error': False, 'fill_value': 1.}
-        B0B1Utils._B0_interpolation = interp1d(z, B0, **kwargs)
-        kwargs['fill_value'] = 0.
-        B0B1Utils._B0_minus_B1_interpolation = interp1d(
-            z, B0_minus_B1, **kwargs)
-        B0B1Utils._B1_interpolation = interp1d(z, B1, **kwargs)
-        B0B1Utils._B0_prime_interpolation = interp1d(
-            z, B0_prime, **kwargs)
-        B0B1Utils._B1_prime_interpolation = interp1d(
-            z, B1_prime, **kwargs)
-        B0B1Utils._z_min = np.min(z)
-        B0B1Utils._z_max = np.max(z)
+        table = self._calculate_coefficients()
+        B0B1Utils._z = table[:, 0]
+        B0B1Utils._coefficients = table[:-1, 1:].reshape(-1, 4, 5)
+        B0B1Utils._z_min = table[0, 0]
+        B0B1Utils._z_max = table[-1, 0]
         B0B1Utils._B0B1_file_read = True
 
+    def _calculate_coefficients(self):
+        """
+        Calculate coefficients of cubic polynomials in each interval.
+        Returned array has shape (N, 21). The first column gives z and
+        the remaining ones are coefficients for interval starting at
+        given z (from the highest power) for each of 5 functions.
+        """
+        file_info = np.loadtxt(self._B0B1_file)
+        z = file_info[:, 0]
+        spline = make_interp_spline(z, file_info[:, 1:], k=3)
+        # Spline breakpoints are a subset of z, hence, the derivatives at
+        # start of each interval fully define the cubic polynomial there.
+        coefficients = np.array([spline(z[:-1], 3) / 6., spline(z[:-1], 2) / 2., spline(z[:-1], 1), spline(z[:-1])])
+
+        table = np.zeros((len(z), 21))
+        table[:, 0] = z
+        table[:-1, 1:] = np.moveaxis(coefficients, 0, 1).reshape(-1, 20)
+        return table
+
+    def interpolate(self, z):
+        """
+        Interpolate all 5 functions in a single pass.
+
+        Parameters :
+            z: *np.ndarray*
+                Values of u/rho.
+
+        Returns :
+            values: *np.ndarray* (*float*, size of (N, 5))
+                Values of B_0(z), B_0(z)-B_1(z), B_1(z), d B_0(z)/d z, and
+                d B_1(z)/d z. Outside the tabulated range, B_0 is 1 and
+                the other functions are 0.
+        """
+        if not B0B1Utils._B0B1_file_read:
+            self._read_B0B1_file()
+
+        z = np.asarray(z, dtype=float)
+        shape = z.shape
+        z = z.ravel()
+        index = np.searchsorted(B0B1Utils._z, z, side='right') - 1
+        index = np.clip(index, 0, len(B0B1Utils._z) - 2)
+        dz = (z - B0B1Utils._z[index])[:, np.newaxis]
+        coefficients = B0B1Utils._coefficients[index]
+
+        out = coefficients[:, 0] * dz + coefficients[:, 1]
+        out = out * dz + coefficients[:, 2]
+        out = out * dz + coefficients[:, 3]
+
+        outside = (z < B0B1Utils._z_min) | (z > B0B1Utils._z_max) | np.isnan(z)
+        if np.any(outside):
+            out[outside] = B0B1Utils._fill_values
+
+        return out.reshape(shape + (5,))
+
     def interpolate_B0(self, z):
         """
         Interpolate B_0(z) function.
@@ -56,7 +107,7 @@ class B0B1Utils(object):
             B0: *np.ndarray*
                 Values of B_0.
         """
-        return B0B1Utils._B0_interpolation(z)
+        return self.interpolate(z)[..., 0]
 
     def interpolate_B0minusB1(self, z):
         """
@@ -70,7 +121,7 @@ class B0B1Utils(object):
             B0_minus_B1: *np.ndarray*
                 Values of B_0(z)-B_1(z).
         """
-        return B0B1Utils._B0_minus_B1_interpolation(z)
+        return self.interpolate(z)[..., 1]
 
     def interpolate_B1(self, z):
         """
@@ -84,7 +135,7 @@ class B0B1Utils(object):
             B1: *np.ndarray*
                 Values of B_1(z).
         """
-        return B0B1Utils._B1_interpolation(z)
+        return self.interpolate(z)[..., 2]
 
     def interpolate_B0prime(self, z):
         """
@@ -98,7 +149,7 @@ class B0B1Utils(object):
             dB0_dz: *np.ndarray*
                 Values of d B_0(z)/d z.
         """
-        return B0B1Utils._B0_prime_interpolation(z)
+        return self.interpolate(z)[..., 3]
 
     def interpolate_B1prime(self, z):
         """
@@ -112,7 +163,7 @@ class B0B1Utils(object):
             dB1_dz: *np.ndarray*
                 Values of d B_1(z)/d z.
         """
-        return B0B1Utils._B1_prime_interpolation(z)
+        return self.interpolate(z)[..., 4]
 
     def get_interpolation_mask(self, z):
         """
@@ -127,6 +178,9 @@ class B0B1Utils(object):
             mask: *np.ndarray*
                 Mask indicating for which z values interpolation is allowed.
         """
+        if not B0B1Utils._B0B1_file_read:
+            self._read_B0B1_file()
+
         mask = (z > B0B1Utils._z_min)
         mask &= (z < B0B1Utils._z_max)
         return mask
@@ -138,4 +192,7 @@ class B0B1Utils(object):
 
         *float*
         """
+        if not B0B1Utils._B0B1_file_read:
+            self._read_B0B1_file()
+
         return B0B1Utils._z_max
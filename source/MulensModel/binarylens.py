@@ -1,13 +1,19 @@
 import warnings
 import numpy as np
-from math import fsum, sqrt
+from math import fsum, sqrt, isfinite
+from concurrent.futures import ThreadPoolExecutor
+from scipy.spatial import cKDTree
 
 from MulensModel.binarylensimports import (
     _vbbl_wrapped, _adaptive_contouring_wrapped,
     _vbbl_binary_mag_dark, _vbbl_binary_mag_finite, _vbbl_binary_mag_point,
-    _vbbl_SG12_5, _adaptive_contouring_linear, _solver)
+    _vbbl_binary_mag_dark_array, _vbbl_binary_mag_finite_array, _vbbl_SG12_5, _vbbl_SG12_warm_start,
+    _adaptive_contouring_linear, _solver)
 
+from MulensModel.causticsbinary import CausticsBinary
+from MulensModel.modelparameters import ModelParameters
 from MulensModel.pointlens import _AbstractMagnification
+from MulensModel.trajectory import Trajectory
 from MulensModel.utils import Utils
 from MulensModel.version import __version__ as mm_version
 
@@ -42,7 +48,9 @@ class _BinaryLensPointSourceMagnification(_AbstractMagnification):
     """
     def __init__(self, **kwargs):
         super().__init__(trajectory=kwargs['trajectory'])
-        self._q = float(self.trajectory.parameters.q)  # This speeds-up code for np.float input.
+        self._q = self.trajectory.parameters.q
+        if np.ndim(self._q) == 0:
+            self._q = float(self._q)  # This speeds-up code for np.float input.
         self._solver = _solver
 
         self._source_x = self.trajectory.x
@@ -115,10 +123,18 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
         trajectory: :py:class:`~MulensModel.trajectory.Trajectory`
             Including trajectory.parameters =
             :py:class:`~MulensModel.modelparameters.ModelParameters`
+
+        warm_start: *bool*, optional
+            If *True*, then Skowron & Gould (2012) solver starts
+            from the roots found for the previous epoch. For densely
+            sampled light curves the roots move little between epochs,
+            hence, only a few iterations are needed. Default is *False*.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, warm_start=False, **kwargs):
         super().__init__(**kwargs)
+        self._warm_start = warm_start
+        self._warm_start_roots = None
 
         self._mass_1 = 1. / (1. + self._q)
         self._mass_2 = self._q / (1. + self._q)
@@ -146,10 +162,7 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
         """
         Calculate point-source--binary-lens magnification.
         """
-        (x, y) = self._change_frame(x, y, separation)
-
-        self._zeta = float(x) + float(y) * 1.j
-        self._position_z1 = -separation + 0.j
+        self._set_source_and_lens(x, y, separation)
 
         jacobian_determinant = self._get_jacobian_determinant()
         signed_magnification = 1. / jacobian_determinant
@@ -157,6 +170,123 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
 
         return magnification
 
+    def _set_source_and_lens(self, x, y, separation):
+        """
+        Set source and primary lens positions in the frame of the secondary mass.
+        """
+        (x, y) = self._change_frame(x, y, separation)
+
+        self._zeta = float(x) + float(y) * 1.j
+        self._position_z1 = -separation + 0.j
+
+    def get_d_A_d_params(self, parameters):
+        """
+        Calculate d A / d parameters for a point-source--binary-lens model.
+        The positions of images are found first and then the lens equation
+        is differentiated implicitly at these positions, hence, no
+        additional solutions of the lens equation are needed.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+                Accepted values are: ``t_0``, ``u_0``, ``t_E``, ``t_eff``,
+                ``alpha``, ``s``, ``q``, ``pi_E_N``, ``pi_E_E``, and ``rho``
+                (for which the derivatives are 0).
+
+        Returns :
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        return self.get_magnification_and_d_A_d_params(parameters)[1]
+
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Calculate the magnification and d A / d parameters using the same
+        positions of images. See :py:func:`get_d_A_d_params()`.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each epoch.
+
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        (images, mask) = self._get_images()
+        (self._magnification, d_A) = self._get_magnification_and_derivatives(images, mask)
+        d_xy_d_params = self.trajectory._get_d_xy_d_params(parameters)
+
+        d_A_d_params = {}
+        for key in parameters:
+            (d_x, d_y) = d_xy_d_params[key]
+            d_A_d_params[key] = d_A['x'] * d_x + d_A['y'] * d_y
+            if key in ['s', 'q']:
+                d_A_d_params[key] = d_A_d_params[key] + d_A[key]
+
+        return (self._magnification, d_A_d_params)
+
+    def _get_images(self):
+        """
+        Find positions of images (in the frame of the secondary mass) for
+        all epochs. Returns (N, 5) *np.ndarray* of complex positions and
+        (N, 5) mask which indicates real images.
+        """
+        x = np.atleast_1d(self._source_x)
+        images = np.full((len(x), 5), 1. + 1.j)  # Values for missing images are not used.
+        mask = np.zeros((len(x), 5), dtype=bool)
+        zip_args = [x, np.atleast_1d(self._source_y), np.atleast_1d(self._separations) * np.ones(len(x))]
+        for (i, (x_, y_, separation)) in enumerate(zip(*zip_args)):
+            self._set_source_and_lens(x_, y_, separation)
+            roots = self._verify_polynomial_roots()
+            images[i, :len(roots)] = roots
+            mask[i, :len(roots)] = True
+
+        return (images, mask)
+
+    def _get_magnification_and_derivatives(self, images, mask):
+        """
+        Calculate magnification and its derivatives with respect to source
+        position (in the center of mass frame; keys 'x' and 'y'),
+        separation ('s'), and mass ratio ('q') using implicit
+        differentiation of the lens equation:
+        z = zeta + m_1 / (conj(z) - z_1) + m_2 / (conj(z) - z_2)
+        at image positions z. Returns magnification and *dict* of derivatives.
+        """
+        separations = np.atleast_1d(self._separations) * np.ones(len(images))
+        z_1 = -separations[:, np.newaxis]
+        one_plus_q_2 = (1. + self._q)**2
+        inverse_1 = 1. / (np.conjugate(images) - z_1)
+        inverse_2 = 1. / (np.conjugate(images) - self._position_z2)
+        shear = self._mass_1 * inverse_1**2 + self._mass_2 * inverse_2**2
+        determinant = 1. - (shear * np.conjugate(shear)).real
+
+        # For each variable: changes of zeta, z_1, m_1, and m_2.
+        changes = {
+            'x': (1., 0., 0., 0.),
+            'y': (1.j, 0., 0., 0.),
+            's': (-1. / (1. + self._q), -1., 0., 0.),
+            'q': (separations[:, np.newaxis] / one_plus_q_2, 0., -1. / one_plus_q_2, 1. / one_plus_q_2)}
+
+        out = {}
+        for (key, (d_zeta, d_z_1, d_m_1, d_m_2)) in changes.items():
+            w = d_zeta + d_m_1 * inverse_1 + d_m_2 * inverse_2 + self._mass_1 * d_z_1 * inverse_1**2
+            d_image_conj = np.conjugate((w - shear * np.conjugate(w)) / determinant)
+            d_shear = (d_m_1 * inverse_1**2 + d_m_2 * inverse_2**2 -
+                       2. * self._mass_1 * (d_image_conj - d_z_1) * inverse_1**3 -
+                       2. * self._mass_2 * d_image_conj * inverse_2**3)
+            d_determinant = -2. * (np.conjugate(shear) * d_shear).real
+            out[key] = np.sum(-np.sign(determinant) * d_determinant / determinant**2, axis=1, where=mask)
+
+        magnification = np.sum(1. / np.abs(determinant), axis=1, where=mask)
+        return (magnification, out)
+
     def _change_frame(self, x, y, separation):
         """
         Change frame in which source position is provided:
@@ -231,9 +361,11 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
         if self._solver == 'numpy':
             self._polynomial_roots = np_polyroots(polynomial)
         elif self._solver == 'Skowron_and_Gould_12':
-            args = polynomial.real.tolist() + polynomial.imag.tolist()
             try:
-                out = _vbbl_SG12_5(*args)
+                if self._warm_start:
+                    out = self._get_polynomial_roots_warm_start(polynomial)
+                else:
+                    out = _vbbl_SG12_5(*(polynomial.real.tolist() + polynomial.imag.tolist()))
             except ValueError as err:
                 err2 = "\n\nSwitching from Skowron & Gould 2012 to numpy"
                 warnings.warn(str(err) + err2, UserWarning)
@@ -249,6 +381,26 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
 
         return self._polynomial_roots
 
+    def _get_polynomial_roots_warm_start(self, polynomial):
+        """
+        Solve polynomial using Skowron & Gould (2012) method with the roots
+        from the previous call as starting points. Returns real parts
+        of roots followed by imaginary parts.
+        """
+        degree = len(polynomial) - 1
+        roots = self._warm_start_roots
+        if roots is None or len(roots) != 2 * degree:
+            roots = np.zeros(2 * degree)
+
+        _vbbl_SG12_warm_start(np.concatenate((polynomial.real, polynomial.imag)), roots)
+        out = roots.tolist()
+        if isfinite(sum(out)):
+            self._warm_start_roots = roots
+        else:
+            self._warm_start_roots = None
+
+        return out
+
     def _verify_polynomial_roots(self, return_distances=False):
         """verified roots of polynomial i.e. roots of lens equation"""
         roots = self._get_polynomial_roots()
@@ -312,6 +464,215 @@ class BinaryLensPointSourceWM95Magnification(_BinaryLensPointSourceMagnification
             return np.array(out)
 
 
+class BinaryLensPointSourceVectorizedMagnification(BinaryLensPointSourceWM95Magnification):
+    """
+    Equations for calculating point-source--binary-lens magnification following
+    the `Witt & Mao 1995, ApJL, 447, L105 <https://ui.adsabs.harvard.edu/abs/1995ApJ...447L.105W/abstract>`_
+    prescription, but for all epochs at once. The polynomial coefficients
+    are calculated as (N, 6) array, all polynomials are solved in a single
+    call (eigenvalues of companion matrices, see
+    :py:func:`~MulensModel.utils.Utils.polynomial_roots_vectorized()`),
+    and the roots are verified using array operations.
+
+    For epochs for which the number of verified roots is neither 3 nor 5,
+    the calculation is repeated using
+    :py:class:`BinaryLensPointSourceWM95Magnification` approach,
+    i.e., one epoch at a time and with the default polynomial root solver.
+
+    The mass ratio and separation can be arrays of the same length
+    as the trajectory, i.e., each epoch can have a different lens, which
+    is used by :py:func:`~MulensModel.model.Model.get_magnification_batch()`.
+
+    Arguments :
+        trajectory: :py:class:`~MulensModel.trajectory.Trajectory`
+            Including trajectory.parameters =
+            :py:class:`~MulensModel.modelparameters.ModelParameters`
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._fallback = None
+
+    def get_magnification(self):
+        """
+        Calculate the magnification
+
+        Parameters : None
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each point in :py:attr:`~trajectory`.
+        """
+        x = np.atleast_1d(self._source_x)
+        y = np.atleast_1d(self._source_y)
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+
+        self._magnification = self._get_magnification_vectorized(x, y, separations)
+        return self._magnification
+
+    def _get_magnification_vectorized(self, x, y, separations, initial_roots=None, return_roots=False):
+        """
+        Calculate point-source--binary-lens magnification for
+        arrays of source positions and separations.
+        If *initial_roots* (N, 5) are not provided, then they are
+        estimated. If *return_roots* is *True*, then the roots of
+        polynomials are returned as well.
+        """
+        (roots, roots_ok, z1) = self._get_roots_vectorized(x, y, separations, initial_roots)
+
+        roots_bar = np.conjugate(roots)
+        derivative = (np.reshape(self._mass_1, (-1, 1)) / (z1[:, np.newaxis] - roots_bar)**2 +
+                      np.reshape(self._mass_2, (-1, 1)) / (self._position_z2 - roots_bar)**2)
+        jacobian_determinant = 1. - (derivative * np.conjugate(derivative)).real
+        magnification = np.sum(np.abs(1. / jacobian_determinant), axis=1, where=roots_ok)
+
+        n_ok = np.sum(roots_ok, axis=1)
+        for index in np.where((n_ok != 3) & (n_ok != 5))[0]:
+            q = None if np.ndim(self._q) == 0 else self._q[index]
+            magnification[index] = self._get_1_magnification_fallback(x[index], y[index], separations[index], q)
+
+        if return_roots:
+            return (magnification, roots)
+
+        return magnification
+
+    def _get_roots_vectorized(self, x, y, separations, initial_roots=None):
+        """
+        Solve polynomials for all epochs and verify the roots.
+        Returns roots (N, 5), mask of verified roots (N, 5), and
+        positions of the primary (N,), all in the frame of the secondary mass.
+        """
+        (x_planet, y_planet) = self._change_frame(x, y, separations)
+        zeta = x_planet + y_planet * 1.j
+        z1 = -separations + 0.j
+
+        polynomials = self._get_polynomials_vectorized(zeta, z1)
+        if initial_roots is None:
+            initial_roots = self._get_initial_roots_vectorized(zeta, z1)
+        roots = Utils.polynomial_roots_vectorized(polynomials, initial_roots=initial_roots)
+        roots_ok = self._verify_polynomial_roots_vectorized(roots, zeta, z1)
+
+        return (roots, roots_ok, z1)
+
+    def _get_images(self):
+        """
+        Find positions of images (in the frame of the secondary mass) for
+        all epochs at once. Epochs for which the number of verified roots
+        is neither 3 nor 5 are repeated one by one.
+        Returns (N, 5) *np.ndarray* of complex positions and
+        (N, 5) mask which indicates real images.
+        """
+        x = np.atleast_1d(self._source_x)
+        y = np.atleast_1d(self._source_y)
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+        (images, mask, _) = self._get_roots_vectorized(x, y, separations)
+
+        n_ok = np.sum(mask, axis=1)
+        for index in np.where((n_ok != 3) & (n_ok != 5))[0]:
+            self._set_source_and_lens(x[index], y[index], separations[index])
+            roots = self._verify_polynomial_roots()
+            images[index] = 1. + 1.j
+            images[index, :len(roots)] = roots
+            mask[index] = False
+            mask[index, :len(roots)] = True
+
+        return (images, mask)
+
+    def _get_1_magnification_fallback(self, x, y, separation, q=None):
+        """
+        Calculate magnification for a single epoch for which the vectorized
+        calculation failed. The mass ratio *q* has to be provided only if
+        it is different for each epoch.
+        """
+        if q is not None:
+            parameters = ModelParameters({'t_0': 0., 'u_0': 0., 't_E': 1., 's': float(separation), 'q': float(q),
+                                          'alpha': 0.})
+            trajectory = Trajectory(parameters=parameters, x=np.array([x]), y=np.array([y]))
+            fallback = BinaryLensPointSourceMagnification(trajectory=trajectory)
+            return fallback._get_1_magnification_point_source(float(x), float(y), float(separation))
+
+        if self._fallback is None:
+            self._fallback = BinaryLensPointSourceMagnification(trajectory=self.trajectory)
+
+        return self._fallback._get_1_magnification_point_source(float(x), float(y), float(separation))
+
+    def _get_initial_roots_vectorized(self, zeta, z1):
+        """
+        Initial guesses for polynomial roots: two images of point lens with
+        total mass placed at the center of mass and three points close to
+        the lenses.
+        """
+        z_center = z1 * self._mass_1
+        zeta_center = zeta - z_center
+        with np.errstate(divide='ignore', invalid='ignore'):
+            factor = 0.5 * np.sqrt(1. + 4. / np.abs(zeta_center)**2)
+        factor[np.logical_not(np.isfinite(factor))] = 1.
+        angle_1 = np.exp(1.j * np.angle(zeta - z1))
+        angle_2 = 1.j * np.exp(1.j * np.angle(zeta - self._position_z2))
+        shift_2 = 0.5 * np.sqrt(self._mass_2)
+
+        initial_roots = [
+            z_center + zeta_center * (0.5 + factor),
+            z_center + zeta_center * (0.5 - factor),
+            z1 + 0.1 * np.sqrt(self._mass_1) * angle_1,
+            self._position_z2 + shift_2 * angle_2,
+            self._position_z2 - shift_2 * angle_2]
+
+        return np.array(initial_roots).T
+
+    def _get_polynomials_vectorized(self, zeta, z1):
+        """
+        Calculate coefficients of the polynomials in planet frame for
+        all epochs. Equations are the same as in
+        :py:func:`~BinaryLensPointSourceWM95Magnification._get_polynomial()`.
+
+        Returns :
+            polynomials: *np.ndarray* (N, 6)
+                Coefficients from the lowest to the highest power.
+        """
+        total_m = self._total_mass
+        m_diff = self._mass_difference
+        zeta_conj = np.conjugate(zeta)
+        z1_plus_2_zeta = z1 + 2. * zeta
+
+        coeffs = np.empty((len(zeta), 6), dtype=complex)
+        coeffs[:, 5] = (z1 - zeta_conj) * zeta_conj
+        coeffs[:, 4] = ((-m_diff + total_m) * z1 - (2. * total_m + z1 * (2. * z1 + zeta)) * zeta_conj +
+                        (2. * z1 + zeta) * zeta_conj**2)
+        coeffs[:, 3] = (z1 * (m_diff * z1 - total_m * z1_plus_2_zeta) +
+                        zeta_conj * (2. * m_diff * z1 + (2. * total_m + z1**2) * z1_plus_2_zeta) -
+                        z1 * z1_plus_2_zeta * zeta_conj**2)
+        coeffs[:, 2] = (m_diff * z1 * (2. * total_m + z1 * zeta) +
+                        total_m * (-2. * total_m * z1 + 4. * total_m * zeta + 3. * z1**2 * zeta) -
+                        z1 * zeta_conj * (zeta * (6. * total_m + z1**2) + 2. * m_diff * (z1 + zeta)) +
+                        z1**2 * zeta * zeta_conj**2)
+        coeffs[:, 1] = -z1 * (m_diff + total_m) * (
+            m_diff * z1 - total_m * z1 + 4. * total_m * zeta + z1**2 * zeta - 2. * z1 * zeta * zeta_conj)
+        coeffs[:, 0] = (m_diff + total_m)**2 * z1**2 * zeta
+
+        return coeffs
+
+    def _verify_polynomial_roots_vectorized(self, roots, zeta, z1):
+        """
+        Verify roots of polynomials i.e. find roots of lens equation.
+        This is the vectorized version of
+        :py:func:`~BinaryLensPointSourceWM95Magnification._verify_polynomial_roots()`.
+
+        Returns :
+            roots_ok: *np.ndarray* (N, 5) of *bool*
+                Which roots are verified, i.e., are roots of lens equation.
+        """
+        roots_conj = np.conjugate(roots)
+        solutions = (zeta[:, np.newaxis] +
+                     np.reshape(self._mass_1, (-1, 1)) / (roots_conj - z1[:, np.newaxis]) +
+                     np.reshape(self._mass_2, (-1, 1)) / (roots_conj - self._position_z2))
+
+        distances = np.abs(solutions[:, np.newaxis, :] - roots[:, :, np.newaxis])**2
+        min_distance_arg = np.argmin(distances, axis=2)
+
+        return (min_distance_arg == np.arange(roots.shape[1]))
+
+
 class BinaryLensPointSourceVBBLMagnification(_BinaryLensPointSourceMagnification):
     """
     Equations for calculating point-source--binary-lens magnification using
@@ -335,6 +696,47 @@ class BinaryLensPointSourceVBBLMagnification(_BinaryLensPointSourceMagnification
         """
         return _vbbl_binary_mag_point(separation, self._q, x, y)
 
+    def get_d_A_d_params(self, parameters):
+        """
+        Calculate d A / d parameters for a point-source--binary-lens model.
+        See
+        :py:func:`BinaryLensPointSourceWM95Magnification.get_d_A_d_params()`.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        return self.get_magnification_and_d_A_d_params(parameters)[1]
+
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Calculate the magnification and d A / d parameters using the same
+        positions of images. See
+        :py:func:`BinaryLensPointSourceWM95Magnification.get_magnification_and_d_A_d_params()`.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each epoch.
+
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        derivatives = BinaryLensPointSourceVectorizedMagnification(trajectory=self.trajectory)
+        (self._magnification, d_A_d_params) = derivatives.get_magnification_and_d_A_d_params(parameters)
+        return (self._magnification, d_A_d_params)
+
 
 class BinaryLensPointSourceMagnification(_BinaryLensPointSourceMagnification):
     """
@@ -367,6 +769,47 @@ class BinaryLensPointSourceMagnification(_BinaryLensPointSourceMagnification):
 
         return out
 
+    def get_d_A_d_params(self, parameters):
+        """
+        Calculate d A / d parameters for a point-source--binary-lens model.
+        See
+        :py:func:`BinaryLensPointSourceWM95Magnification.get_d_A_d_params()`.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        return self.get_magnification_and_d_A_d_params(parameters)[1]
+
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Calculate the magnification and d A / d parameters using the same
+        positions of images. See
+        :py:func:`BinaryLensPointSourceWM95Magnification.get_magnification_and_d_A_d_params()`.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each epoch.
+
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        derivatives = BinaryLensPointSourceVectorizedMagnification(trajectory=self.trajectory)
+        (self._magnification, d_A_d_params) = derivatives.get_magnification_and_d_A_d_params(parameters)
+        return (self._magnification, d_A_d_params)
+
 
 class _FiniteSource(object):
     """
@@ -412,48 +855,85 @@ class BinaryLensQuadrupoleMagnification(BinaryLensPointSourceMagnification, _Lim
         self._set_LD_coeffs(u_limb_darkening=u_limb_darkening, gamma=gamma, default_gamma=0.)
         self._set_and_check_rho()
 
-        self._point_source_magnification = None
-        self._quadupole_magnification = None
-
-    def _get_magnification_w_plus(self, radius, x, y, separation):
-        """Evaluates Gould (2008) eq. 7"""
-        dx = [1., 0., -1., 0.]
-        dy = [0., 1., 0., -1.]
-        out = []
-        for (dx_, dy_) in zip(dx, dy):
-            xx = x + dx_ * radius
-            yy = y + dy_ * radius
-            out.append(self._get_1_magnification_point_source(x=xx, y=yy, separation=separation))
-
-        return 0.25 * fsum(out) - self._point_source_magnification
+        self._point_source_vectorized = None
 
-    def _get_1_magnification(self, x, y, separation):
+    def get_magnification(self):
         """
         Calculate the magnification
 
+        Point source magnifications at all points of the stencil and for all
+        epochs are calculated using vectorized solver, see
+        :py:class:`BinaryLensPointSourceVectorizedMagnification`.
+
         Parameters : None
 
         Returns :
-            magnification: *float* or *np.ndarray*
-                The magnification for each point
-                specified by `u` in :py:attr:`~trajectory`.
+            magnification: *np.ndarray*
+                The magnification for each point in :py:attr:`~trajectory`.
+        """
+        x = np.atleast_1d(np.asarray(self._source_x, dtype=float))
+        y = np.atleast_1d(np.asarray(self._source_y, dtype=float))
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+
+        (a_center, a_stencil) = self._get_stencil_magnifications(x, y, separations)
+        self._magnification = self._get_magnification_from_stencil(a_center, a_stencil)
+        return self._magnification
+
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Derivatives of magnification are not implemented for finite-source binary-lens models.
+        """
+        raise NotImplementedError(
+            "Derivatives of magnification are not implemented for " + self.__class__.__name__)
+
+    def _get_stencil_shifts(self):
+        """
+        Shifts of source position (complex) relative to the center:
+        4 points at half of the radius and 4 points at the radius.
+        """
+        plus = np.array([1., 1.j, -1., -1.j])
+        return np.concatenate([0.5 * self._rho * plus, self._rho * plus])
+
+    def _get_stencil_magnifications(self, x, y, separations):
+        """
+        Calculate point source magnifications at the center and at
+        the stencil points for all epochs. The stencil points are solved
+        in a single call with the roots for the center as initial guesses.
+
+        Returns :
+            a_center: *np.ndarray* (N,)
+                Magnification at the center.
+
+            a_stencil: *np.ndarray* (N, K)
+                Magnifications at the stencil points.
         """
-        # In this function, variables named self._a_* depict magnification.
-        separation = float(separation)
-        x = float(x)
-        y = float(y)
-        self._point_source_magnification = self._get_1_magnification_point_source(x=x, y=y, separation=separation)
-        self._a_rho_half_plus = self._get_magnification_w_plus(radius=0.5 * self._rho, x=x, y=y, separation=separation)
-        self._a_rho_plus = self._get_magnification_w_plus(radius=self._rho, x=x, y=y, separation=separation)
+        if self._point_source_vectorized is None:
+            self._point_source_vectorized = BinaryLensPointSourceVectorizedMagnification(trajectory=self.trajectory)
+        point_source = self._point_source_vectorized
 
-        # This is Gould 2008 eq. 9:
-        self._a_2_rho_square = (16. * self._a_rho_half_plus - self._a_rho_plus) / 3.
+        (a_center, roots) = point_source._get_magnification_vectorized(x, y, separations, return_roots=True)
 
-        # Gould 2008 eq. 6 (part 1/2):
-        self._quadrupole_magnification = (
-            self._point_source_magnification + self._a_2_rho_square * (1. - 0.2 * self._gamma))
+        shifts = self._get_stencil_shifts()
+        n_shifts = len(shifts)
+        a_stencil = point_source._get_magnification_vectorized(
+            (x[:, np.newaxis] + shifts.real).flatten(), (y[:, np.newaxis] + shifts.imag).flatten(),
+            np.repeat(separations, n_shifts), initial_roots=np.repeat(roots, n_shifts, axis=0))
 
-        return self._quadrupole_magnification
+        return (a_center, a_stencil.reshape(len(x), n_shifts))
+
+    def _get_magnification_from_stencil(self, a_center, a_stencil):
+        """
+        Combine magnifications from :py:func:`_get_stencil_magnifications()`
+        into quadrupole approximation, Gould 2008 eqs. 6 and 9.
+        """
+        a_2_rho_square = self._get_a_2_rho_square(a_center, a_stencil)
+        return a_center + 0.5 * a_2_rho_square * (1. - 0.2 * self._gamma)
+
+    def _get_a_2_rho_square(self, a_center, a_stencil):
+        """Evaluates Gould (2008) eqs. 7 and 9 for all epochs"""
+        a_rho_half_plus = np.mean(a_stencil[:, 0:4], axis=1) - a_center
+        a_rho_plus = np.mean(a_stencil[:, 4:8], axis=1) - a_center
+        return (16. * a_rho_half_plus - a_rho_plus) / 3.
 
 
 class BinaryLensHexadecapoleMagnification(BinaryLensQuadrupoleMagnification):
@@ -480,48 +960,92 @@ class BinaryLensHexadecapoleMagnification(BinaryLensQuadrupoleMagnification):
         super().__init__(**kwargs)
         self._all_approximations = all_approximations
 
-    def _get_1_magnification(self, x, y, separation):
+    def _get_stencil_shifts(self):
         """
-        Calculate the magnification
-
-        Returns :
-            magnification: *float* or *sequence* of three *floats*
-                Hexadecapole approximation (*float*) by default.
-                If :py:attr:`all_approximations` is *True*, returns
-                hexadecapole, quadrupole, and point source approximations
-                (*sequence* of three *floats*)
+        Shifts of source position (complex) relative to the center:
+        the quadrupole ones and 4 diagonal points at the radius.
         """
-        # In this function, variables named a_* depict magnification.
-        a_quadrupole = super()._get_1_magnification(x=x, y=y, separation=separation)
+        times = self._rho * np.exp(0.25j * np.pi * np.array([1., 3., 5., 7.]))
+        return np.concatenate([super()._get_stencil_shifts(), times])
 
-        a_rho_times = self._get_magnification_w_times(x=x, y=y, separation=separation)
+    def _get_magnification_from_stencil(self, a_center, a_stencil):
+        """
+        Combine magnifications from :py:func:`_get_stencil_magnifications()`
+        into hexadecapole approximation, Gould 2008 eqs. 6 and 9.
+        If :py:attr:`all_approximations` is *True*, then the returned
+        array has shape (N, 3) and includes hexadecapole, quadrupole,
+        and point source approximations.
+        """
+        a_quadrupole = super()._get_magnification_from_stencil(a_center, a_stencil)
 
-        # This is Gould (2008) eq. 9:
-        a_4_rho_power4 = 0.5 * (self._a_rho_plus + a_rho_times) - self._a_2_rho_square
-        # This is Gould (2008) eq. 6 (part 2/2):
-        a_add = a_4_rho_power4 * (1. - 11. * self._gamma / 35.)
-        a_hexadecapole = a_quadrupole + a_add
+        a_rho_plus = np.mean(a_stencil[:, 4:8], axis=1) - a_center
+        a_rho_times = np.mean(a_stencil[:, 8:12], axis=1) - a_center
+        a_2_rho_square = self._get_a_2_rho_square(a_center, a_stencil)
+        a_4_rho_power4 = 0.5 * (a_rho_plus + a_rho_times) - a_2_rho_square
+        a_hexadecapole = a_quadrupole + a_4_rho_power4 * (1. - 11. * self._gamma / 35.) / 3.
 
         if self._all_approximations:
-            return (a_hexadecapole, self._quadrupole_magnification, self._point_source_magnification)
+            return np.array([a_hexadecapole, a_quadrupole, a_center]).T
         else:
             return a_hexadecapole
 
-    def _get_magnification_w_times(self, x, y, separation):
-        """Evaluates Gould (2008) eq. 8"""
-        shift = self._rho / sqrt(2.)
-        dx = [1., -1., -1., 1.]
-        dy = [1., 1., -1., -1.]
-        out = []
-        for (dx_, dy_) in zip(dx, dy):
-            xx = x + dx_ * shift
-            yy = y + dy_ * shift
-            out.append(self._get_1_magnification_point_source(x=float(xx), y=float(yy), separation=separation))
 
-        return 0.25 * fsum(out) - self._point_source_magnification
+class _MultiThreadedMagnification(object):
+    """
+    Abstract class for finite-source methods that call compiled code, which
+    releases the GIL. The epochs are split into *n_threads* chunks
+    that are evaluated concurrently.
+    """
+    def _set_n_threads(self, n_threads):
+        """
+        Check and set the number of threads.
+        """
+        if int(n_threads) != n_threads or n_threads < 1:
+            raise ValueError('n_threads has to be a positive integer, got: {:}'.format(n_threads))
 
+        self._n_threads = int(n_threads)
 
-class BinaryLensVBBLMagnification(_BinaryLensPointSourceMagnification, _LimbDarkeningForMagnification, _FiniteSource):
+    def get_magnification(self):
+        """
+        Calculate the magnification
+
+        Parameters : None
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each point in :py:attr:`~trajectory`.
+        """
+        x = np.atleast_1d(self._source_x)
+        y = np.atleast_1d(self._source_y)
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+
+        self._magnification = self._get_magnification_threads(x, y, separations)
+        return self._magnification
+
+    def _get_magnification_threads(self, x, y, separations):
+        """
+        Calculate magnifications for arrays of positions and separations
+        using *n_threads* threads.
+        """
+        if self._n_threads == 1 or len(x) < 2:
+            return self._get_magnification_array(x, y, separations)
+
+        chunks = np.array_split(np.arange(len(x)), min(self._n_threads, len(x)))
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                lambda index: self._get_magnification_array(x[index], y[index], separations[index]), chunks)
+            return np.concatenate(list(results))
+
+    def _get_magnification_array(self, x, y, separations):
+        """
+        Calculate magnifications for arrays of positions and separations.
+        """
+        out = [self._get_1_magnification(x_, y_, separation) for (x_, y_, separation) in zip(x, y, separations)]
+        return np.array(out)
+
+
+class BinaryLensVBBLMagnification(_MultiThreadedMagnification, _BinaryLensPointSourceMagnification,
+                                  _LimbDarkeningForMagnification, _FiniteSource):
     """
     Binary lens finite source magnification calculated using VBBL
     library that implements advanced contour integration algorithm
@@ -550,12 +1074,18 @@ class BinaryLensVBBLMagnification(_BinaryLensPointSourceMagnification, _LimbDark
         accuracy: *float*, optional
             Requested accuracy of the result.
 
+        n_threads: *int*, optional
+            Number of threads used for calculations. The epochs are split
+            into *n_threads* chunks that are calculated concurrently.
+            Default is 1.
+
     """
 
-    def __init__(self, gamma=None, u_limb_darkening=None, accuracy=0.001, **kwargs):
+    def __init__(self, gamma=None, u_limb_darkening=None, accuracy=0.001, n_threads=1, **kwargs):
         super().__init__(**kwargs)
         self._set_LD_coeffs(u_limb_darkening=u_limb_darkening, gamma=gamma)
         self._set_and_check_rho()
+        self._set_n_threads(n_threads)
 
         if accuracy <= 0.:
             raise ValueError(
@@ -568,8 +1098,27 @@ class BinaryLensVBBLMagnification(_BinaryLensPointSourceMagnification, _LimbDark
 
         if self._u_limb_darkening is None:
             self._vbbl_function = _vbbl_binary_mag_finite
+            self._vbbl_function_array = _vbbl_binary_mag_finite_array
         else:
             self._vbbl_function = _vbbl_binary_mag_dark
+            self._vbbl_function_array = _vbbl_binary_mag_dark_array
+
+    def _get_magnification_array(self, x, y, separations):
+        """
+        Calculate magnifications for arrays of positions and separations
+        using a single call of compiled VBBL function.
+        """
+        x = np.ascontiguousarray(x, dtype=float)
+        y = np.ascontiguousarray(y, dtype=float)
+        separations = np.ascontiguousarray(separations, dtype=float)
+        magnification = np.empty(len(x))
+
+        args = [separations, self._q, x, y, self._rho, self._accuracy]
+        if self._u_limb_darkening is not None:
+            args += [self._u_limb_darkening]
+
+        self._vbbl_function_array(*args, magnification)
+        return magnification
 
     def _get_1_magnification(self, x, y, separation):
         """
@@ -582,8 +1131,8 @@ class BinaryLensVBBLMagnification(_BinaryLensPointSourceMagnification, _LimbDark
         return self._vbbl_function(*args)
 
 
-class BinaryLensAdaptiveContouringMagnification(_BinaryLensPointSourceMagnification, _LimbDarkeningForMagnification,
-                                                _FiniteSource):
+class BinaryLensAdaptiveContouringMagnification(_MultiThreadedMagnification, _BinaryLensPointSourceMagnification,
+                                                _LimbDarkeningForMagnification, _FiniteSource):
     """
     Binary lens finite source magnification calculated using
     Adaptive Contouring method by `Dominik 2007 MNRAS, 377, 1679
@@ -628,12 +1177,18 @@ class BinaryLensAdaptiveContouringMagnification(_BinaryLensPointSourceMagnificat
             theorem."* It does not add execution time so can be
             set to very small value.
 
+        n_threads: *int*, optional
+            Number of threads used for calculations. The epochs are split
+            into *n_threads* chunks that are calculated concurrently.
+            Default is 1.
+
     """
 
-    def __init__(self, gamma=None, u_limb_darkening=None, accuracy=0.1, ld_accuracy=0.001, **kwargs):
+    def __init__(self, gamma=None, u_limb_darkening=None, accuracy=0.1, ld_accuracy=0.001, n_threads=1, **kwargs):
         super().__init__(**kwargs)
         self._set_LD_coeffs(u_limb_darkening=u_limb_darkening, gamma=gamma, default_gamma=0.)
         self._set_and_check_rho()
+        self._set_n_threads(n_threads)
 
         # Note that this accuracy is not guaranteed.
         if accuracy <= 0.:
@@ -662,3 +1217,139 @@ class BinaryLensAdaptiveContouringMagnification(_BinaryLensPointSourceMagnificat
         mirror in X (i.e., secondary mass has negative X) and mirror in Y.
         """
         return (-x, -y)
+
+
+class BinaryLensAdaptiveMagnification(BinaryLensHexadecapoleMagnification):
+    """
+    Binary lens finite source magnification that for each epoch selects
+    the cheapest sufficiently accurate method: point source, hexadecapole,
+    or contour integration (VBBL or Adaptive Contouring).
+
+    For each epoch, the hexadecapole, quadrupole, and point source
+    approximations are calculated
+    (see :py:class:`BinaryLensHexadecapoleMagnification`).
+    The contour integration is used if the source is closer to the caustic
+    than *caustic_distance* source radii or if hexadecapole and quadrupole
+    approximations differ by more than *tolerance* (relative).
+    Otherwise, the point source magnification is used if it differs from
+    hexadecapole by less than *tolerance* (relative), and the hexadecapole
+    is used for the remaining epochs.
+
+    For coordinate system convention see
+    :py:class:`BinaryLensQuadrupoleMagnification`
+
+    Arguments :
+        trajectory: :py:class:`~MulensModel.trajectory.Trajectory`
+            Including trajectory.parameters =
+            :py:class:`~MulensModel.modelparameters.ModelParameters`
+
+        gamma: *float*
+            Linear limb-darkening coefficient in gamma convention.
+
+        finite_source_method: *str*, optional
+            Method used close to the caustics: ``'VBBL'`` (default) or
+            ``'Adaptive_Contouring'``.
+
+        finite_source_kwargs: *dict*, optional
+            Parameters passed to the class that calculates
+            *finite_source_method*, e.g., ``{'accuracy': 0.005}``.
+
+        tolerance: *float*, optional
+            Relative accuracy required from the approximations.
+            Default is 0.001.
+
+        caustic_distance: *float*, optional
+            Minimum distance from the caustic (in units of the source
+            radius) for which the approximations are used. Default is 3.
+
+        n_caustic_points: *int*, optional
+            Number of points used to calculate the caustic.
+            Default is 2000.
+
+    Attributes :
+        methods: *np.ndarray* of *str*
+            The methods selected for each epoch. It is set by
+            :py:func:`get_magnification()`.
+    """
+
+    def __init__(self, finite_source_method='VBBL', finite_source_kwargs=None, tolerance=0.001,
+                 caustic_distance=3., n_caustic_points=2000, **kwargs):
+        super().__init__(all_approximations=True, **kwargs)
+
+        if tolerance <= 0.:
+            raise ValueError('tolerance has to be positive, got: {:}'.format(tolerance))
+        if caustic_distance < 0.:
+            raise ValueError('caustic_distance cannot be negative, got: {:}'.format(caustic_distance))
+        self._tolerance = float(tolerance)
+        self._caustic_distance = float(caustic_distance)
+        self._n_caustic_points = int(n_caustic_points)
+
+        classes = {'vbbl': BinaryLensVBBLMagnification,
+                   'adaptive_contouring': BinaryLensAdaptiveContouringMagnification}
+        if finite_source_method.lower() not in classes:
+            raise ValueError('Unknown finite_source_method: {:}'.format(finite_source_method))
+        if finite_source_kwargs is None:
+            finite_source_kwargs = {}
+        self._finite_source_method = finite_source_method
+        self._finite_source_magnification = classes[finite_source_method.lower()](
+            trajectory=self.trajectory, gamma=self._gamma, **finite_source_kwargs)
+
+        self.methods = None
+
+    def get_magnification(self):
+        """
+        Calculate the magnification
+
+        Parameters : None
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each point in :py:attr:`~trajectory`.
+        """
+        approximations = np.atleast_2d(super().get_magnification())
+        (hexadecapole, quadrupole, point_source) = approximations.T
+        x = np.atleast_1d(self._source_x)
+        y = np.atleast_1d(self._source_y)
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+
+        limit = self._tolerance * hexadecapole
+        finite = (np.abs(hexadecapole - quadrupole) > limit)
+        close = (self._get_caustic_distances(x, y, separations) < self._caustic_distance * self._rho)
+        finite |= close
+        point = ~finite & (np.abs(hexadecapole - point_source) <= limit)
+
+        self.methods = np.full(len(x), 'hexadecapole', dtype=object)
+        self.methods[point] = 'point_source'
+        self.methods[finite] = self._finite_source_method
+
+        magnification = hexadecapole.copy()
+        magnification[point] = point_source[point]
+        if np.any(finite):
+            magnification[finite] = self._finite_source_magnification._get_magnification_threads(
+                x[finite], y[finite], separations[finite])
+
+        self._magnification = magnification
+        return self._magnification
+
+    def _get_caustic_distances(self, x, y, separations):
+        """
+        Calculate distance between source and the nearest point on
+        the caustic. For each point, the spacing of the caustic points is
+        subtracted, so that the distance is not overestimated.
+        If separation changes, then the caustics are calculated on a grid
+        of separations with a step of a quarter of the source radius.
+        """
+        distances = np.empty(len(x))
+        keys = np.round(separations / (0.25 * self._rho))
+        (unique, inverse) = np.unique(keys, return_inverse=True)
+        inverse = inverse.reshape(len(x))
+        for (i, key) in enumerate(unique):
+            mask = (inverse == i)
+            caustics = CausticsBinary(q=self._q, s=float(np.mean(separations[mask])))
+            points = np.array(caustics.get_caustics(n_points=self._n_caustic_points, adaptive=True)).T
+            tree = cKDTree(points)
+            spacing = tree.query(points, k=2)[0][:, 1]
+            (distance, index) = tree.query(np.array([x[mask], y[mask]]).T)
+            distances[mask] = distance - spacing[index]
+
+        return distances
@@ -49,7 +49,7 @@ def _import_compiled_VBBL():
         _get_path_2('VBBL', "VBBinaryLensingLibrary_wrapper.so"), "VBBL")
     _vbbl_wrapped = (vbbl is not None)
     if not _vbbl_wrapped:
-        return (_vbbl_wrapped, None, None, None, None, None, None)
+        return (_vbbl_wrapped, None, None, None, None, None, None, None, None, None, None)
 
     def _set_in_out(function, n_double):
         """set input to n_double doubles and output to double"""
@@ -61,6 +61,24 @@ def _import_compiled_VBBL():
     _set_in_out(vbbl.VBBinaryLensing_BinaryMagPoint, 4)
     _set_in_out(vbbl.VBBinaryLensing_BinaryMagPointShear, 7)
 
+    array = np.ctypeslib.ndpointer(dtype=ctypes.c_double, flags='C_CONTIGUOUS')
+    vbbl.VBBinaryLensing_BinaryMagDarkArray.argtypes = [
+        array, ctypes.c_double, array, array, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, array]
+    vbbl.VBBinaryLensing_BinaryMagDarkArray.restype = None
+    vbbl.VBBinaryLensing_BinaryMagFiniteArray.argtypes = [
+        array, ctypes.c_double, array, array, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, array]
+    vbbl.VBBinaryLensing_BinaryMagFiniteArray.restype = None
+
+    def _binary_mag_dark_array(s, q, y1, y2, rho, tolerance, a1, out):
+        """use ctypes version with the same signature as in compiled module"""
+        vbbl.VBBinaryLensing_BinaryMagDarkArray(s, q, y1, y2, rho, tolerance, a1, len(out), out)
+
+    def _binary_mag_finite_array(s, q, y1, y2, rho, tolerance, out):
+        """use ctypes version with the same signature as in compiled module"""
+        vbbl.VBBinaryLensing_BinaryMagFiniteArray(s, q, y1, y2, rho, tolerance, len(out), out)
+
     vbbl.VBBL_SG12_5.argtypes = 12 * [ctypes.c_double]
     vbbl.VBBL_SG12_5.restype = np.ctypeslib.ndpointer(
         dtype=ctypes.c_double, shape=(10,))
@@ -69,12 +87,27 @@ def _import_compiled_VBBL():
     vbbl.VBBL_SG12_9.restype = np.ctypeslib.ndpointer(
         dtype=ctypes.c_double, shape=(18,))
 
+    vbbl.VBBL_SG12_9Array.argtypes = [array, ctypes.c_int, array]
+    vbbl.VBBL_SG12_9Array.restype = None
+
+    def _SG12_9_array(polynomials, roots):
+        """use ctypes version with the same signature as in compiled module"""
+        vbbl.VBBL_SG12_9Array(polynomials, len(roots) // 18, roots)
+
+    vbbl.VBBL_SG12WarmStart.argtypes = [array, ctypes.c_int, array]
+    vbbl.VBBL_SG12WarmStart.restype = None
+
+    def _SG12_warm_start(polynomial, roots):
+        """use ctypes version with the same signature as in compiled module"""
+        vbbl.VBBL_SG12WarmStart(polynomial, len(roots) // 2, roots)
+
     return (_vbbl_wrapped,
             vbbl.VBBinaryLensing_BinaryMagDark,
             vbbl.VBBinaryLensing_BinaryMagFinite,
             vbbl.VBBinaryLensing_BinaryMagPoint,
             vbbl.VBBinaryLensing_BinaryMagPointShear,
-            vbbl.VBBL_SG12_5, vbbl.VBBL_SG12_9)
+            vbbl.VBBL_SG12_5, vbbl.VBBL_SG12_9,
+            _binary_mag_dark_array, _binary_mag_finite_array, _SG12_9_array, _SG12_warm_start)
 
 
 def _import_compiled_AdaptiveContouring():
@@ -99,6 +132,10 @@ if _vbbl_wrapped:
     _vbbl_binary_mag_point_shear = mm_vbbl.VBBinaryLensing_BinaryMagPointShear
     _vbbl_SG12_5 = mm_vbbl.VBBL_SG12_5
     _vbbl_SG12_9 = mm_vbbl.VBBL_SG12_9
+    _vbbl_binary_mag_dark_array = mm_vbbl.VBBinaryLensing_BinaryMagDarkArray
+    _vbbl_binary_mag_finite_array = mm_vbbl.VBBinaryLensing_BinaryMagFiniteArray
+    _vbbl_SG12_9_array = mm_vbbl.VBBL_SG12_9Array
+    _vbbl_SG12_warm_start = mm_vbbl.VBBL_SG12WarmStart
 else:
     out = _import_compiled_VBBL()
     _vbbl_wrapped = out[0]
@@ -108,6 +145,10 @@ else:
     _vbbl_binary_mag_point_shear = out[4]
     _vbbl_SG12_5 = out[5]
     _vbbl_SG12_9 = out[6]
+    _vbbl_binary_mag_dark_array = out[7]
+    _vbbl_binary_mag_finite_array = out[8]
+    _vbbl_SG12_9_array = out[9]
+    _vbbl_SG12_warm_start = out[10]
 
 
 if not _vbbl_wrapped:
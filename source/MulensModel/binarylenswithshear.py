@@ -4,7 +4,7 @@ from math import sqrt
 
 from MulensModel.binarylens import BinaryLensPointSourceWM95Magnification
 from MulensModel.binarylensimports import (
-    _vbbl_wrapped, _vbbl_binary_mag_point_shear, _vbbl_SG12_9)
+    _vbbl_wrapped, _vbbl_binary_mag_point_shear, _vbbl_SG12_9, _vbbl_SG12_9_array)
 from MulensModel.utils import Utils
 from MulensModel.version import __version__ as mm_version
 
@@ -53,8 +53,25 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
         self.convergence_K = float(convergence_K)
         self.shear_G = float(shear_G.real) + float(shear_G.imag) * 1.j
 
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Derivatives of magnification are not implemented for models with external mass sheet.
+        """
+        raise NotImplementedError(
+            "Derivatives of magnification are not implemented for " + self.__class__.__name__)
+
     def _get_polynomial(self):
         """calculate coefficients of the polynomial in planet frame"""
+        coeffs_list = self._get_polynomial_coeffs(self._zeta, self._position_z1, Utils.complex_fsum)
+        return np.array(coeffs_list).reshape(10)
+
+    def _get_polynomial_coeffs(self, zeta, z1, c_sum):
+        """
+        Calculate coefficients of the polynomial in planet frame.
+        Source positions *zeta* and primary positions *z1* can be *complex*
+        or *np.ndarray*. Terms of each coefficient are added using *c_sum*.
+        Returns *list* of coefficients from the lowest to the highest power.
+        """
         total_m = self._total_mass
         total_m_pow2 = total_m * total_m
         total_m_pow3 = total_m * total_m_pow2
@@ -63,7 +80,6 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
         m_diff_pow2 = m_diff * m_diff
         m_diff_pow3 = m_diff * m_diff_pow2
 
-        zeta = self._zeta
         zeta_conj = zeta.conjugate()
         zeta_conj_pow2 = zeta_conj * zeta_conj
         zeta_conj_pow3 = zeta_conj * zeta_conj_pow2
@@ -78,9 +94,6 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
         Gc_pow2 = Gc * Gc
         Gc_pow3 = Gc * Gc_pow2
 
-        c_sum = Utils.complex_fsum
-
-        z1 = self._position_z1
         z1_pow2 = z1 * z1
         z1_pow3 = z1_pow2 * z1
         z1_pow4 = z1_pow2 * z1_pow2
@@ -344,14 +357,13 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
              shear_G * m_diff, 3 * total_m * z1_pow3 * shear_G * m_diff_pow2,
              z1_pow3 * shear_G * m_diff_pow3])
 
-        coeffs_list = [coeff_0, coeff_1, coeff_2, coeff_3, coeff_4, coeff_5,
-                       coeff_6, coeff_7, coeff_8, coeff_9]
-        return np.array(coeffs_list).reshape(10)
+        return [coeff_0, coeff_1, coeff_2, coeff_3, coeff_4, coeff_5,
+                coeff_6, coeff_7, coeff_8, coeff_9]
 
     def _get_polynomial_roots(self):
         """roots of the polynomial"""
         polynomial_input = [self._mass_1, self._mass_2, self._position_z1.real,
-                            self.convergence_K, self.shear_G, self._source_x, self._source_y]
+                            self.convergence_K, self.shear_G, self._zeta]
 
         if polynomial_input == self._last_polynomial_input:
             return self._polynomial_roots
@@ -362,9 +374,11 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
         if self._solver == 'numpy':
             self._polynomial_roots = np_polyroots(polynomial)
         elif self._solver == 'Skowron_and_Gould_12':
-            args = polynomial.real.tolist() + polynomial.imag.tolist()
             try:
-                out = _vbbl_SG12_9(*args)
+                if self._warm_start:
+                    out = self._get_polynomial_roots_warm_start(polynomial)
+                else:
+                    out = _vbbl_SG12_9(*(polynomial.real.tolist() + polynomial.imag.tolist()))
             except ValueError as err:
                 err2 = "\n\nSwitching from Skowron & Gould 2012 to numpy"
                 warnings.warn(str(err) + err2, UserWarning)
@@ -452,6 +466,131 @@ class BinaryLensPointSourceWithShearWM95Magnification(BinaryLensPointSourceWM95M
         return (1. - self.convergence_K)**2 - derivative * np.conjugate(derivative)
 
 
+class BinaryLensPointSourceWithShearVectorizedMagnification(BinaryLensPointSourceWithShearWM95Magnification):
+    """
+    The binary lens with shear and convergence: point-source magnification
+    calculated for all epochs at once. The coefficients of 9th order
+    polynomials are calculated as (N, 10) array and all polynomials are
+    solved in a single call: the array version of Skowron & Gould (2012)
+    solver from VBBL is used or
+    :py:func:`~MulensModel.utils.Utils.polynomial_roots_vectorized()`
+    if VBBL is not available. The roots are verified using array
+    operations.
+
+    For epochs without any verified root, the calculation is repeated using
+    :py:class:`BinaryLensPointSourceWithShearWM95Magnification` approach,
+    i.e., one epoch at a time.
+
+    Arguments :
+        trajectory: :py:class:`~MulensModel.trajectory.Trajectory`
+            Including trajectory.parameters =
+            :py:class:`~MulensModel.modelparameters.ModelParameters`
+
+        convergence_K: *float*
+            External mass sheet convergence.
+
+        shear_G: *complex*
+            External mass sheat shear.
+
+    If you're using this class, then please cite
+    Peirson et al. (2022; ApJ 927, 24).
+    """
+
+    def get_magnification(self):
+        """
+        Calculate the magnification
+
+        Parameters : None
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each point in :py:attr:`~trajectory`.
+        """
+        x = np.atleast_1d(self._source_x)
+        y = np.atleast_1d(self._source_y)
+        separations = np.atleast_1d(self._separations) * np.ones(len(x))
+
+        (x_planet, y_planet) = self._change_frame(x, y, separations)
+        zeta = x_planet + y_planet * 1.j
+        z1 = -separations + 0.j
+
+        roots = self._get_polynomial_roots_vectorized(zeta, z1)
+        roots_ok = self._verify_polynomial_roots_vectorized(roots, zeta, z1)
+
+        roots_bar = np.conjugate(roots)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            derivative = (self._mass_1 / (z1[:, np.newaxis] - roots_bar)**2 +
+                          self._mass_2 / (self._position_z2 - roots_bar)**2 - self.shear_G)
+            jacobian_determinant = (1. - self.convergence_K)**2 - (derivative * np.conjugate(derivative)).real
+            magnification = np.sum(np.abs(1. / jacobian_determinant), axis=1, where=roots_ok)
+
+        for index in np.where(np.logical_not(np.any(roots_ok, axis=1)))[0]:
+            magnification[index] = self._get_1_magnification_point_source(
+                float(x[index]), float(y[index]), float(separations[index]))
+
+        self._magnification = magnification
+        return self._magnification
+
+    def _get_polynomials_vectorized(self, zeta, z1):
+        """
+        Calculate coefficients of the polynomials in planet frame for
+        all epochs. Returns (N, 10) array with coefficients from the lowest
+        to the highest power.
+        """
+        coeffs_list = self._get_polynomial_coeffs(zeta, z1, sum)
+
+        coeffs = np.empty((len(zeta), 10), dtype=complex)
+        for (i, coeff) in enumerate(coeffs_list):
+            coeffs[:, i] = coeff
+
+        return coeffs
+
+    def _get_polynomial_roots_vectorized(self, zeta, z1):
+        """
+        Find roots of polynomials for all epochs. Roots that are at
+        the positions of lenses are replaced by *np.nan*.
+        """
+        polynomials = self._get_polynomials_vectorized(zeta, z1)
+
+        if self._solver == 'Skowron_and_Gould_12':
+            input_ = np.ascontiguousarray(np.concatenate((polynomials.real, polynomials.imag), axis=1))
+            out = np.empty((len(zeta), 18))
+            _vbbl_SG12_9_array(input_, out)
+            roots = out[:, :9] + out[:, 9:] * 1.j
+        elif self._solver == 'numpy':
+            roots = Utils.polynomial_roots_vectorized(polynomials)
+        else:
+            raise ValueError('Unknown solver: {:}'.format(self._solver))
+
+        at_lens_1 = (np.abs(roots.real - z1.real[:, np.newaxis]) <= 1e-10) & (np.abs(roots.imag) <= 1e-10)
+        at_lens_2 = (np.abs(roots.real) <= 1e-10) & (np.abs(roots.imag) <= 1e-10)
+        roots[at_lens_1 | at_lens_2] = np.nan
+
+        return roots
+
+    def _verify_polynomial_roots_vectorized(self, roots, zeta, z1):
+        """
+        Verify roots of polynomials i.e. find roots of lens equation.
+        This is the vectorized version of
+        :py:func:`~BinaryLensPointSourceWithShearWM95Magnification._verify_polynomial_roots()`.
+
+        Returns :
+            roots_ok: *np.ndarray* (N, 9) of *bool*
+                Which roots are verified, i.e., are roots of lens equation.
+        """
+        roots_conj = np.conjugate(roots)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            solutions = (zeta[:, np.newaxis] + self.shear_G * roots_conj +
+                         self._mass_1 / (roots_conj - z1[:, np.newaxis]) +
+                         self._mass_2 / (roots_conj - self._position_z2)) / (1 - self.convergence_K)
+            distances = np.abs(solutions[:, np.newaxis, :] - roots[:, :, np.newaxis])**2
+
+        distances[np.isnan(distances)] = np.inf
+        min_distance_arg = np.argmin(distances, axis=2)
+
+        return (min_distance_arg == np.arange(roots.shape[1])) & np.isfinite(roots)
+
+
 class BinaryLensPointSourceWithShearWM95PlanetFrameMagnification(BinaryLensPointSourceWithShearWM95Magnification):
     """
     *NOT IMPLEMENTED*
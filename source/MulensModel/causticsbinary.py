@@ -1,5 +1,4 @@
 import numpy as np
-from math import cos, sin
 import matplotlib.pyplot as plt
 
 from MulensModel.utils import Utils
@@ -33,8 +32,9 @@ class CausticsBinary(object):
         self._x = None
         self._y = None
         self._critical_curve = None
+        self._adaptive = False
 
-    def plot(self, n_points=5000, **kwargs):
+    def plot(self, n_points=5000, adaptive=False, **kwargs):
         """
         Plots the caustics using :py:func:`matplotlib.pyplot.scatter()`.
 
@@ -43,6 +43,14 @@ class CausticsBinary(object):
                 The number of points to calculate along the caustic.
                 Defaults to 5000.
 
+            adaptive: *bool*, optional
+                If *True*, then half of the points is distributed evenly
+                in the change of the caustic direction, hence, more points
+                are put near cusps and the folds are still sampled.
+                Defaults to *False*, i.e., the points are uniform in
+                the angle used in the critical curve equation.
+                Implemented only for :py:class:`CausticsBinary`.
+
             ``**kwargs``:
                 keywords accepted by :py:func:`matplotlib.pyplot.scatter()`
 
@@ -54,8 +62,8 @@ class CausticsBinary(object):
         """
         if "linewidths" not in kwargs and "lw" not in kwargs:
             kwargs["lw"] = 0.
-        if self._x is None or len(self._x) != n_points:
-            self._calculate(n_points=n_points)
+        if self._x is None or len(self._x) != n_points or self._adaptive != adaptive:
+            self._calculate(n_points=n_points, adaptive=adaptive)
 
         try:
             plt.scatter(self._x, self._y, **kwargs)
@@ -64,7 +72,7 @@ class CausticsBinary(object):
             print(kwargs)
             raise
 
-    def get_caustics(self, n_points=5000):
+    def get_caustics(self, n_points=5000, adaptive=False):
         """
         Returns x and y vectors corresponding to the outlines of the
         caustics.  Origin is center of mass and larger mass is on the
@@ -74,13 +82,16 @@ class CausticsBinary(object):
             n_points : *int*, optional
                 The number of points to calculate along the caustic.
 
+            adaptive: *bool*, optional
+                Concentrate points near cusps. See :py:func:`plot()`.
+
         Returns:
-            x, y : *list*
-                Two lists of length *n_points* giving the *x*, *y*
+            x, y : *np.ndarray*
+                Two arrays of length *n_points* giving the *x*, *y*
                 coordinates of the caustic points.
         """
-        if self._x is None or self._y is None:
-            self._calculate(n_points=n_points)
+        if self._x is None or self._y is None or self._adaptive != adaptive:
+            self._calculate(n_points=n_points, adaptive=adaptive)
         return (self._x, self._y)
 
     @property
@@ -92,7 +103,7 @@ class CausticsBinary(object):
             self._calculate()
         return self._critical_curve
 
-    def _calculate(self, n_points=5000):
+    def _calculate(self, n_points=5000, adaptive=False):
         """
         Solve the caustics polynomial to calculate the critical curve
         and caustic structure.
@@ -103,39 +114,84 @@ class CausticsBinary(object):
         # Find number of angles so that 4*n_angles is the multiple of 4 that
         # is closest to n_points.
         n_angles = int(n_points/4.+.5)
-
-        # Initialize variables
-        self._x = []
-        self._y = []
-        self._critical_curve = self.CriticalCurve()
+        phi = np.linspace(0., 2.*np.pi, n_angles, endpoint=False)
+        if adaptive:
+            phi = self._get_adaptive_phi(phi)
 
         # Distance between primary mass and center of mass
         xcm_offset = self.q * self.s / (1. + self.q)
 
-        # Solve for the critical curve (and caustic) in complex coordinates.
-        for phi in np.linspace(0., 2.*np.pi, n_angles, endpoint=False):
-            # Change the angle to a complex number
-            eiphi = complex(cos(phi), sin(phi))
-
-            # Coefficients of Eq. 6
-            coeff_4 = 1.
-            coeff_3 = -2. * self.s
-            coeff_2 = Utils.complex_fsum([self.s**2, -eiphi])
-            coeff_1 = eiphi * (2. * self.s / (1. + self.q))  # The additional
-            # parenthesis make it more stable numerically.
-            coeff_0 = -self.s**2 * eiphi / (1. + self.q)
-
-            # Find roots
-            coeff_list = [coeff_0, coeff_1, coeff_2, coeff_3, coeff_4]
-            roots = np.polynomial.polynomial.polyroots(coeff_list)
-            # Store results
-            for root in roots:
-                self._critical_curve.x.append(root.real - xcm_offset)
-                self._critical_curve.y.append(root.imag)
-
-                source_plane_position = self._solve_lens_equation(root)
-                self._x.append(source_plane_position.real - xcm_offset)
-                self._y.append(source_plane_position.imag)
+        roots = self._get_critical_curve_roots(phi)
+        self._set_curves(roots, -xcm_offset)
+        self._adaptive = adaptive
+
+    def _get_critical_curve_roots(self, phi):
+        """
+        Solve Eq. 6 from Cassan 2008 for all angles at once.
+        Returns array of shape (len(phi), 4). For each angle the roots are
+        sorted the same way as in *np.polynomial.polynomial.polyroots()*.
+        """
+        eiphi = np.exp(1j * phi)
+
+        coeffs = np.empty((len(phi), 5), dtype=np.complex128)
+        coeffs[:, 4] = 1.
+        coeffs[:, 3] = -2. * self.s
+        coeffs[:, 2] = self.s**2 - eiphi
+        coeffs[:, 1] = eiphi * (2. * self.s / (1. + self.q))  # The additional
+        # parenthesis make it more stable numerically.
+        coeffs[:, 0] = -self.s**2 * eiphi / (1. + self.q)
+
+        roots = Utils.polynomial_roots_vectorized(coeffs)
+        roots.sort(axis=1)
+        return roots
+
+    def _set_curves(self, roots, shift_x, shift_y=0.):
+        """
+        Set critical curve and caustic based on roots of critical curve
+        equation. The caustic is additionally shifted in y by *shift_y*.
+        """
+        roots = roots.flatten()
+        self._critical_curve = self.CriticalCurve()
+        self._critical_curve.x = roots.real + shift_x
+        self._critical_curve.y = roots.imag
+
+        source_plane_position = self._solve_lens_equation(roots)
+        self._x = source_plane_position.real + shift_x
+        self._y = source_plane_position.imag + shift_y
+
+    def _get_adaptive_phi(self, phi):
+        """
+        Find new values of angles so that half of the points is uniform in
+        angle and the other half is uniform in the change of the caustic
+        tangent direction. The latter is concentrated near cusps, where
+        the direction changes by 180 deg. The change of direction is summed
+        over all 4 roots and calculated analytically on a grid of input
+        angles.
+        """
+        roots = self._get_critical_curve_roots(phi)
+        eiphi = np.exp(1j * phi)[:, np.newaxis]
+
+        # We use the critical curve equation in the form g(z) = exp(-i phi),
+        # where g(z) = (1/z^2 + q/(z-s)^2) / (1+q).
+        (z_s, factor) = (roots - self.s, 1. / (1. + self.q))
+        g_1 = -2. * factor * (roots**-3 + self.q * z_s**-3)
+        g_2 = 6. * factor * (roots**-4 + self.q * z_s**-4)
+        dz = -1j / (eiphi * g_1)
+        d2z = -1j * dz - dz**2 * g_2 / g_1
+        dzeta = dz + eiphi * np.conjugate(dz)
+        d2zeta = d2z + eiphi * (1j * np.conjugate(dz) + np.conjugate(d2z))
+
+        d_phi = 2. * np.pi / len(phi)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            turn = np.abs((d2zeta * np.conjugate(dzeta)).imag) / np.abs(dzeta)**2 * d_phi
+        turn = np.where(np.isfinite(turn), np.minimum(turn, np.pi), np.pi)
+        turn = np.sum(turn, axis=1)
+
+        weights = 1. / len(phi) + turn / np.sum(turn)
+        cumulative = np.concatenate(([0.], np.cumsum(weights)))
+        nodes = np.concatenate((phi, [2. * np.pi]))
+        new = np.linspace(0., cumulative[-1], len(phi), endpoint=False)
+        return np.interp(new, cumulative, nodes)
 
     def _solve_lens_equation(self, complex_value):
         """
@@ -152,9 +208,9 @@ class CausticsBinary(object):
         larger mass on the left (*q* < 1).
 
         Attributes :
-            x, y : *list*
-                Two lists of length *n_points* giving the x, y
-                coordinates of the caustic points.
+            x, y : *np.ndarray*
+                Two arrays of length *n_points* giving the x, y
+                coordinates of the critical curve points.
 
         """
 
@@ -1,5 +1,4 @@
 import numpy as np
-from math import cos, sin
 
 from MulensModel.utils import Utils
 from MulensModel.causticsbinary import CausticsBinary
@@ -29,7 +28,7 @@ class CausticsBinaryWithShear(CausticsBinary):
         self.convergence_K = convergence_K
         self.shear_G = shear_G
 
-    def _calculate(self, n_points=5000):
+    def _calculate(self, n_points=5000, adaptive=False):
         """
         Solve the caustics polynomial to calculate the critical curve
         and caustic structure.
@@ -37,37 +36,31 @@ class CausticsBinaryWithShear(CausticsBinary):
         Based on Eq. 6 Cassan 2008 modified so origin is center of
         mass and larger mass is on the left. Uses complex coordinates.
         """
-        n_angles = int(n_points/4.+.5)
+        if adaptive:
+            raise NotImplementedError('Adaptive sampling of caustics is not implemented for shear.')
 
-        self._x = []
-        self._y = []
-        self._critical_curve = self.CriticalCurve()
+        n_angles = int(n_points/4.+.5)
+        phi = np.linspace(0., 2.*np.pi, n_angles, endpoint=False)
 
         # Distance between primary mass and center of mass
         xcm_offset = self.q * self.s / (1. + self.q)
 
-        for phi in np.linspace(0., 2.*np.pi, n_angles, endpoint=False):
-            e_iphi = self.shear_G.conjugate() + (
-                1-self.convergence_K) * complex(cos(phi), -sin(phi))
-
-            # Coefficients of Eq. 6
-            coeff_4 = 1.
-            coeff_3 = -2. * self.s
-            coeff_2 = Utils.complex_fsum([self.s**2, -1/e_iphi])
-            coeff_1 = 1. / e_iphi * (2. * self.s / (1. + self.q))  # The
-            # additional parenthesis make it more stable numerically.
-            coeff_0 = -self.s**2 * 1/e_iphi * 1 / (1. + self.q)
-
-            coeff_list = [coeff_0, coeff_1, coeff_2, coeff_3, coeff_4]
-            roots = np.polynomial.polynomial.polyroots(coeff_list)
-            shift = -xcm_offset + self.convergence_K + self.shear_G.real
-            for root in roots:
-                self._critical_curve.x.append(root.real + shift)
-                self._critical_curve.y.append(root.imag)
-
-                source_plane_position = self._solve_lens_equation(root)
-                self._x.append(source_plane_position.real + shift)
-                self._y.append(source_plane_position.imag + self.shear_G.imag)
+        e_iphi = self.shear_G.conjugate() + (1-self.convergence_K) * np.exp(-1j * phi)
+
+        # Coefficients of Eq. 6
+        coeffs = np.empty((n_angles, 5), dtype=np.complex128)
+        coeffs[:, 4] = 1.
+        coeffs[:, 3] = -2. * self.s
+        coeffs[:, 2] = self.s**2 - 1/e_iphi
+        coeffs[:, 1] = 1. / e_iphi * (2. * self.s / (1. + self.q))  # The
+        # additional parenthesis make it more stable numerically.
+        coeffs[:, 0] = -self.s**2 * 1/e_iphi * 1 / (1. + self.q)
+
+        roots = Utils.polynomial_roots_vectorized(coeffs)
+        roots.sort(axis=1)
+        shift = -xcm_offset + self.convergence_K + self.shear_G.real
+        self._set_curves(roots, shift, self.shear_G.imag)
+        self._adaptive = adaptive
 
     def _solve_lens_equation(self, complex_value):
         """
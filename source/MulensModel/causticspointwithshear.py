@@ -1,5 +1,4 @@
 import numpy as np
-from cmath import sqrt
 
 from MulensModel.causticsbinary import CausticsBinary
 
@@ -26,34 +25,28 @@ class CausticsPointWithShear(CausticsBinary):
         self._x = None
         self._y = None
         self._critical_curve = None
+        self._adaptive = False
 
-    def _calculate(self, n_points=5000):
+    def _calculate(self, n_points=5000, adaptive=False):
         """
         Solve the caustics polynomial to calculate the critical curve
         and caustic structure.
         """
+        if adaptive:
+            raise NotImplementedError('Adaptive sampling of caustics is not implemented for shear.')
+
         # Find number of angles so that 4*n_angles is the multiple of 4 that
         # is closest to n_points.
         n_angles = int(n_points / 4. + .5)
 
-        # Initialize variables
-        self._x = []
-        self._y = []
-        self._critical_curve = self.CriticalCurve()
-
         # Solve for the critical curve (and caustic) in complex coordinates.
         G_conjugate = self.shear_G.conjugate()
         phi = np.linspace(0., 2. * np.pi, n_angles, endpoint=False)
         eiphi = np.exp(1j * phi)
-        for eiphi_ in eiphi:
-            soln = sqrt(1. / ((1.-self.convergence_K) * eiphi_ + G_conjugate))
-            for root in [soln, -soln]:
-                self._critical_curve.x.append(root.real)
-                self._critical_curve.y.append(root.imag)
-
-                source_plane_position = self._solve_lens_equation(root)
-                self._x.append(source_plane_position.real)
-                self._y.append(source_plane_position.imag)
+        soln = np.sqrt(1. / ((1.-self.convergence_K) * eiphi + G_conjugate))
+        roots = np.stack((soln, -soln), axis=1)
+        self._set_curves(roots, 0.)
+        self._adaptive = adaptive
 
     def _solve_lens_equation(self, complex_value):
         """
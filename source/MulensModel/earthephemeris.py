@@ -0,0 +1,182 @@
+import os
+from hashlib import md5
+import numpy as np
+
+from astropy import units as u
+from astropy.coordinates import get_body_barycentric_posvel, solar_system_ephemeris
+from astropy.time import Time
+
+from MulensModel import utils
+
+
+class EarthEphemeris(object):
+    """
+    Tabulated barycentric positions of the Earth used for annual parallax
+    calculations.
+
+    Positions and velocities of the Earth are calculated using *Astropy*
+    on a dense grid of epochs (every :py:attr:`step` days) in blocks of
+    :py:attr:`block_length` steps and kept in memory. If
+    :py:attr:`cache_dir` is set, then each block is also saved there as
+    a .npy file and later read as a memory-mapped array, hence,
+    the *Astropy* calculations are done only once for a given ephemeris
+    and time range. Positions for requested epochs are found using cubic
+    Hermite interpolation, which gives accuracy better than 1e-9 AU.
+
+    There are no parameters of `__init__()`. In general, this class is not
+    directly used by a user.
+
+    Attributes :
+        cache_dir: *str* or *None*
+            If not *None*, then tables are also saved in this directory
+            and read from it in other processes. It defaults to
+            *MULENSMODEL_CACHE_DIR* environment variable or *None* if it
+            is not set. This is a class attribute, i.e., it is shared by
+            all instances.
+
+        step: *float*
+            Spacing of the table in days.
+
+        block_length: *int*
+            Number of steps in each block.
+    """
+    cache_dir = os.environ.get('MULENSMODEL_CACHE_DIR')
+    step = 1.
+    block_length = 1024
+    _blocks = dict()
+    _velocity_last = (None, None)
+
+    def get_position(self, times):
+        """
+        Calculate barycentric position of the Earth.
+
+        Parameters :
+            times: *np.ndarray*
+                Full BJD_TDB epochs.
+
+        Returns :
+            position: *np.ndarray* (*float*, size of (N, 3))
+                Barycentric position of the Earth in AU.
+                The frame follows *Astropy* conventions.
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        length = self.step * self.block_length
+        block_indexes = np.floor(times / length).astype(int)
+
+        out = np.empty((len(times), 3))
+        for index in np.unique(block_indexes):
+            mask = (block_indexes == index)
+            table = self._get_block(index)
+            out[mask] = self._interpolate(table, (times[mask] - index * length) / self.step)
+
+        return out
+
+    def get_velocity(self, time):
+        """
+        Calculate barycentric velocity of the Earth for a single epoch.
+        The last result is remembered, because the same reference epoch
+        is typically used many times.
+
+        Parameters :
+            time: *float*
+                Full BJD_TDB epoch.
+
+        Returns :
+            velocity: *np.ndarray* (*float*, size of (3,))
+                3D velocity in AU/d. The frame follows *Astropy* conventions.
+        """
+        if EarthEphemeris._velocity_last[0] != time:
+            velocity = utils.Utils.velocity_of_Earth(time) / 1731.45683
+            # We change units from km/s to AU/d.
+            EarthEphemeris._velocity_last = (time, velocity)
+
+        return EarthEphemeris._velocity_last[1]
+
+    def _interpolate(self, table, x):
+        """
+        Cubic Hermite interpolation of positions. Input *x* is time since
+        the start of the block in units of step.
+        """
+        k = np.clip(np.floor(x).astype(int), 0, self.block_length - 1)
+        x = (x - k)[:, np.newaxis]
+        x_2 = x * x
+        x_3 = x_2 * x
+
+        h_00 = 2. * x_3 - 3. * x_2 + 1.
+        h_10 = x_3 - 2. * x_2 + x
+        h_01 = 1. - h_00
+        h_11 = x_3 - x_2
+
+        out = h_00 * table[k, :3] + h_01 * table[k+1, :3]
+        out += (h_10 * table[k, 3:] + h_11 * table[k+1, 3:]) * self.step
+
+        return out
+
+    def _get_block(self, index):
+        """
+        Get table for given block: read it from memory, from file,
+        or calculate it.
+        """
+        key = (self._get_ephemeris_name(), self.step, self.block_length, index)
+        if key in EarthEphemeris._blocks:
+            return EarthEphemeris._blocks[key]
+
+        file_name = None
+        if self.cache_dir is not None:
+            file_name = os.path.join(self.cache_dir, "earth_{:}_{:}_{:}_{:}.npy".format(*key))
+
+        if file_name is not None and os.path.isfile(file_name):
+            table = np.load(file_name, mmap_mode='r')
+        else:
+            table = self._calculate_block(index)
+            if file_name is not None:
+                self._save_block(file_name, table)
+
+        EarthEphemeris._blocks[key] = table
+        return table
+
+    def _get_ephemeris_name(self):
+        """
+        Short name of the ephemeris currently used by *Astropy*.
+        """
+        name = solar_system_ephemeris.get()
+        if name.isalnum():
+            return name
+
+        return md5(name.encode()).hexdigest()
+
+    def _calculate_block(self, index):
+        """
+        Calculate positions and velocities of the Earth for given block.
+        """
+        start = index * self.step * self.block_length
+        times = start + self.step * np.arange(self.block_length + 1)
+        (position, velocity) = get_body_barycentric_posvel(
+            body='earth', time=Time(times, format='jd', scale='tdb'))
+        # Seems that get_body_barycentric depends on time system, but there is
+        # no way to set BJD part of BJD_TDB in astropy.Time(). The option
+        # *format* above indicates if the first argument of Time() is
+        # a float indicating JD or e.g., a string in the form
+        # '1999-01-01T00:00:00.123' - this would be value 'fits'.
+        # Hence, the user has to provide BJD times (or at least HJD).
+
+        table = np.empty((len(times), 6))
+        table[:, :3] = position.xyz.T.to(u.au).value
+        table[:, 3:] = velocity.xyz.T.to(u.au / u.day).value
+
+        return table
+
+    def _save_block(self, file_name, table):
+        """
+        Save the table. The file is first written under temporary name,
+        so that other processes never read an incomplete file.
+        If the directory cannot be written, then the table is not saved.
+        """
+        temporary = "{:}.{:}.tmp.npy".format(file_name[:-4], os.getpid())
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(temporary, table)
+            os.replace(temporary, file_name)
+        except OSError:
+            if os.path.isfile(temporary):
+                os.remove(temporary)
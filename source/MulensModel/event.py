@@ -93,9 +93,11 @@ class Event(object):
                 self._update_coords(coords=self._model.coords)
 
         self.sum_function = 'numpy.sum'
+        self.share_magnification = True
 
         # Properties related to FitData
         self._fits = None  # New property
+        self._fits_settings = None
         self.chi2 = None
         if fix_blend_flux is None:
             self.fix_blend_flux = {}
@@ -627,8 +629,9 @@ class Event(object):
         Parameters :
             parameters: *str* or *list*, required
                 Parameters with respect to which gradient is calculated.
-                Currently accepted parameters are: ``t_0``, ``u_0``, ``t_eff``,
-                ``t_E``, ``pi_E_N``, and ``pi_E_E``. The parameters for
+                See
+                :py:func:`~MulensModel.fitdata.FitData.get_chi2_gradient()`
+                for accepted parameters. The parameters for
                 which you request gradient must be defined in py:attr:`~model`.
 
         Returns :
@@ -649,8 +652,9 @@ class Event(object):
         Parameters :
             parameters: *str* or *list*, required
                 Parameters with respect to which gradient is calculated.
-                Currently accepted parameters are: ``t_0``, ``u_0``, ``t_eff``,
-                ``t_E``, ``pi_E_N``, and ``pi_E_E``. The parameters for
+                See
+                :py:func:`~MulensModel.fitdata.FitData.get_chi2_gradient()`
+                for accepted parameters. The parameters for
                 which you request gradient must be defined in py:attr:`~model`.
 
         Returns :
@@ -681,39 +685,235 @@ class Event(object):
 
         return self._chi2_gradient
 
+    def get_chi2_and_gradient(self, parameters):
+        """
+        Fit for fluxes and calculate chi^2 and its gradient in a single
+        pass. For each dataset, the magnification and its derivatives are
+        calculated together and the same magnification is used for fitting
+        the fluxes, see
+        :py:func:`~MulensModel.fitdata.FitData.get_chi2_and_gradient()`.
+        This is faster than calling :py:func:`~get_chi2()` and
+        :py:func:`~get_chi2_gradient()`, e.g., in gradient-based
+        minimization.
+
+        Parameters :
+            parameters: *str* or *list*, required
+                Parameters with respect to which gradient is calculated.
+                See
+                :py:func:`~MulensModel.fitdata.FitData.get_chi2_gradient()`
+                for accepted parameters.
+
+        Returns :
+            chi2: *float*
+                Chi^2 value
+
+            gradient: *float* or *np.ndarray*
+                chi^2 gradient
+        """
+        if isinstance(parameters, str):
+            parameters = [parameters]
+
+        self._update_fits()
+        chi2 = []
+        gradient = np.zeros(len(parameters))
+        for fit in self._fits:
+            (chi2_fit, gradient_fit) = fit.get_chi2_and_gradient(parameters)
+            chi2.append(chi2_fit)
+            gradient += gradient_fit
+
+        self.chi2 = self._sum(chi2)
+        if len(parameters) == 1:
+            self._chi2_gradient = gradient[0]
+        else:
+            self._chi2_gradient = gradient
+
+        return (self.chi2, self._chi2_gradient)
+
     def fit_fluxes(self, bad=False):
         """
         Fit for the optimal fluxes for each dataset (and its chi2)
+
+        The :py:class:`~MulensModel.fitdata.FitData` objects are kept
+        between calls and only their fluxes and chi2 are updated.
+        A :py:class:`~MulensModel.fitdata.FitData` object is re-created only
+        if the model, the dataset, or the settings for this dataset
+        (fixed fluxes, flux ratio, or limb-darkening coefficient) changed.
         """
+        self._update_fits()
 
-        self._fits = []
-        for dataset in self.datasets:
-            if dataset in self.fix_blend_flux.keys():
-                fix_blend_flux = self.fix_blend_flux[dataset]
+        if self.share_magnification:
+            self._calculate_shared_magnifications(bad=bad)
+
+        for fit in self._fits:
+            fit.update(bad=bad)  # Fit the fluxes and calculate chi2.
+
+    def _update_fits(self):
+        """
+        Make sure there is an up-to-date FitData object for each dataset.
+        """
+        n_datasets = len(self.datasets)
+        if self._fits is None or len(self._fits) != n_datasets:
+            self._fits = [None] * n_datasets
+            self._fits_settings = [None] * n_datasets
+
+        for (i, dataset) in enumerate(self.datasets):
+            settings = self._get_fit_settings(dataset)
+            settings_repr = repr(settings)  # Note that 0. == False in python.
+            fit = self._fits[i]
+            if (fit is None or fit.dataset is not dataset or fit.model is not self.model or
+                    settings_repr != self._fits_settings[i]):
+                fit = FitData(
+                    model=self.model, dataset=dataset, fix_blend_flux=settings[0],
+                    fix_source_flux=settings[1], fix_source_flux_ratio=settings[2])
+                self._fits[i] = fit
+                self._fits_settings[i] = settings_repr
+
+    def get_chi2_batch(self, parameters, parameter_names=None):
+        """
+        Calculate chi^2 for many sets of model parameters at once,
+        e.g., for all walkers of an ensemble sampler. Magnifications are
+        calculated using
+        :py:func:`~MulensModel.model.Model.get_magnification_batch()` and
+        the fluxes are fitted for all sets of parameters together (see
+        :py:func:`~MulensModel.fitdata.FitData.get_chi2_batch()`).
+        Parameters of :py:attr:`~model` and :py:attr:`~chi2` are not
+        changed.
+
+        For models with more than one source, the parameters are set
+        one after another and :py:func:`get_chi2()` is called.
+
+        Parameters :
+            parameters: *np.ndarray* (*float*, size of (M, K))
+                Values of parameters: M sets of K parameters.
+
+            parameter_names: *list* of *str*, optional
+                Names of K parameters. Default is all parameters of
+                :py:attr:`~model`. See
+                :py:func:`~MulensModel.model.Model.get_magnification_batch()`.
+
+        Returns :
+            chi2: *np.ndarray* (*float*, size of (M,))
+                Chi^2 value for each set of parameters.
+        """
+        (parameters, parameter_names) = self.model._parse_parameters_batch(parameters, parameter_names)
+        if self.model.n_sources != 1:
+            return self._get_chi2_batch_loop(parameters, parameter_names)
+
+        self._update_fits()
+        chi2 = [None] * len(self._fits)
+        groups = dict()
+        for (i, fit) in enumerate(self._fits):
+            if self.share_magnification and fit.dataset.ephemerides_file is None:
+                groups.setdefault(('gamma', fit.gamma), []).append(i)
             else:
-                fix_blend_flux = False
+                groups[('dataset', i)] = [i]
+
+        for indexes in groups.values():
+            fits = [self._fits[i] for i in indexes]
+            times = [fit.dataset.time[fit.dataset.good] for fit in fits]
+            satellite_skycoord = None
+            if fits[0].dataset.ephemerides_file is not None:
+                satellite_skycoord = fits[0].dataset.satellite_skycoord[fits[0].dataset.good]
+
+            magnification = self.model.get_magnification_batch(
+                np.concatenate(times), parameters, parameter_names,
+                satellite_skycoord=satellite_skycoord, gamma=fits[0].gamma)
+            split_indexes = np.cumsum([len(time) for time in times])[:-1]
+            for (i, fit, values) in zip(indexes, fits, np.split(magnification, split_indexes, axis=1)):
+                chi2[i] = fit.get_chi2_batch(values)
+
+        if self.sum_function == 'numpy.sum':
+            return np.sum(chi2, axis=0)
+        else:
+            return np.array([self._sum(values) for values in np.transpose(chi2)])
+
+    def _get_chi2_batch_loop(self, parameters, parameter_names):
+        """
+        Calculate chi2 for many sets of parameters one after another.
+        Parameters of the model and chi2 are restored at the end.
+        """
+        original = [self.model.parameters.parameters[name] for name in parameter_names]
+        chi2_original = self.chi2
+        chi2 = np.zeros(len(parameters))
+        try:
+            for (i, values) in enumerate(parameters):
+                for (name, value) in zip(parameter_names, values):
+                    setattr(self.model.parameters, name, value)
+                chi2[i] = self.get_chi2()
+        finally:
+            for (name, value) in zip(parameter_names, original):
+                setattr(self.model.parameters, name, value)
+            self.chi2 = chi2_original
+
+        return chi2
+
+    def _calculate_shared_magnifications(self, bad):
+        """
+        Calculate magnification once for all datasets that have the same
+        limb-darkening coefficient and no satellite ephemerides and pass
+        the results to corresponding FitData objects.
+        """
+        groups = dict()
+        for fit in self._fits:
+            if fit.dataset.ephemerides_file is None:
+                groups.setdefault(fit.gamma, []).append(fit)
+
+        for (gamma, fits) in groups.items():
+            if len(fits) < 2:
+                continue
 
-            if dataset in self.fix_source_flux.keys():
-                fix_source_flux = self.fix_source_flux[dataset]
+            if bad:
+                times = [fit.dataset.time for fit in fits]
             else:
-                fix_source_flux = False
+                times = [fit.dataset.time[fit.dataset.good] for fit in fits]
+            split_indexes = np.cumsum([len(time) for time in times])[:-1]
+            kwargs = {'time': np.concatenate(times), 'satellite_skycoord': None, 'gamma': gamma}
 
-            # JCY - This needs a unit test.
-            if dataset in self.fix_source_flux_ratio.keys():
-                fix_source_flux_ratio = self.fix_source_flux_ratio[dataset]
+            if self.model.n_sources == 1:
+                magnification = self.model.get_magnification_curve(**kwargs).get_magnification()
+                magnifications = np.split(magnification, split_indexes)
             else:
-                if dataset.bandpass in self.fix_source_flux_ratio.keys():
-                    fix_source_flux_ratio = self.fix_source_flux_ratio[
-                        dataset.bandpass]
-                else:
-                    fix_source_flux_ratio = False
-
-            fit = FitData(
-                model=self.model, dataset=dataset,
-                fix_blend_flux=fix_blend_flux, fix_source_flux=fix_source_flux,
-                fix_source_flux_ratio=fix_source_flux_ratio)
-            fit.update(bad=bad)  # Fit the fluxes and calculate chi2.
-            self.fits.append(fit)
+                curves = self.model.get_magnification_curves(**kwargs)
+                split = [np.split(curve.get_magnification(), split_indexes) for curve in curves]
+                magnifications = [list(values) for values in zip(*split)]
+
+            for (fit, magnification) in zip(fits, magnifications):
+                fit._set_provided_magnifications(magnification, bad)
+
+    def _get_fit_settings(self, dataset):
+        """
+        Get settings that define FitData object for given dataset:
+        fix_blend_flux, fix_source_flux, fix_source_flux_ratio, and
+        limb-darkening coefficient.
+        """
+        if dataset in self.fix_blend_flux.keys():
+            fix_blend_flux = self.fix_blend_flux[dataset]
+        else:
+            fix_blend_flux = False
+
+        if dataset in self.fix_source_flux.keys():
+            fix_source_flux = self.fix_source_flux[dataset]
+        else:
+            fix_source_flux = False
+
+        # JCY - This needs a unit test.
+        if dataset in self.fix_source_flux_ratio.keys():
+            fix_source_flux_ratio = self.fix_source_flux_ratio[dataset]
+        else:
+            if dataset.bandpass in self.fix_source_flux_ratio.keys():
+                fix_source_flux_ratio = self.fix_source_flux_ratio[
+                    dataset.bandpass]
+            else:
+                fix_source_flux_ratio = False
+
+        gamma = None
+        if self.model.parameters.is_finite_source() and dataset.bandpass is not None:
+            try:
+                gamma = self.model.get_limb_coeff_gamma(dataset.bandpass)
+            except KeyError:
+                pass
+
+        return (fix_blend_flux, fix_source_flux, fix_source_flux_ratio, gamma)
 
     def _sum(self, data):
         """calculate sum of the data"""
@@ -934,6 +1134,22 @@ class Event(object):
 
         return fluxes
 
+    @property
+    def share_magnification(self):
+        """
+        *bool*
+
+        If *True* (default), then the model magnification is calculated in
+        a single call for all datasets that have no satellite ephemerides
+        and the same limb-darkening coefficient. This reduces overheads for
+        events with many datasets.
+        """
+        return self._share_magnification
+
+    @share_magnification.setter
+    def share_magnification(self, new_value):
+        self._share_magnification = bool(new_value)
+
     @property
     def sum_function(self):
         """
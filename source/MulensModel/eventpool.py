@@ -0,0 +1,127 @@
+import os
+import multiprocessing
+import numpy as np
+
+from MulensModel.event import Event
+
+
+_worker_event = None
+
+
+def _initialize_worker(event):
+    """
+    Remember the event in a worker process.
+    """
+    global _worker_event
+    _worker_event = event
+
+
+def _get_chi2_batch_in_worker(args):
+    """
+    Calculate chi^2 for a chunk of parameters in a worker process.
+    """
+    (parameters, parameter_names) = args
+    return _worker_event.get_chi2_batch(parameters, parameter_names)
+
+
+class EventPool(object):
+    """
+    Pool of processes that calculate chi^2 of a single event for many sets
+    of model parameters. The event is sent to each process only once (when
+    the pool is started), and later only the parameters and chi^2 values
+    are exchanged between processes. Each process calls
+    :py:func:`~MulensModel.event.Event.get_chi2_batch()` for a part of
+    the parameters.
+
+    The processes work on copies of the event made when the pool was
+    started. Changes of the event (e.g., of the parameters that are not
+    passed to :py:func:`get_chi2_batch()` or of the datasets) made after
+    that are not seen by the processes.
+
+    Arguments :
+        event: :py:class:`~MulensModel.event.Event`
+            Event for which chi^2 is calculated.
+
+        parameter_names: *list* of *str*, optional
+            Default names of parameters passed to
+            :py:func:`get_chi2_batch()`. If not provided, then all
+            parameters of the model are used.
+
+        processes: *int*, optional
+            Number of processes. Default is the number of CPUs.
+
+        start_method: *str*, optional
+            Method of starting processes, e.g., ``'fork'`` or ``'spawn'``.
+            See *multiprocessing.get_context()*. Default is the default
+            method of given platform.
+
+    The pool can be used as a context manager. Example of use with emcee::
+
+        with EventPool(event, ['t_0', 'u_0', 't_E']) as pool:
+            def ln_prob(theta):
+                return -0.5 * pool.get_chi2_batch(theta)
+
+            sampler = emcee.EnsembleSampler(n_walkers, 3, ln_prob, vectorize=True)
+            sampler.run_mcmc(starting_points, n_steps)
+    """
+    def __init__(self, event, parameter_names=None, processes=None, start_method=None):
+        if not isinstance(event, Event):
+            raise TypeError('EventPool requires Event instance, not {:}'.format(type(event)))
+
+        if processes is None:
+            processes = os.cpu_count()
+
+        self._parameter_names = parameter_names
+        self._processes = processes
+        context = multiprocessing.get_context(start_method)
+        self._pool = context.Pool(processes, initializer=_initialize_worker, initargs=(event,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_chi2_batch(self, parameters, parameter_names=None):
+        """
+        Calculate chi^2 for many sets of model parameters. The parameters
+        are divided into chunks that are processed in parallel.
+
+        Parameters :
+            parameters: *np.ndarray* (*float*, size of (M, K))
+                Values of parameters: M sets of K parameters.
+
+            parameter_names: *list* of *str*, optional
+                Names of K parameters. Default is the value provided when
+                the pool was created.
+
+        Returns :
+            chi2: *np.ndarray* (*float*, size of (M,))
+                Chi^2 value for each set of parameters.
+        """
+        if parameter_names is None:
+            parameter_names = self._parameter_names
+
+        parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+        if len(parameters) == 0:
+            return np.zeros(0)
+
+        chunks = np.array_split(parameters, min(self._processes, len(parameters)))
+        results = self._pool.map(_get_chi2_batch_in_worker, [(chunk, parameter_names) for chunk in chunks])
+        return np.concatenate(results)
+
+    def close(self):
+        """
+        Stop the processes.
+        """
+        self._pool.close()
+        self._pool.join()
+
+    @property
+    def processes(self):
+        """
+        *int*
+
+        Number of processes.
+        """
+        return self._processes
@@ -44,6 +44,8 @@ class FitData(object):
 
     """
 
+    _min_relative_determinant = 1.e-8
+
     def __init__(self, model=None, dataset=None, fix_blend_flux=False,
                  fix_source_flux=False, fix_source_flux_ratio=False):
         self.model = model
@@ -82,10 +84,24 @@ class FitData(object):
         self._data_magnification_curves = None
         self._data_magnification_curve_1 = None
         self._data_magnification_curve_2 = None
+        self._provided_magnifications = None
+        self._magnification_curves_bad = None
 
     def __getattr__(self, item):
         return object.__getattribute__(self, item)
 
+    def __getstate__(self):
+        """
+        Magnification curves (with trajectories and objects calculating
+        magnifications) are not pickled. They are re-created when
+        magnifications are calculated next time.
+        """
+        state = self.__dict__.copy()
+        for key in state.keys():
+            if key.startswith('_data_magnification_curve') or key == '_magnification_curves_bad':
+                state[key] = None
+        return state
+
     def _set_fix_source_flux(self, fix_source_flux):
         if fix_source_flux is False:
             return fix_source_flux
@@ -148,13 +164,64 @@ class FitData(object):
         No returns.
         """
         self.fit_fluxes()
+        self._calculate_chi2_per_point(bad=bad)
+
+        self._provided_magnifications = None
 
-        # Calculate chi2
+    def _calculate_chi2_per_point(self, bad):
+        """
+        Calculate chi2 for each epoch using the fitted fluxes.
+        """
         model_flux = self.get_model_fluxes(bad=bad)
         diff = self._dataset.flux - model_flux
         self._chi2_per_point = (diff / self._dataset.err_flux)**2
 
+    def _set_provided_magnifications(self, magnifications, bad):
+        """
+        Set magnifications that were calculated outside this object, e.g.,
+        by :py:class:`~MulensModel.event.Event` for many datasets at once.
+        They are used in the next :py:func:`~update()` call.
+
+        Parameters :
+            magnifications: *np.ndarray* or *list* of *np.ndarray*
+                Magnification for each epoch (if *bad* is *True*) or for each
+                good epoch (if *bad* is *False*). For multiple sources,
+                a list with magnification of each source is expected.
+
+            bad: *bool*
+                Are the magnifications provided also for bad epochs?
+        """
+        self._provided_magnifications = (magnifications, bad)
+
+    def _get_provided_magnifications(self, bad):
+        """
+        Get magnifications set by _set_provided_magnifications() or *None*
+        if they do not exist or do not cover requested epochs.
+        """
+        if self._provided_magnifications is None:
+            return None
+
+        (magnifications, provided_bad) = self._provided_magnifications
+        if bad and not provided_bad:
+            return None
+
+        self._data_magnification_curve = None
+        self._data_magnification_curves = None
+        for i in range(self._model.n_sources):
+            self.__setattr__('_data_magnification_curve_{0}'.format(i+1), None)
+        self._magnification_curves_bad = bad
+
+        if bad or not provided_bad:
+            return magnifications
+
+        good = self._dataset.good
+        if self._model.n_sources == 1:
+            return magnifications[good]
+        else:
+            return [magnification[good] for magnification in magnifications]
+
     def _set_data_magnification_curves(self, bad=True):
+        self._magnification_curves_bad = None
         if bad:
             select = np.ones(self._dataset.n_epochs, dtype=bool)
         else:
@@ -182,11 +249,14 @@ class FitData(object):
         """
         Calculate the model magnifications for the epochs of the dataset.
         """
-        self._set_data_magnification_curves(bad=bad)
-
-        if self._model.n_sources == 1:
+        mag_matrix = self._get_provided_magnifications(bad)
+        if mag_matrix is not None:
+            pass
+        elif self._model.n_sources == 1:
+            self._set_data_magnification_curves(bad=bad)
             mag_matrix = self._data_magnification_curve.get_magnification()
         elif self._model.n_sources >= 2:
+            self._set_data_magnification_curves(bad=bad)
             mag_matrix = []
             for i in range(self._model.n_sources):
                 mag_matrix.append(
@@ -198,6 +268,14 @@ class FitData(object):
                    "only handle <=2 sources")
             raise NotImplementedError(msg)
 
+        self._set_data_magnification(mag_matrix, bad)
+
+    def _set_data_magnification(self, mag_matrix, bad):
+        """
+        Remember the magnifications of the dataset epochs. If *bad* is
+        *False*, then *mag_matrix* covers only good epochs and the
+        magnification of bad epochs is set to 0.
+        """
         if bad:
             self._data_magnification = mag_matrix
         else:
@@ -273,21 +351,13 @@ class FitData(object):
 
         return (x, y)
 
-    def _setup_linalg_arrays(self):
-        """
-        Create xT and y arrays
-        """
-        (x, y) = self._create_arrays()
-        xT = self._invert_x_array(x)
-        (xT, y) = self._weight_linalg_arrays(xT, y)
-        return (xT, y)
-
-    def _create_arrays(self):
+    def _create_arrays(self, calculate_magnifications=True):
         """ Create x and y arrays"""
         # Initializations
         self.n_fluxes = 0
         n_epochs = np.sum(self._dataset.good)
-        self._calculate_magnifications(bad=False)
+        if calculate_magnifications:
+            self._calculate_magnifications(bad=False)
 
         # Account for source fluxes
         if self.fix_source_flux_ratio is not False:
@@ -329,6 +399,99 @@ class FitData(object):
 
         return (xT, y)
 
+    def _set_weights(self):
+        """
+        Precompute inverse variances of good epochs and their sums used in
+        the normal equations. A short summary of the dataset arrays is
+        remembered, so that the weights are recalculated if any array is
+        replaced (e.g., by MulensData.scale_errorbars()) or changed in place
+        (e.g., by masking bad epochs).
+        """
+        dataset = self._dataset
+        good = dataset.good
+        self._weights_source = self._get_weights_source()
+        self._weights = dataset.err_flux[good]**-2
+        self._weights_sum = np.sum(self._weights)
+        self._weights_flux_sum = np.dot(self._weights, dataset.flux[good])
+
+    def _get_weights_source(self):
+        """
+        Arrays used to calculate weights and their checksums, which are
+        much faster to calculate than the weights.
+        """
+        dataset = self._dataset
+        (flux, err_flux, good) = (dataset.flux, dataset.err_flux, dataset.good)
+        checksums = (np.count_nonzero(good), np.dot(err_flux, good), np.dot(flux, good))
+        return ((flux, err_flux, good), checksums)
+
+    def _get_weights(self):
+        """
+        Get weights and make sure they correspond to current dataset arrays.
+        """
+        (arrays, checksums) = self._get_weights_source()
+        (arrays_old, checksums_old) = self._weights_source
+        if any(a is not b for (a, b) in zip(arrays, arrays_old)) or checksums != checksums_old:
+            self._set_weights()
+
+        return self._weights
+
+    def _solve_normal_equations(self, x, y):
+        """
+        Solve the least squares problem y = x.T * fluxes using the normal
+        equations, which are solved analytically for up to 3 fluxes.
+
+        Returns *None* if there are more fluxes or the equations are
+        ill-conditioned. In that case, np.linalg.lstsq() should be used.
+        """
+        if x is None or self.n_fluxes > 3:
+            return None
+
+        weights = self._get_weights()
+        x = x.reshape(self.n_fluxes, -1)
+        blend_free = (self.fix_blend_flux is False)
+        n_rows = self.n_fluxes - 1 if blend_free else self.n_fluxes
+        rows = np.ascontiguousarray(x[:n_rows])
+
+        matrix = np.empty((self.n_fluxes, self.n_fluxes))
+        vector = np.empty(self.n_fluxes)
+        weighted_rows = rows * weights
+        matrix[:n_rows, :n_rows] = np.dot(weighted_rows, rows.T)
+        vector[:n_rows] = np.dot(weighted_rows, y)
+        if blend_free:
+            matrix[:n_rows, -1] = matrix[-1, :n_rows] = np.dot(rows, weights)
+            matrix[-1, -1] = self._weights_sum
+            if self.fix_source_flux is False:
+                vector[-1] = self._weights_flux_sum
+            else:
+                vector[-1] = np.dot(weights, y)
+
+        return self._solve_symmetric_system(matrix, vector)
+
+    def _solve_symmetric_system(self, matrix, vector):
+        """
+        Closed-form solution of symmetric positive definite system of
+        up to 3 equations. Returns *None* if the determinant is small
+        compared to the product of diagonal elements.
+        """
+        diagonal_product = np.prod(np.diag(matrix))
+        if self.n_fluxes == 1:
+            determinant = matrix[0, 0]
+            adjugate = np.ones((1, 1))
+        elif self.n_fluxes == 2:
+            determinant = matrix[0, 0] * matrix[1, 1] - matrix[0, 1]**2
+            adjugate = np.array([[matrix[1, 1], -matrix[0, 1]], [-matrix[0, 1], matrix[0, 0]]])
+        else:
+            ((a, b, c), (_, d, e), (_, _, f)) = matrix.tolist()
+            adjugate = np.array([[d * f - e * e, c * e - b * f, b * e - c * d],
+                                 [c * e - b * f, a * f - c * c, b * c - a * e],
+                                 [b * e - c * d, b * c - a * e, a * d - b * b]])
+            determinant = a * adjugate[0, 0] + b * adjugate[0, 1] + c * adjugate[0, 2]
+
+        if not (determinant > self._min_relative_determinant * diagonal_product):
+            return None
+
+        return np.dot(adjugate, vector) / determinant
+
     def fit_fluxes(self):
         """
         Execute the linear least squares fit to determine the fitted fluxes.
@@ -342,7 +505,14 @@ class FitData(object):
 
         No returns.
         """
+        self._fit_fluxes()
 
+    def _fit_fluxes(self, calculate_magnifications=True):
+        """
+        Fit the fluxes. If *calculate_magnifications* is *False*, then
+        the magnifications already stored in self._data_magnification
+        are used.
+        """
         # Bypass this code if all fluxes are fixed.
         if isinstance(self.fix_source_flux, (list, float)):
             if isinstance(self.fix_blend_flux, (float)):
@@ -356,15 +526,91 @@ class FitData(object):
                                 proceed = True
 
                 if not proceed:
-                    self._calculate_magnifications(bad=False)
+                    if calculate_magnifications:
+                        self._calculate_magnifications(bad=False)
                     self._blend_flux = self.fix_blend_flux
                     self._source_fluxes = np.array(self.fix_source_flux)
                     return
 
-        (xT, y) = self._setup_linalg_arrays()
+        (x, y) = self._create_arrays(calculate_magnifications)
 
         # Solve for the coefficients in y = fs * x + fb (point source)
         # These values are: F_s1, F_s2,..., F_b.
+        results = self._solve_normal_equations(x, y)
+        if results is None:
+            results = self._solve_lstsq(x, y)
+
+        self._set_fluxes_from_results(results)
+
+    def get_chi2_batch(self, magnifications):
+        """
+        Fit the fluxes and calculate chi2 for many magnification curves
+        at once, e.g., calculated by
+        :py:func:`~MulensModel.model.Model.get_magnification_batch()`.
+        Only single source models are handled. The normal equations are
+        solved for all curves together. Nothing is remembered, i.e.,
+        :py:obj:`~chi2` and fluxes are not changed.
+
+        Parameters :
+            magnifications: *np.ndarray* (*float*, size of (M, N))
+                Magnifications for M models and N good epochs of
+                :py:obj:`~dataset`.
+
+        Returns :
+            chi2: *np.ndarray* (*float*, size of (M,))
+                Chi2 for each magnification curve.
+        """
+        if self._model.n_sources != 1:
+            raise NotImplementedError('FitData.get_chi2_batch() works only for single source models.')
+
+        magnifications = np.atleast_2d(magnifications)
+        weights = self._get_weights()
+        flux = self._dataset.flux[self._dataset.good]
+        n_models = len(magnifications)
+
+        if self.fix_source_flux is False or self.fix_source_flux[0] is False:
+            source_flux = None
+        else:
+            source_flux = self.fix_source_flux[0] * np.ones(n_models)
+        blend_free = (self.fix_blend_flux is False)
+        if blend_free:
+            blend_flux = None
+        else:
+            blend_flux = self.fix_blend_flux * np.ones(n_models)
+
+        weighted_magnifications = magnifications * weights
+        if source_flux is None:
+            sum_aa = np.sum(weighted_magnifications * magnifications, axis=1)
+            sum_af = np.dot(weighted_magnifications, flux)
+        if blend_free:
+            sum_a = np.sum(weighted_magnifications, axis=1)
+
+        if source_flux is None and blend_free:
+            sum_ = self._weights_sum
+            sum_f = self._weights_flux_sum
+            determinant = sum_aa * sum_ - sum_a**2
+            with np.errstate(divide='ignore', invalid='ignore'):
+                source_flux = (sum_ * sum_af - sum_a * sum_f) / determinant
+                blend_flux = (sum_aa * sum_f - sum_a * sum_af) / determinant
+            for i in np.where(~(determinant > self._min_relative_determinant * sum_aa * sum_))[0]:
+                x = np.vstack((magnifications[i], np.ones(len(flux))))
+                sigma_inverse = np.sqrt(weights)
+                results = np.linalg.lstsq((x * sigma_inverse).T, flux * sigma_inverse, rcond=-1)[0]
+                (source_flux[i], blend_flux[i]) = results
+        elif source_flux is None:
+            source_flux = (sum_af - blend_flux * np.sum(weighted_magnifications, axis=1)) / sum_aa
+        elif blend_free:
+            blend_flux = (self._weights_flux_sum - source_flux * sum_a) / self._weights_sum
+
+        residuals = flux - source_flux[:, np.newaxis] * magnifications - blend_flux[:, np.newaxis]
+        return np.dot(residuals**2, weights)
+
+    def _solve_lstsq(self, x, y):
+        """
+        General solution of linear least squares problem using np.linalg.lstsq().
+        """
+        xT = self._invert_x_array(x)
+        (xT, y) = self._weight_linalg_arrays(xT, y)
         try:
             results = np.linalg.lstsq(xT, y, rcond=-1)[0]
         except ValueError as e:
@@ -378,7 +624,12 @@ class FitData(object):
             args = (e, np.sum(np.isnan(xT)), np.sum(np.isnan(y)))
             raise ValueError(message.format(*args))
 
-        # Record the results
+        return results
+
+    def _set_fluxes_from_results(self, results):
+        """
+        Record the results of the linear fit.
+        """
         if self.fix_source_flux_ratio is False:
             if self.fix_source_flux is False:
                 source_fluxes = results[0:self._model.n_sources]
@@ -592,20 +843,30 @@ class FitData(object):
         if not isinstance(parameters, list):
             parameters = [parameters]
         implemented = {'t_0', 't_E', 'u_0', 't_eff', 'pi_E_N', 'pi_E_E', 'rho'}
-        if len(set(parameters) - implemented) > 0:
+        if self.model.n_lenses == 2:
+            implemented |= {'alpha', 's', 'q'}
+
+        heads = [self.model.parameters._split_parameter_name(parameter)[0] for parameter in parameters]
+        if len(set(heads) - implemented) > 0:
             raise NotImplementedError((
                 "chi^2 gradient is implemented only for {:}\nCannot work " +
                 "with {:}").format(implemented, parameters))
 
-        # Implemented for the number of sources in the model?
-        if self.model.n_lenses != 1:
+        # Implemented for the type of the model?
+        if self.model.n_lenses > 2:
             raise NotImplementedError(
-                'chi2_gradient() only implemented for single lens models')
+                'chi2_gradient() only implemented for single and binary lens models')
 
         if self.model.parameters.is_xallarap:
             raise NotImplementedError('Gradient for xallarap models is not '
                                       'implemented yet')
 
+        if not self.model.parameters.is_static():
+            raise NotImplementedError('Gradient for models with lens orbital motion is not implemented yet')
+
+        if self.model.parameters.is_external_mass_sheet:
+            raise NotImplementedError('Gradient for models with external mass sheet is not implemented yet')
+
     def get_chi2_gradient(self, parameters):
         """
         Fits fluxes and calculates chi^2 gradient (also called Jacobian), i.e.,
@@ -615,8 +876,13 @@ class FitData(object):
             parameters: *str* or *list*, required
                 Parameters with respect to which gradient is calculated.
                 Currently accepted parameters are: ``t_0``, ``u_0``, ``t_eff``,
-                ``t_E``, ``pi_E_N``, and ``pi_E_E``. The parameters for
-                which you request gradient must be defined in py:attr:`~model`.
+                ``t_E``, ``pi_E_N``, ``pi_E_E``, and ``rho``; for binary
+                lenses also ``alpha``, ``s``, and ``q``. For models with
+                multiple sources, the parameters of a given source
+                (e.g., ``t_0_1`` or ``rho_2``) are also accepted.
+                The parameters for which you request gradient must be
+                defined in py:attr:`~model`. Finite-source binary-lens
+                magnification methods are not supported.
 
         Returns :
             gradient: *float* or *np.ndarray*
@@ -636,32 +902,132 @@ class FitData(object):
         Parameters :
             parameters: *str* or *list*, required
                 Parameters with respect to which gradient is calculated.
-                Currently accepted parameters are: ``t_0``, ``u_0``, ``t_eff``,
-                ``t_E``, ``pi_E_N``, and ``pi_E_E``. The parameters for
-                which you request gradient must be defined in py:attr:`~model`.
+                See :py:func:`~get_chi2_gradient()` for accepted parameters.
+
+        Returns :
+            gradient: *float* or *np.ndarray*
+                chi^2 gradient
+        """
+        if not isinstance(parameters, list):
+            parameters = [parameters]
+        self._check_for_gradient_implementation(parameters)
+
+        parameters_of_sources = self._get_parameters_of_sources(parameters)
+        d_A_d_params = []
+        for (i, parameters_source) in enumerate(parameters_of_sources):
+            if len(parameters_source) == 0:
+                d_A_d_params.append({})
+                continue
+            curve = self._get_magnification_curve_of_source(i)
+            d_A_d_params.append(curve.get_d_A_d_params(list(parameters_source.values())))
+
+        self._set_chi2_gradient(parameters, parameters_of_sources, d_A_d_params)
+
+        return self._chi2_gradient
+
+    def get_chi2_and_gradient(self, parameters):
+        """
+        Fits fluxes and calculates chi^2 and its gradient in a single pass,
+        i.e., the magnification and its derivatives are calculated
+        together (see
+        :py:func:`~MulensModel.magnificationcurve.MagnificationCurve.get_magnification_and_d_A_d_params()`)
+        and the same magnification is used for fitting the fluxes.
+        It is faster than calling :py:func:`~update()` and
+        :py:func:`~calculate_chi2_gradient()`.
+
+        Parameters :
+            parameters: *str* or *list*, required
+                Parameters with respect to which gradient is calculated.
+                See :py:func:`~get_chi2_gradient()` for accepted parameters.
 
         Returns :
+            chi2: *float*
+                Chi^2 value.
+
             gradient: *float* or *np.ndarray*
                 chi^2 gradient
         """
+        if not isinstance(parameters, list):
+            parameters = [parameters]
         self._check_for_gradient_implementation(parameters)
 
-        # Calculate factor
+        self._set_data_magnification_curves(bad=False)
+        parameters_of_sources = self._get_parameters_of_sources(parameters)
+        magnifications = []
+        d_A_d_params = []
+        for (i, parameters_source) in enumerate(parameters_of_sources):
+            curve = self._get_magnification_curve_of_source(i)
+            (magnification, d_A_d_params_source) = curve.get_magnification_and_d_A_d_params(
+                list(parameters_source.values()))
+            magnifications.append(magnification)
+            d_A_d_params.append(d_A_d_params_source)
+
+        if self._model.n_sources == 1:
+            magnifications = magnifications[0]
+        self._set_data_magnification(magnifications, bad=False)
+        self._fit_fluxes(calculate_magnifications=False)
+        self._calculate_chi2_per_point(bad=False)
+
+        self._set_chi2_gradient(parameters, parameters_of_sources, d_A_d_params)
+
+        return (self.chi2, self._chi2_gradient)
+
+    def _set_chi2_gradient(self, parameters, parameters_of_sources, d_A_d_params):
+        """
+        Combine derivatives of magnification of each source (*d_A_d_params*)
+        with current fluxes and set chi^2 gradient.
+        """
         flux_factor = self.get_model_fluxes() - self.dataset.flux
-        flux_factor *= 2. * self.source_flux / self.dataset.err_flux**2
+        flux_factor *= 2. / self.dataset.err_flux**2
+        flux_factor = flux_factor[self.dataset.good]
 
-        gradient = self.get_d_A_d_params_for_point_lens_model(parameters)
-        for (key, value) in gradient.items():
-            gradient[key] = np.sum((flux_factor[self.dataset.good] * value))
+        gradient = {parameter: 0. for parameter in parameters}
+        for (i, parameters_source) in enumerate(parameters_of_sources):
+            for (parameter, head) in parameters_source.items():
+                gradient[parameter] += self.source_fluxes[i] * np.sum(flux_factor * d_A_d_params[i][head])
 
         if len(parameters) == 1:
-            out = gradient[parameters[0]]
+            self._chi2_gradient = gradient[parameters[0]]
         else:
-            out = np.array([gradient[p] for p in parameters])
+            self._chi2_gradient = np.array([gradient[p] for p in parameters])
+
+    def _get_parameters_of_sources(self, parameters):
+        """
+        For each source, find which of the *parameters* affect its
+        magnification. Returns *list* of *dict*; keys are *parameters* and
+        values are parameter names in the model of given source.
+        """
+        if self._model.n_sources == 1:
+            return [{parameter: parameter for parameter in parameters}]
 
-        self._chi2_gradient = out
+        out = []
+        for i in range(self._model.n_sources):
+            parameters_source = self._model.parameters.__getattr__('source_{0}_parameters'.format(i+1))
+            out.append({})
+            for parameter in parameters:
+                (head, end) = self._model.parameters._split_parameter_name(parameter)
+                if end == i + 1 or (end is None and head in parameters_source.parameters):
+                    out[-1][parameter] = head
 
-        return self._chi2_gradient
+        return out
+
+    def _get_magnification_curve_of_source(self, index):
+        """
+        Get magnification curve of the source number *index* (starting from 0)
+        calculated for good epochs.
+        """
+        n_good = np.sum(self._dataset.good)
+        if self._model.n_sources == 1:
+            name = '_data_magnification_curve'
+        else:
+            name = '_data_magnification_curve_{0}'.format(index+1)
+
+        curve = self.__dict__.get(name)
+        if curve is None or len(curve.times) != n_good:
+            self._set_data_magnification_curves(bad=False)
+            curve = self.__dict__.get(name)
+
+        return curve
 
     def get_d_A_d_params_for_point_lens_model(self, parameters):
         """
@@ -678,6 +1044,7 @@ class FitData(object):
                 evaluated at each data point.
         """
         # Need to consider what happens when we move to 2 sources.
+        self._set_missing_magnification_curves()
         if self._data_magnification_curve is None:
             self._set_data_magnification_curves()
 
@@ -701,6 +1068,7 @@ class FitData(object):
         if 'rho' not in self.model.parameters.parameters:
             raise AttributeError('dA/drho cannot be calculated for a model without rho')
 
+        self._set_missing_magnification_curves()
         if self._data_magnification_curve is None:
             self._set_data_magnification_curves()
 
@@ -871,6 +1239,7 @@ class FitData(object):
             raise TypeError("Dataset has to of MulensData type, not: " +
                             str(type(new_value)))
         self._dataset = new_value
+        self._set_weights()
 
     @property
     def model(self):
@@ -905,6 +1274,7 @@ class FitData(object):
         """
         Returns previously calculated magnification curve.
         """
+        self._set_missing_magnification_curves()
         return self._data_magnification_curve
 
     @property
@@ -917,9 +1287,18 @@ class FitData(object):
             *:py:class:`~MulensModel.magnification.MagnificationCurve* objects,
             i.e., the model magnification curve evaluated for each datapoint.
         """
+        self._set_missing_magnification_curves()
         return (self._data_magnification_curve_1,
                 self._data_magnification_curve_2)
 
+    def _set_missing_magnification_curves(self):
+        """
+        If magnifications were provided from outside, then the magnification
+        curves are created only when requested.
+        """
+        if self._magnification_curves_bad is not None:
+            self._set_data_magnification_curves(bad=self._magnification_curves_bad)
+
     @property
     def gamma(self):
         """
@@ -139,7 +139,10 @@ class MagnificationCurve(object):
             methods_parameters: *dict*
                 Dictionary that for method names (keys) returns dictionary
                 in the form of ``**kwargs`` that are passed to given method,
-                e.g., ``{'VBBL': {'accuracy': 0.005}}``.
+                e.g., ``{'VBBL': {'accuracy': 0.005}}``. Methods ``VBBL``
+                and ``Adaptive_Contouring`` accept also ``n_threads``,
+                e.g., ``{'VBBL': {'n_threads': 8}}``, which splits epochs
+                into chunks that are calculated concurrently.
 
         """
         self._methods_parameters = methods_parameters
@@ -171,7 +174,7 @@ class MagnificationCurve(object):
         calculations and warn if not
         """
         methods = self._methods_names + [self._default_method]
-        set_ = set(['point_source', 'point_source_point_lens', None])
+        set_ = set(['point_source', 'point_source_vectorized', 'point_source_point_lens', None])
         if len(set(methods)-set_) == 0:
             path = join(
                 mm.MODULE_PATH, "documents", "magnification_methods.pdf")
@@ -378,8 +381,11 @@ class MagnificationCurve(object):
 
         magnification = np.zeros(len(self.times))
         for method, selection in self.methods_indices.items():
-            magnification[selection] = \
-                self._magnification_objects[method].get_magnification()
+            values = self._magnification_objects[method].get_magnification()
+            if np.ndim(values) > magnification.ndim:
+                # Parameters are arrays, e.g., in Model.get_magnification_batch().
+                magnification = np.zeros(np.shape(values)[:-1] + magnification.shape)
+            magnification[..., selection] = values
 
         return magnification
 
@@ -392,7 +398,7 @@ class MagnificationCurve(object):
             kwargs = self._setup_kwargs(method)
 
             if ((kwargs != {}) and
-                    (method.lower() not in ['vbbl', 'adaptive_contouring'])):
+                    (method.lower() not in ['vbbl', 'adaptive_contouring', 'adaptive'])):
                 msg = ('Methods parameters passed for method {:}' +
                        ' which does not accept any parameters')
                 raise ValueError(msg.format(method))
@@ -400,6 +406,9 @@ class MagnificationCurve(object):
             if method.lower() == 'point_source':
                 self._magnification_objects[method] = \
                     mm.binarylens.BinaryLensPointSourceMagnification(trajectory=trajectory)
+            elif method.lower() == 'point_source_vectorized':
+                self._magnification_objects[method] = \
+                    mm.binarylens.BinaryLensPointSourceVectorizedMagnification(trajectory=trajectory)
             elif method.lower() == 'quadrupole':
                 self._magnification_objects[method] = \
                     mm.binarylens.BinaryLensQuadrupoleMagnification(
@@ -419,6 +428,14 @@ class MagnificationCurve(object):
                     mm.binarylens. \
                     BinaryLensAdaptiveContouringMagnification(
                         trajectory=trajectory, gamma=self._gamma, **kwargs)
+            elif method.lower() == 'adaptive':
+                kwargs = dict(kwargs)
+                if 'finite_source_kwargs' not in kwargs:
+                    finite_source_method = kwargs.get('finite_source_method', 'VBBL')
+                    kwargs['finite_source_kwargs'] = self._setup_kwargs(finite_source_method)
+                self._magnification_objects[method] = \
+                    mm.binarylens.BinaryLensAdaptiveMagnification(
+                        trajectory=trajectory, gamma=self._gamma, **kwargs)
             elif method.lower() == 'point_source_point_lens':
                 self._magnification_objects[method] = \
                     mm.pointlens.PointSourcePointLensMagnification(
@@ -449,6 +466,11 @@ class MagnificationCurve(object):
                     mm.binarylenswithshear. \
                     BinaryLensPointSourceWithShearWM95Magnification(
                             trajectory=trajectory, **kwargs)
+            elif method.lower() == 'point_source_vectorized':
+                self._magnification_objects[method] = \
+                    mm.binarylenswithshear. \
+                    BinaryLensPointSourceWithShearVectorizedMagnification(
+                            trajectory=trajectory, **kwargs)
             else:
                 msg = 'Unknown method specified for binary lens: {:}'
                 raise ValueError(msg.format(method))
@@ -462,6 +484,16 @@ class MagnificationCurve(object):
             ``point_source``:
                 standard point source magnification calculation.
 
+            ``point_source_vectorized``:
+                point source magnification calculated for all epochs at once
+                using `Witt & Mao 1995 ApJL, 447, L105
+                <https://ui.adsabs.harvard.edu/abs/1995ApJ...447L.105W/abstract>`_
+                polynomial. It is faster than ``point_source``
+                for long light curves. See
+                :py:class:`~MulensModel.binarylens.BinaryLensPointSourceVectorizedMagnification`
+                or, if shear or convergence are set,
+                :py:class:`~MulensModel.binarylenswithshear.BinaryLensPointSourceWithShearVectorizedMagnification`
+
             ``quadrupole``:
                 From `Gould 2008 ApJ, 681, 1593
                 <https://ui.adsabs.harvard.edu/abs/2008ApJ...681.1593G/abstract>`_.
@@ -490,6 +522,21 @@ class MagnificationCurve(object):
 
                 Note that it doesn't work if shear or convergence are set.
 
+            ``adaptive``:
+                For each epoch selects ``point_source``, ``hexadecapole``, or
+                ``VBBL`` based on the distance to the caustic and
+                the difference between hexadecapole and quadrupole
+                approximations. See
+                :py:class:`~MulensModel.binarylens.BinaryLensAdaptiveMagnification`
+                for parameters that can be set using
+                :py:func:`set_magnification_methods_parameters()`.
+                The parameters of the finite-source method are taken from
+                the entry of this method, e.g., ``{'VBBL': {'accuracy': 0.005}}``.
+
+            For ``VBBL`` and ``Adaptive_Contouring`` the calculations can be
+            run in multiple threads - set ``n_threads`` using
+            :py:func:`set_magnification_methods_parameters()`.
+
             ``point_source_point_lens``:
                 Uses point-source _point_-_lens_ approximation; useful when you
                 consider binary lens but need magnification very far from
@@ -537,7 +584,7 @@ class MagnificationCurve(object):
 
     def get_d_A_d_params(self, parameters):
         """
-        Calculate d A / d parameters for a point lens model.
+        Calculate d A / d parameters for the model.
 
         Parameters :
             parameters: *list*
@@ -561,6 +608,42 @@ class MagnificationCurve(object):
 
         return d_A_d_params
 
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Calculate magnification and d A / d parameters for the model in
+        a single pass, i.e., the intermediate results (e.g., positions of
+        images for binary lenses) are shared between both calculations.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            magnification: *np.ndarray*
+                Vector of magnifications.
+
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        if self.parameters.n_lenses == 1 and self.parameters.is_finite_source():
+            self._check_for_finite_source_method()
+
+        if self._magnification_objects is None:
+            self._set_magnification_objects()
+
+        magnification = np.zeros(len(self.times))
+        d_A_d_params = {key: np.zeros(len(self.times)) for key in parameters}
+        for method, selection in self.methods_indices.items():
+            (magnification[selection], d_A_d_params_selection) = \
+                self._magnification_objects[method].get_magnification_and_d_A_d_params(parameters)
+            for key in parameters:
+                d_A_d_params[key][selection] = d_A_d_params_selection[key]
+
+        self._magnification = magnification
+        return (self._magnification, d_A_d_params)
+
     def get_d_A_d_rho(self):
         """
         Calculate d A / d rho for a point lens model.
@@ -620,11 +703,24 @@ class MagnificationCurve(object):
         """
         if self._methods_indices is None:
             self._methods_indices = {}
-            methods = self.methods_for_epochs
-            methods_ = np.array(methods)
+            n_epochs = len(self.times)
+            if self._methods_epochs is None:
+                if n_epochs > 0:
+                    self._methods_indices[self._default_method] = np.ones(n_epochs, dtype=bool)
+                return self._methods_indices
 
-            for method in set(methods):
-                selection = (methods_ == method)
-                self._methods_indices[method] = selection
+            brackets = np.searchsorted(self._methods_epochs, self.times)
+            n_max = len(self._methods_epochs)
+            selections = [(self._default_method, (brackets == 0) | (brackets >= n_max))]
+            for (i, method) in enumerate(self._methods_names):
+                selections.append((method, (brackets == i + 1)))
+
+            for (method, selection) in selections:
+                if not np.any(selection):
+                    continue
+                if method in self._methods_indices:
+                    self._methods_indices[method] = self._methods_indices[method] | selection
+                else:
+                    self._methods_indices[method] = selection
 
         return self._methods_indices
@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 
 from astropy.coordinates import SkyCoord
 
+from MulensModel.binarylens import BinaryLensPointSourceVectorizedMagnification
 from MulensModel.causticsbinary import CausticsBinary
 from MulensModel.causticspointwithshear import CausticsPointWithShear
 from MulensModel.causticsbinarywithshear import CausticsBinaryWithShear
@@ -893,7 +894,7 @@ class Model(object):
         - are finite source methods used for point sources?
         """
         used_methods = set(methods[1::2])
-        allowed = set(['point_source', 'point_source_point_lens'])
+        allowed = set(['point_source', 'point_source_vectorized', 'point_source_point_lens'])
         difference = used_methods - allowed
         if len(difference) == 0:
             return
@@ -965,7 +966,11 @@ class Model(object):
             methods_parameters: *dict*
                 Dictionary that for method names (keys) returns dictionary
                 in the form of ``**kwargs`` that are passed to given method,
-                e.g., ``{'VBBL': {'accuracy': 0.005}}``.
+                e.g., ``{'VBBL': {'accuracy': 0.005}}``. Methods ``VBBL``
+                and ``Adaptive_Contouring`` accept also ``n_threads``,
+                e.g., ``{'VBBL': {'n_threads': 8}}``. For parameters of
+                ``adaptive`` method see
+                :py:class:`~MulensModel.binarylens.BinaryLensAdaptiveMagnification`.
 
         """
         if self.n_lenses == 1:
@@ -976,8 +981,8 @@ class Model(object):
                 'finite_source_LD_Yoo04 finite_source_LD_Yoo04_direct '
                 'finite_source_uniform_Lee09 finite_source_LD_Lee09')
         elif self.n_lenses == 2:
-            methods_all_str = ('point_source quadrupole hexadecapole vbbl '
-                               'adaptive_contouring point_source_point_lens')
+            methods_all_str = ('point_source point_source_vectorized quadrupole hexadecapole vbbl '
+                               'adaptive_contouring adaptive point_source_point_lens')
         else:
             msg = 'wrong value of Model.n_lenses: {:}'
             raise ValueError(msg.format(self.n_lenses))
@@ -1276,6 +1281,193 @@ class Model(object):
             raise ValueError(msg)
         return magnification
 
+    def get_magnification_batch(self, time, parameters, parameter_names=None, satellite_skycoord=None,
+                                gamma=None, bandpass=None):
+        """
+        Calculate the model magnification for the given time(s) and many
+        sets of parameters at once, e.g., for all walkers of an ensemble
+        sampler. The model parameters are not changed.
+
+        For single source models with point lens (``point_source``,
+        ``finite_source_uniform_Gould94``, ``finite_source_LD_Yoo04``, and
+        their ``_direct`` versions) or static binary lens with point source
+        (``point_source`` and ``point_source_vectorized`` - both use
+        :py:class:`~MulensModel.binarylens.BinaryLensPointSourceVectorizedMagnification`)
+        the calculations are done using array operations. For parallax
+        models, *t_0_par* has to be fixed. In other cases, the parameters
+        are set one after another and the magnification is calculated
+        the same way as in :py:func:`get_magnification()`.
+
+        Parameters :
+            time: *np.ndarray*, *list of floats*, or *float*
+                Times for which magnification values are requested.
+
+            parameters: *np.ndarray* (*float*, size of (M, K))
+                Values of parameters: M sets of K parameters.
+
+            parameter_names: *list* of *str*, optional
+                Names of K parameters. The parameters of the model that are
+                not listed here are kept fixed. Default is all parameters
+                of the model in the order of
+                :py:attr:`~MulensModel.modelparameters.ModelParameters.parameters`.
+
+            satellite_skycoord: *astropy.coordinates.SkyCoord*, optional
+                See :py:func:`get_magnification()`.
+
+            gamma: *float*, optional
+                See :py:func:`get_magnification()`.
+
+            bandpass: *str*, optional
+                See :py:func:`get_magnification()`.
+
+        Returns :
+            magnification: *np.ndarray* (*float*, size of (M, N))
+                Magnification for each set of parameters and each epoch.
+        """
+        time = np.atleast_1d(time)
+        (parameters, parameter_names) = self._parse_parameters_batch(parameters, parameter_names)
+        gamma = self._get_limb_coeff_gamma(bandpass, gamma)
+        if self.n_sources != 1:
+            raise NotImplementedError('Model.get_magnification_batch() works only for single source models.')
+
+        if satellite_skycoord is None:
+            satellite_skycoord = self.get_satellite_coords(time)
+
+        if len(time) == 0:
+            return np.zeros((len(parameters), 0))
+
+        kwargs = {'satellite_skycoord': satellite_skycoord, 'gamma': gamma}
+        if self._can_use_batch(time, parameter_names):
+            magnification = self._get_magnification_batch(time, parameters, parameter_names, **kwargs)
+        else:
+            magnification = self._get_magnification_batch_loop(time, parameters, parameter_names, **kwargs)
+
+        return magnification
+
+    def _parse_parameters_batch(self, parameters, parameter_names):
+        """
+        Check input of get_magnification_batch() and make sure the values
+        are allowed for each parameter.
+        """
+        parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+        if parameter_names is None:
+            parameter_names = list(self.parameters.parameters.keys())
+
+        if parameters.ndim != 2 or parameters.shape[1] != len(parameter_names):
+            msg = 'Shape of parameters ({:}) does not match number of parameter names ({:})'
+            raise ValueError(msg.format(parameters.shape, len(parameter_names)))
+
+        for (name, values) in zip(parameter_names, parameters.T):
+            if name not in self.parameters.parameters:
+                raise KeyError('Parameter {:} is not defined in this model: {:}'.format(name, self.parameters))
+            for value in [np.min(values), np.max(values)]:
+                self.parameters._check_valid_parameter_values({name: value})
+
+        return (parameters, parameter_names)
+
+    def _can_use_batch(self, time, parameter_names):
+        """
+        Check if magnification for many parameters can be calculated
+        using array operations.
+        """
+        allowed = {'t_0', 'u_0', 't_E', 't_eff', 't_star', 'rho', 'pi_E_N', 'pi_E_E', 'alpha', 's', 'q', 't_0_par'}
+        keys = set(self.parameters.parameters.keys())
+        if not keys.issubset(allowed) or 't_0_par' in parameter_names:
+            return False
+        if 'pi_E_N' in keys and 't_0_par' not in keys:
+            return False
+
+        if self.n_lenses == 1:
+            methods = ['point_source', 'finite_source_uniform_gould94', 'finite_source_uniform_gould94_direct',
+                       'finite_source_ld_yoo04', 'finite_source_ld_yoo04_direct']
+        else:
+            methods = ['point_source', 'point_source_vectorized']
+
+        return all([method.lower() in methods for method in self._get_methods_used(time)])
+
+    def _get_methods_used(self, time):
+        """
+        Get the set of magnification methods that are used for given epochs.
+        The ranges are treated the same way as in
+        :py:attr:`~MulensModel.magnificationcurve.MagnificationCurve.methods_indices`.
+        """
+        if self._methods is None:
+            return {self._default_magnification_method}
+
+        epochs = self._methods[0::2]
+        brackets = np.searchsorted(epochs, time)
+        used = set()
+        if np.any((brackets == 0) | (brackets >= len(epochs))):
+            used.add(self._default_magnification_method)
+        for (i, method) in enumerate(self._methods[1::2]):
+            if np.any(brackets == i + 1):
+                used.add(method)
+
+        return used
+
+    def _get_parameters_batch(self, parameters, parameter_names):
+        """
+        Get :py:class:`~MulensModel.modelparameters.ModelParameters` in which
+        the values of given parameters are arrays of shape (M, 1). Hence,
+        the quantities calculated for N epochs have shape (M, N).
+
+        The arrays are written directly to the dictionary of parameters,
+        i.e., the setters of ModelParameters are not called. It is safe
+        because the values were checked in _parse_parameters_batch() and
+        the returned object is used only internally for a single call.
+        """
+        parameters_batch = ModelParameters(dict(self.parameters.parameters))
+        for (i, name) in enumerate(parameter_names):
+            if name not in parameters_batch.parameters:
+                raise KeyError('Parameter {:} is not defined in this model: {:}'.format(name, self.parameters))
+            parameters_batch.parameters[name] = parameters[:, i:i+1]
+
+        return parameters_batch
+
+    def _get_magnification_batch(self, time, parameters, parameter_names, satellite_skycoord, gamma):
+        """
+        Calculate magnification for many parameters using array operations.
+        """
+        parameters_batch = self._get_parameters_batch(parameters, parameter_names)
+        if self.n_lenses == 1:
+            curve = self.get_magnification_curve(time, satellite_skycoord, gamma)
+            curve.parameters = parameters_batch
+            magnification = curve.get_magnification()
+            return magnification * np.ones((len(parameters), 1))
+
+        trajectory = Trajectory(
+            time, parameters=parameters_batch, parallax=self._parallax, coords=self._coords,
+            satellite_skycoord=satellite_skycoord)
+        shape = (len(parameters), len(time))
+        # All walkers and epochs are combined in a single vector.
+        parameters_flat = ModelParameters(dict(self.parameters.parameters))
+        for name in ['s', 'q']:
+            parameters_flat.parameters[name] = np.broadcast_to(parameters_batch.parameters[name], shape).ravel()
+        trajectory_flat = Trajectory(
+            parameters=parameters_flat, x=np.broadcast_to(trajectory.x, shape).ravel(),
+            y=np.broadcast_to(trajectory.y, shape).ravel())
+        binary_lens = BinaryLensPointSourceVectorizedMagnification(trajectory=trajectory_flat)
+
+        return binary_lens.get_magnification().reshape(shape)
+
+    def _get_magnification_batch_loop(self, time, parameters, parameter_names, satellite_skycoord, gamma):
+        """
+        Calculate magnification for many parameters one after another.
+        Parameters of the model are restored at the end.
+        """
+        original = [self.parameters.parameters[name] for name in parameter_names]
+        magnification = np.zeros((len(parameters), len(time)))
+        try:
+            for (i, values) in enumerate(parameters):
+                for (name, value) in zip(parameter_names, values):
+                    setattr(self.parameters, name, value)
+                magnification[i] = self._get_magnification(time, satellite_skycoord, gamma, None, None)
+        finally:
+            for (name, value) in zip(parameter_names, original):
+                setattr(self.parameters, name, value)
+
+        return magnification
+
     def get_magnification_curve(self, time, satellite_skycoord, gamma):
         """
         Create a :py:class:`~MulensModel.magnificationcurve.MagnificationCurve`
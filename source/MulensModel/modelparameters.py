@@ -44,6 +44,8 @@ class ModelParameters(object):
             raise TypeError('ModelParameters must be initialized with dict as a parameter\ne.g., '
                             "ModelParameters({'t_0': 2456789.0, 'u_0': 0.123, 't_E': 23.45})")
 
+        self._xallarap_orbit = None
+        self._xallarap_orbit_key = None
         self._count_sources(parameters.keys())
         self._count_lenses(parameters.keys())
         self._set_type(parameters.keys())
@@ -53,6 +55,7 @@ class ModelParameters(object):
             self._check_valid_combination_1_source(parameters.keys())
             if self._type['Cassan08']:
                 self._uniform_caustic = None
+                self._uniform_caustic_s_q = None
                 self._standard_parameters = None
 
             if self.is_xallarap:
@@ -110,12 +113,33 @@ class ModelParameters(object):
             parameters = self.parameters
         t_0_xi = parameters.get('t_0_xi', parameters['t_0'])
 
+        orbit = self._get_xallarap_orbit(parameters)
+        return orbit.get_reference_plane_position(np.array([t_0_xi]))
+
+    def _get_xallarap_orbit(self, parameters=None):
+        """
+        Get xallarap Orbit object. The object is remembered and re-created
+        only if the orbital parameters or t_0_xi changed, i.e., changes of
+        other parameters do not require new Orbit.
+
+        Returns :
+            orbit: :py:class:`~MulensModel.orbits.orbit.OrbitCircular` or
+            :py:class:`~MulensModel.orbits.orbit.OrbitEccentric`
+        """
+        if parameters is None:
+            parameters = self.parameters
+        t_0_xi = parameters.get('t_0_xi', parameters['t_0'])
+
         zip_ = parameters.items()
         orbit_parameters = {key[3:]: value
                             for (key, value) in zip_ if key[:3] == "xi_"}
         orbit_parameters['epoch_reference'] = t_0_xi
-        orbit = Orbit(**orbit_parameters)
-        return orbit.get_reference_plane_position([t_0_xi])
+        key = tuple(sorted(orbit_parameters.items()))
+        if key != self._xallarap_orbit_key:
+            self._xallarap_orbit = Orbit(**orbit_parameters)
+            self._xallarap_orbit_key = key
+
+        return self._xallarap_orbit
 
     def __getattr__(self, item):
         (head, end) = self._split_parameter_name(item)
@@ -126,6 +150,19 @@ class ModelParameters(object):
         else:
             return object.__getattribute__(self, item)
 
+    def __getstate__(self):
+        """
+        Only parameters and settings are pickled. The table of
+        UniformCausticSampling is re-created (or read from the class-level
+        cache) when it is needed for the first time.
+        """
+        state = self.__dict__.copy()
+        if '_uniform_caustic' in state:
+            state['_uniform_caustic'] = None
+            state['_uniform_caustic_s_q'] = None
+            state['_standard_parameters'] = None
+        return state
+
     def _split_parameter_name(self, parameter):
         """
         Split ABC_DEF_n into ABC_DEF (str) and n (int). For parameters like t_0 or rho, n is None.
@@ -769,6 +806,8 @@ class ModelParameters(object):
         Note that pi_E_N and pi_E_E are changed separately.
         """
         if self.n_sources == 1:
+            if self.is_xallarap and parameter.startswith('xi_'):
+                self._xallarap_reference_position = None
             return
 
         for i in range(self.n_sources):
@@ -796,12 +835,14 @@ class ModelParameters(object):
         """
         Sets self._uniform_caustic if that is required.
         Also resets self._standard_parameters.
+        Tables of UniformCausticSampling are cached at class level,
+        hence, new ModelParameters with the same (s, q) do not repeat
+        the integration.
         """
-        recalculate = (self._uniform_caustic is None or
-                       self.s != self._uniform_caustic.s or
-                       self.q != self._uniform_caustic.q)
-        if recalculate:
+        s_q = (self.s, self.q)
+        if self._uniform_caustic is None or s_q != self._uniform_caustic_s_q:
             self._uniform_caustic = UniformCausticSampling(s=self.s, q=self.q)
+            self._uniform_caustic_s_q = s_q
             self._standard_parameters = None
 
     def _get_standard_parameters_from_Cassan08(self):
@@ -1487,8 +1528,36 @@ class ModelParameters(object):
         the source position along the orbit in order to calculate the shift
         caused by xallarap.
         """
+        if self._xallarap_reference_position is None:
+            self._xallarap_reference_position = self._get_xallarap_position()
+
         return self._xallarap_reference_position
 
+    @property
+    def xallarap_orbit(self):
+        """
+        :py:class:`~MulensModel.orbits.orbit.OrbitCircular` or
+        :py:class:`~MulensModel.orbits.orbit.OrbitEccentric`
+
+        Orbit of the first source used in xallarap calculations. The object
+        is remembered and re-created only if xi_* parameters or
+        :py:attr:`~t_0_xi` change.
+        """
+        return self._get_xallarap_orbit()
+
+    @property
+    def xallarap_orbit_key(self):
+        """
+        *tuple*
+
+        Sorted pairs of names and values of parameters that define
+        :py:attr:`~xallarap_orbit`. The tuple changes whenever the orbit
+        is re-created, hence, it can be used as a key for caching results
+        that depend only on the orbit.
+        """
+        self._get_xallarap_orbit()
+        return self._xallarap_orbit_key
+
     @property
     def t_0_1(self):
         """
@@ -29,6 +29,9 @@ class _OrbitAbstract(object):
     """
     Abstract class for orbits.
     """
+    _anomaly_tolerance = 1.e-12
+    _max_anomaly_iterations = 20
+
     def _check_circular_orbit_parameters(self, semimajor_axis):
         """
         Check if period and semimajor axis make physical sense.
@@ -137,25 +140,43 @@ class _OrbitAbstract(object):
     def _get_eccentric_anomaly_from_normalized_mean_anomaly(self,
                                                             mean_anomaly):
         """
-        Turn mean anomaly in range (-pi, pi) into eccentric anomaly
-        """
-        anomaly = mean_anomaly + 0.
-        if self._eccentricity > 0.95:  # This limit was manually found.
-            anomaly = np.pi * np.sign(mean_anomaly)
-        for _ in range(5):
-            anomaly += self._get_anomaly_correction(anomaly, mean_anomaly)
-        return anomaly
+        Turn mean anomaly in range (-pi, pi) into eccentric anomaly.
+        The starting value is E = M + 0.85 * e * sign(M), which works for
+        all eccentricities (Danby 1987, Celest. Mech. 40, 303).
+        Iterations are done only for epochs for which the residual of
+        Kepler's equation is above *_anomaly_tolerance*; for other epochs
+        the last correction gives the result at machine precision.
+        """
+        mean_anomaly = np.asarray(mean_anomaly, dtype=float)
+        anomaly = mean_anomaly + 0.85 * self._eccentricity * np.sign(mean_anomaly)
+        (anomaly_flat, mean_anomaly_flat) = (anomaly.reshape(-1), mean_anomaly.reshape(-1))
+        indexes = np.arange(anomaly_flat.size)
+        for _ in range(self._max_anomaly_iterations):
+            (residual, correction) = self._get_anomaly_correction(anomaly_flat[indexes], mean_anomaly_flat[indexes])
+            anomaly_flat[indexes] += correction
+            indexes = indexes[np.abs(residual) >= self._anomaly_tolerance]
+            if indexes.size == 0:
+                break
+
+        return anomaly_flat.reshape(anomaly.shape)[()]
 
     def _get_anomaly_correction(self, anomaly, mean_anomaly):
         """
         Calculations needed to solve Kepler's equation.
-        We use Newton's method.
+        We use the method with quartic convergence from Danby (1987),
+        i.e., Newton's method with the next two terms of Taylor series.
         The input anomaly is current estimate of eccentric anomaly.
+        Returns residual of Kepler's equation and correction of anomaly.
         """
-        numerator = (
-            anomaly - self._eccentricity * np.sin(anomaly) - mean_anomaly)
-        denominator = 1. - self._eccentricity * np.cos(anomaly)
-        return -numerator / denominator
+        e_sin = self._eccentricity * np.sin(anomaly)
+        e_cos = self._eccentricity * np.cos(anomaly)
+        residual = anomaly - e_sin - mean_anomaly
+        derivative = 1. - e_cos
+
+        delta_1 = -residual / derivative
+        delta_2 = -residual / (derivative + 0.5 * delta_1 * e_sin)
+        delta_3 = -residual / (derivative + 0.5 * delta_2 * e_sin + delta_2**2 * e_cos / 6.)
+        return (residual, delta_3)
 
 
 class OrbitCircular(_OrbitAbstract):
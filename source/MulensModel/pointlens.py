@@ -1,10 +1,8 @@
 import warnings
 import numpy as np
-from math import sin, cos, sqrt, log10
 from scipy import integrate
-from scipy.special import ellipk, ellipe
+from scipy.special import ellipk, ellipkm1, ellipe
 # These are complete elliptic integrals of the first and the second kind.
-from sympy.functions.special.elliptic_integrals import elliptic_pi as ellip3
 
 import MulensModel as mm
 
@@ -60,6 +58,44 @@ class _AbstractMagnification(object):
         """
         raise NotImplementedError("Method not implemented in abstract class")
 
+    def get_d_A_d_params(self, parameters):
+        """
+        Calculate d A / d parameters.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        raise NotImplementedError(
+            "Derivatives of magnification are not implemented for " + self.__class__.__name__)
+
+    def get_magnification_and_d_A_d_params(self, parameters):
+        """
+        Calculate the magnification and d A / d parameters. Classes that
+        share intermediate results between these calculations overwrite
+        this method.
+
+        Parameters :
+            parameters: *list*
+                List of the parameters to take derivatives with respect to.
+
+        Returns :
+            magnification: *np.ndarray*
+                The magnification for each epoch.
+
+            dA_dparam: *dict*
+                Keys are parameter names from *parameters* argument above.
+                Values are the partial derivatives for that parameter
+                evaluated at each epoch.
+        """
+        return (self.get_magnification(), self.get_d_A_d_params(parameters))
+
     @property
     def magnification(self):
         """
@@ -120,7 +156,10 @@ class _PointLensMagnification(_AbstractMagnification):
         d_u_d_params = self.get_d_u_d_params(parameters)
         d_A_d_u = self.get_d_A_d_u()
         for key in parameters:
-            d_A_d_params[key] = d_A_d_u * d_u_d_params[key]
+            if key == 'rho':
+                d_A_d_params[key] = self.get_d_A_d_rho()
+            else:
+                d_A_d_params[key] = d_A_d_u * d_u_d_params[key]
 
         return d_A_d_params
 
@@ -138,42 +177,10 @@ class _PointLensMagnification(_AbstractMagnification):
                 Values are the partial derivatives for that parameter
                 evaluated at each epoch.
         """
-        # Setup
-        d_u_d_params = {param: 0 for param in parameters}
-        as_dict = self.trajectory.parameters.as_dict()
-
-        # Calculate derivatives
-        d_u_d_x = self.trajectory.x / self.u_
-        d_u_d_y = self.trajectory.y / self.u_
-        dt = self.trajectory.times - as_dict['t_0']
-
-        # Exactly 2 out of (u_0, t_E, t_eff) must be defined and gradient depends on which ones are defined.
-        t_E = self.trajectory.parameters.t_E
-        t_eff = self.trajectory.parameters.t_eff
-        if 't_eff' not in as_dict:
-            d_u_d_params['t_0'] = -d_u_d_x / t_E
-            d_u_d_params['u_0'] = d_u_d_y
-            d_u_d_params['t_E'] = d_u_d_x * -dt / t_E**2
-        elif 't_E' not in as_dict:
-            d_u_d_params['t_0'] = -d_u_d_x * as_dict['u_0'] / t_eff
-            d_u_d_params['u_0'] = (d_u_d_y + d_u_d_x * dt / t_eff)
-            d_u_d_params['t_eff'] = (d_u_d_x * -dt * as_dict['u_0'] / t_eff**2)
-        elif 'u_0' not in as_dict:
-            d_u_d_params['t_0'] = -d_u_d_x / t_E
-            d_u_d_params['t_E'] = (d_u_d_x * dt - d_u_d_y * t_eff) / t_E**2
-            d_u_d_params['t_eff'] = d_u_d_y / t_E
-        else:
-            raise KeyError(
-                'Something is wrong with ModelParameters in ' +
-                'FitData.calculate_chi2_gradient():\n', as_dict)
-
-        # Below we deal with parallax only.
-        if 'pi_E_N' in parameters or 'pi_E_E' in parameters:
-            delta_N = self.trajectory.parallax_delta_N_E['N']
-            delta_E = self.trajectory.parallax_delta_N_E['E']
-
-            d_u_d_params['pi_E_N'] = d_u_d_x * delta_N + d_u_d_y * delta_E
-            d_u_d_params['pi_E_E'] = d_u_d_x * delta_E - d_u_d_y * delta_N
+        d_xy_d_params = self.trajectory._get_d_xy_d_params(parameters)
+        d_u_d_params = {}
+        for (key, (d_x, d_y)) in d_xy_d_params.items():
+            d_u_d_params[key] = (self.trajectory.x * d_x + self.trajectory.y * d_y) / self.u_
 
         return d_u_d_params
 
@@ -270,6 +277,19 @@ class PointSourcePointLensMagnification(_PointLensMagnification):
         """
         return self._get_d_A_d_u_PSPL()
 
+    def get_d_A_d_rho(self):
+        """
+        Derivative of point-source magnification with respect to rho,
+        i.e., 0 for each epoch.
+
+        No parameters.
+
+        Returns :
+            dA_drho: *np.ndarray*
+                Derivative dA/drho evaluated at each epoch.
+        """
+        return np.zeros(np.shape(self.u_2))
+
 
 class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
     """
@@ -284,9 +304,14 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
             :py:class:`~MulensModel.modelparameters.ModelParameters`
 
         direct: *bool*
-            Use direct calculation (slow) instead of interpolation. Default is
+            Use direct calculation instead of interpolation. Default is
             False.
     """
+    _z_series = 10.
+    # Coefficients of B_0(z) series in 1/z^2, i.e., 1 + 1/(8 z^2) + ...
+    _B_0_series = np.array([184041. / 33554432., 7623. / 1048576., 1323. / 131072., 245. / 16384.,
+                            25. / 1024., 3. / 64., 1. / 8., 1.])
+
     def __init__(self, direct=False, **kwargs):
         super().__init__(**kwargs)
 
@@ -296,6 +321,7 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
         self._z = None
         self._b0 = None
         self._db0 = None
+        self._B0B1_interpolated = None
 
     def get_d_A_d_u(self):
         """
@@ -346,53 +372,30 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
         Yoo J. et al. 2004 ApJ 603, 139 "OGLE-2003-BLG-262: Finite-Source
         Effects from a Point-Mass Lens"
         https://ui.adsabs.harvard.edu/abs/2004ApJ...603..139Y/abstract
+
+        For z > 1 the integral is reduced to complete elliptic integrals
+        using the reciprocal-modulus transformation and for large z
+        the series in 1/z^2 is used.
         """
         if mask is not None:
             z = self.z_[mask]
         else:
             z = self.z_
 
-        out = 4. * z / np.pi
-
-        def function(x):
-            return (1. - value ** 2 * sin(x) ** 2) ** .5
+        out = np.empty(z.shape)
+        inside = (z <= 1.)
+        far = (z > self._z_series)
+        middle = np.logical_not(inside | far)
 
-        for (i, value) in enumerate(z):
-            if value < 1.:
-                out[i] *= ellipe(value * value)
-            else:
-                out[i] *= integrate.quad(function, 0.,
-                                         np.arcsin(1. / value))[0]
-        return out
+        z_2 = z[inside]**2
+        out[inside] = 4. * z[inside] / np.pi * ellipe(z_2)
 
-    def get_d_A_d_params(self, parameters):
-        """
-        Return the gradient of the magnification with respect to the
-        FSPL parameters for each epoch.
+        z_2 = z[middle]**2
+        out[middle] = 4. / np.pi * (z_2 * ellipe(1. / z_2) - (z_2 - 1.) * ellipk(1. / z_2))
 
-        Parameters :
-            parameters: *list*
-                List of the parameters to take derivatives with respect to.
+        out[far] = np.polyval(self._B_0_series, 1. / z[far]**2)
 
-        Returns:
-            dA_dparams: *dict*
-                Keys are parameter names from *parameters* argument above.
-                Values are the partial derivatives for that parameter
-                evaluated at each epoch.
-        """
-
-        d_u_d_params = super().get_d_u_d_params(parameters)
-
-        d_A_d_u = self.get_d_A_d_u()
-
-        d_A_d_params = {}
-        for key in parameters:
-            if key == 'rho':
-                d_A_d_params[key] = self.get_d_A_d_rho()
-            else:
-                d_A_d_params[key] = d_u_d_params[key] * d_A_d_u
-
-        return d_A_d_params
+        return out
 
     def get_d_A_d_rho(self):
         """
@@ -406,8 +409,7 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
                 Derivative dA/drho evaluated at each epoch.
 
         """
-        d_A_d_rho = self.pspl_magnification
-        d_A_d_rho *= -self.u_ * self.db0 / self.trajectory.parameters.rho**2
+        d_A_d_rho = -self.pspl_magnification * self.u_ * self.db0 / self.trajectory.parameters.rho**2
 
         return d_A_d_rho
 
@@ -424,6 +426,19 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
 
         return self._z
 
+    def _get_B0B1_interpolated(self):
+        """
+        Mask of epochs for which interpolation is allowed and
+        interpolated values of all B0B1 functions for these epochs.
+        All functions are interpolated at once and remembered.
+        """
+        if self._B0B1_interpolated is None:
+            mask = self._B0B1_data.get_interpolation_mask(self.z_)
+            values = self._B0B1_data.interpolate(self.z_[mask])
+            self._B0B1_interpolated = (mask, values)
+
+        return self._B0B1_interpolated
+
     @property
     def b0(self):
         """
@@ -435,11 +450,11 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
             if self.direct:
                 mask = np.zeros_like(self.z_, dtype=bool)
             else:
-                mask = self._B0B1_data.get_interpolation_mask(self.z_)
+                (mask, values) = self._get_B0B1_interpolated()
 
             self._b0 = 0. * self.z_
             if np.any(mask):  # Here we use interpolation.
-                self._b0[mask] = self._B0B1_data.interpolate_B0(self.z_[mask])
+                self._b0[mask] = values[:, 0]
 
             mask = np.logical_not(mask)
             if np.any(mask):  # Here we use direct calculation.
@@ -459,12 +474,11 @@ class FiniteSourceUniformGould94Magnification(_PointLensMagnification):
                 raise NotImplementedError(
                     'B0 derivatives not implemented for direct method.')
             else:
-                mask = self._B0B1_data.get_interpolation_mask(self.z_)
+                (mask, values) = self._get_B0B1_interpolated()
 
             self._db0 = 0. * self.z_
             if np.any(mask):  # Here we use interpolation.
-                self._db0[mask] = self._B0B1_data.interpolate_B0prime(
-                    self.z_[mask])
+                self._db0[mask] = values[:, 3]
 
         return self._db0
 
@@ -482,13 +496,16 @@ class FiniteSourceLDYoo04Magnification(FiniteSourceUniformGould94Magnification):
             :py:class:`~MulensModel.modelparameters.ModelParameters`
 
         direct: *bool*
-            Use direct calculation (slow) instead of interpolation. Default is
+            Use direct calculation instead of interpolation. Default is
             False.
 
         gamma: *float*
             The limb-darkening coefficient. See also
             :py:class:`~MulensModel.limbdarkeningcoeffs.LimbDarkeningCoeffs`
     """
+    # Coefficients of B_1(z) series in 1/z^2, i.e., 1/(40 z^2) + ...
+    _B_1_series = np.array([8614749. / 2852126720., 258951. / 68157440., 92421. / 18743296., 3605. / 540672.,
+                            205. / 21504., 33. / 2240., 1. / 40., 0.])
 
     def __init__(self, gamma=None, **kwargs):
         super().__init__(**kwargs)
@@ -559,31 +576,31 @@ class FiniteSourceLDYoo04Magnification(FiniteSourceUniformGould94Magnification):
         Effects from a Point-Mass Lens"
         https://ui.adsabs.harvard.edu/abs/2004ApJ...603..139Y/abstract
 
+        The integral in W_1 is the potential of a disk with surface density
+        (1-r^2)^0.5 (the same as for Hertz contact pressure), which has
+        closed form. For large z the series in 1/z^2 is used.
         """
         if mask is not None:
             z = self.z_[mask]
+            b0 = self.b0[mask]
         else:
             z = self.z_
+            b0 = self.b0
 
-        def function(r, theta):
-            r_2 = r * r
-            val = (1. - r_2) / (r_2 + function.arg_2 + r * function.arg_3 * cos(theta))
-            return r * sqrt(val)
-
-        def lim_0(x): return 0
-        def lim_1(x): return 1
+        rho_W_1 = np.empty(z.shape)  # This equals rho * W_1().
+        inside = (z <= 1.)
+        z_2 = z[inside]**2
+        rho_W_1[inside] = np.pi * (2. - z_2) / 4.
+        outside = np.logical_not(inside)
+        z_2 = z[outside]**2
+        rho_W_1[outside] = 0.5 * ((2. - z_2) * np.arcsin(1. / z[outside]) + np.sqrt(z_2 - 1.))
 
-        rho_W_1 = 0. * z  # This equals rho * W_1().
-        for (i, zz) in enumerate(z):
-            function.arg_1 = zz
-            function.arg_2 = zz * zz
-            function.arg_3 = -2. * zz
-            rho_W_1[i] = integrate.dblquad(
-                function, 0., 2. * np.pi, lim_0, lim_1)[0]
+        out = b0 - 1.5 * z * rho_W_1
 
-        rho_W_1 /= np.pi
+        far = (z > self._z_series)
+        out[far] = np.polyval(self._B_1_series, 1. / z[far]**2)
 
-        return self.b0 - 1.5 * z * rho_W_1
+        return out
 
     @property
     def b1(self):
@@ -596,11 +613,11 @@ class FiniteSourceLDYoo04Magnification(FiniteSourceUniformGould94Magnification):
             if self.direct:
                 mask = np.zeros_like(self.z_, dtype=bool)
             else:
-                mask = self._B0B1_data.get_interpolation_mask(self.z_)
+                (mask, values) = self._get_B0B1_interpolated()
 
             self._b1 = 0. * self.z_
             if np.any(mask):  # Here we use interpolation.
-                self._b1[mask] = self._B0B1_data.interpolate_B1(self.z_[mask])
+                self._b1[mask] = values[:, 2]
 
             mask = np.logical_not(mask)
             if np.any(mask):  # Here we use direct calculation.
@@ -620,12 +637,11 @@ class FiniteSourceLDYoo04Magnification(FiniteSourceUniformGould94Magnification):
                 raise NotImplementedError(
                     'B0 derivatives not implemented for direct method.')
             else:
-                mask = self._B0B1_data.get_interpolation_mask(self.z_)
+                (mask, values) = self._get_B0B1_interpolated()
 
             self._db1 = 0. * self.z_
             if np.any(mask):  # Here we use interpolation.
-                self._db1[mask] = self._B0B1_data.interpolate_B1prime(
-                    self.z_[mask])
+                self._db1[mask] = values[:, 4]
 
         return self._db1
 
@@ -659,7 +675,8 @@ class FiniteSourceUniformWittMao94Magnification(_PointLensMagnification):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self._ellip_data = mm.EllipUtils()
+        self._d_A_d_u_and_rho = None
+        self._u_equal_rho_rtol = 1.e-12
 
     def get_magnification(self):
         """
@@ -670,107 +687,175 @@ class FiniteSourceUniformWittMao94Magnification(_PointLensMagnification):
                 The finite-source source magnification for each epoch.
 
         """
-        out = [self._get_magnification_WM94(u_) for u_ in self.u_]
-        self._magnification = np.array(out)
+        rho = float(self.trajectory.parameters.rho)
+        self._magnification = self._get_magnification_WM94(u=self.u_, rho=rho)
 
         return self._magnification
 
-    def _get_magnification_WM94(self, u):
+    def _get_magnification_WM94(self, u, rho):
         """
         Get point-lens finite-source magnification without LD.
+        Input *u* and *rho* can be *np.ndarrays* of any shapes that can be
+        broadcast together and the calculations are done for all of them
+        at once.
         """
-        rho = self.trajectory.parameters.rho
+        (u, rho) = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(rho, dtype=float))
+        magnification = np.empty(u.shape)
 
-        if u == rho:
-            u2 = u**2
+        equal = np.isclose(u, rho, rtol=self._u_equal_rho_rtol, atol=0.)
+        if np.any(equal):
+            u2 = u[equal]**2
             a = np.pi / 2. + np.arcsin((u2 - 1.) / (u2 + 1.))
-            return (2. / u + (1. + u2) * a / u2) / np.pi
-
-        a_1 = 0.5 * (u + rho) * (4. + (u - rho)**2)**.5 / rho**2
-        a_2 = -(u - rho) * (4. + 0.5 * (u**2 - rho**2))
-        a_2 /= (rho**2 * (4. + (u - rho)**2)**.5)
-        a_3 = 2. * (u - rho)**2 * (1. + rho**2)
-        a_3 /= (rho**2 * (u + rho) * (4. + (u - rho)**2)**.5)
+            magnification[equal] = (2. / u[equal] + (1. + u2) * a / u2) / np.pi
+
+        not_equal = np.logical_not(equal)
+        (u, rho) = (u[not_equal], rho[not_equal])
+        rho_2 = rho**2
+        u_minus_rho = u - rho
+        u_plus_rho = u + rho
+        sqrt_4_plus = np.sqrt(4. + u_minus_rho**2)
+
+        a_1 = 0.5 * u_plus_rho * sqrt_4_plus / rho_2
+        a_2 = -u_minus_rho * (4. + 0.5 * (u**2 - rho_2)) / (rho_2 * sqrt_4_plus)
+        a_3 = 2. * u_minus_rho**2 * (1. + rho_2) / (rho_2 * u_plus_rho * sqrt_4_plus)
+
+        n = 4. * u * rho / u_plus_rho**2
+        # WM94 under Eq. 9 are inconsistent with GR80, hence, x_1 is E and x_2 is K.
+        (_, _, x_2, x_1, x_3) = self._get_elliptic_integrals(n, u_minus_rho, u_plus_rho, sqrt_4_plus)
+
+        magnification[not_equal] = (a_1 * x_1 + a_2 * x_2 + a_3 * x_3) / np.pi
+
+        return magnification
+
+    def _get_elliptic_integrals(self, n, u_minus_rho, u_plus_rho, sqrt_4_plus):
+        """
+        Calculate complete elliptic integrals for WM94 equations. We use
+        k = 4 * n / (4 + (u - rho)^2), i.e., k^2 convention as all python
+        packages do. The integrals are not interpolated, because
+        the interpolation errors are multiplied by coefficients of
+        the order of 1/rho^2. The values of 1-n and 1-k are calculated
+        directly, so that the precision is kept for u close to rho.
+        Returns (1-n, 1-k, K(k), E(k), Pi(n, k)).
+        """
+        one_minus_n = (u_minus_rho / u_plus_rho)**2
+        one_minus_k = (4. * one_minus_n + u_minus_rho**2) / sqrt_4_plus**2
+        k = 1. - one_minus_k
+
+        ellip_k = ellipkm1(one_minus_k)
+        ellip_e = ellipe(k)
+        ellip_3 = mm.EllipUtils.ellip3(n, k, one_minus_n=one_minus_n, one_minus_k=one_minus_k)
+
+        return (one_minus_n, one_minus_k, ellip_k, ellip_e, ellip_3)
+
+    def _get_d_magnification_WM94(self, u, rho):
+        """
+        Get derivatives of point-lens finite-source magnification without
+        LD, i.e., of :py:func:`_get_magnification_WM94()`, with respect to
+        *u* and *rho*. The derivatives of the elliptic integrals are
+        expressed using the integrals themselves (DLMF 19.4.1-19.4.4),
+        hence, the cost is similar to the magnification calculation.
+        Returns (d A / d u, d A / d rho).
+
+        The derivatives diverge logarithmically for u = rho, hence, u is
+        shifted for epochs with u very close to rho. For u very close to 0,
+        the limit for u = 0 is used.
+        """
+        (u, rho) = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(rho, dtype=float))
+        shift = 1.e-4 * rho
+        close = (np.abs(u - rho) < shift)
+        u = np.where(close, np.where(u < rho, rho - shift, rho + shift), u)
+        d_A_d_u = np.zeros(u.shape)
+        d_A_d_rho = np.empty(u.shape)
+
+        small = (u < 1.e-6 * rho)
+        if np.any(small):
+            d_A_d_rho[small] = -4. / (rho[small]**2 * np.sqrt(rho[small]**2 + 4.))
+
+        not_small = np.logical_not(small)
+        (u, rho) = (u[not_small], rho[not_small])
+        rho_2 = rho**2
+        u_minus_rho = u - rho
+        u_plus_rho = u + rho
+        sqrt_4_plus = np.sqrt(4. + u_minus_rho**2)
+        factor = 4. + 0.5 * (u**2 - rho_2)
+
+        a_1 = 0.5 * u_plus_rho * sqrt_4_plus / rho_2
+        a_2 = -u_minus_rho * factor / (rho_2 * sqrt_4_plus)
+        a_3 = 2. * u_minus_rho**2 * (1. + rho_2) / (rho_2 * u_plus_rho * sqrt_4_plus)
+
+        n = 4. * u * rho / u_plus_rho**2
+        k = 4. * n / sqrt_4_plus**2
+
+        (one_minus_n, one_minus_k, ellip_k, ellip_e, ellip_3) = self._get_elliptic_integrals(
+            n, u_minus_rho, u_plus_rho, sqrt_4_plus)
+        d_K_d_k = (ellip_e - one_minus_k * ellip_k) / (2. * k * one_minus_k)
+        d_E_d_k = (ellip_e - ellip_k) / (2. * k)
+        d_3_d_n = (ellip_e + (k - n) * ellip_k / n + (n**2 - k) * ellip_3 / n) / (2. * (n - k) * one_minus_n)
+        d_3_d_k = (ellip_e / (k - 1.) + ellip_3) / (2. * (n - k))
+
+        out = []
+        for (d_u, d_rho) in [(1., 0.), (0., 1.)]:
+            d_minus = d_u - d_rho
+            d_plus = d_u + d_rho
+            d_sqrt = u_minus_rho * d_minus / sqrt_4_plus
+            d_rho_2 = 2. * rho * d_rho
+
+            d_a_1 = (0.5 * (d_plus * sqrt_4_plus + u_plus_rho * d_sqrt) - a_1 * d_rho_2) / rho_2
+            numerator = -d_minus * factor - u_minus_rho * (u * d_u - rho * d_rho)
+            d_a_2 = (numerator - a_2 * (d_rho_2 * sqrt_4_plus + rho_2 * d_sqrt)) / (rho_2 * sqrt_4_plus)
+            numerator = 4. * u_minus_rho * d_minus * (1. + rho_2) + 2. * u_minus_rho**2 * d_rho_2
+            denominator = rho_2 * u_plus_rho * sqrt_4_plus
+            d_denominator = (d_rho_2 * u_plus_rho * sqrt_4_plus + rho_2 * d_plus * sqrt_4_plus +
+                             rho_2 * u_plus_rho * d_sqrt)
+            d_a_3 = (numerator - a_3 * d_denominator) / denominator
+
+            d_n = 4. * (d_u * rho + u * d_rho) / u_plus_rho**2 - 2. * n * d_plus / u_plus_rho
+            d_k = (4. * d_n - 2. * k * sqrt_4_plus * d_sqrt) / sqrt_4_plus**2
+
+            derivative = (d_a_1 * ellip_e + a_1 * d_E_d_k * d_k + d_a_2 * ellip_k + a_2 * d_K_d_k * d_k +
+                          d_a_3 * ellip_3 + a_3 * (d_3_d_n * d_n + d_3_d_k * d_k))
+            out.append(derivative / np.pi)
+
+        d_A_d_u[not_small] = out[0]
+        d_A_d_rho[not_small] = out[1]
+
+        return (d_A_d_u, d_A_d_rho)
 
-        n = 4. * u * rho / (u + rho)**2
-        k = 4. * n / (4. + (u - rho)**2)
-        # We omit sqrt, because all python packages use k^2 convention.
-
-        x_1 = self._get_ellipk(k)
-        x_2 = self._get_ellipe(k)
-        x_3 = self._get_ellip3(n, k)
-        (x_1, x_2) = (x_2, x_1)  # WM94 under Eq. 9 are inconsistent with GR80.
-
-        return (a_1 * x_1 + a_2 * x_2 + a_3 * x_3) / np.pi
-
-    def _get_ellipk(self, k):
-        """
-        Get value of elliptic integral of the first kind.
-        Use interpolation if possible.
+    def get_d_A_d_u(self):
         """
-        x = log10(k)
-        condition_1 = (x >= self._ellip_data._interpolate_1_2_x_min)
-        condition_2 = (x <= self._ellip_data._interpolate_1_2_x_max)
-        if condition_1 and condition_2:
-            return self._ellip_data._interpolate_1(x)
+        Calculate dA/du for uniform-source--point-lens model.
 
-        return ellipk(k)
+        No parameters.
 
-    def _get_ellipe(self, k):
-        """
-        Get value of elliptic integral of the second kind.
-        Use interpolation if possible.
+        Returns :
+            dA_du: *np.ndarray*
+                Derivative dA/du evaluated at each epoch.
         """
-        x = log10(k)
-        condition_1 = (x >= self._ellip_data._interpolate_1_2_x_min)
-        condition_2 = (x <= self._ellip_data._interpolate_1_2_x_max)
-        if condition_1 and condition_2:
-            return self._ellip_data._interpolate_2(x)
-
-        return ellipe(k)
+        return self._get_d_A_d_u_and_rho()[0]
 
-    def _get_ellip3(self, n, k):
-        """
-        Get value of elliptic integral of the third kind.
-        Use interpolation if possible.
+    def get_d_A_d_rho(self):
         """
-        cond_1 = (n >= self._ellip_data._interpolate_3_min_x)
-        cond_2 = (n <= self._ellip_data._interpolate_3_max_x)
-        cond_3 = (k >= self._ellip_data._interpolate_3_min_y)
-        cond_4 = (k <= self._ellip_data._interpolate_3_max_y)
-
-        if cond_1 and cond_2 and cond_3 and cond_4:
-            return self._ellip_data._interpolate_3(n, k)[0]
-
-        return ellip3(n, k)
+        Return the derivative of the magnification with respect to rho
+        for each epoch.
 
-    def get_d_A_d_params(self, parameters):
-        """
-        Derivative calculations Not Implemented for WittMao94
-        """
-        raise NotImplementedError(
-            'Derivative calculations Not Implemented for WittMao94')
+        No parameters.
 
-    def get_d_u_d_params(self, parameters):
-        """
-        Derivative calculations Not Implemented for WittMao94
+        Returns :
+            dA_drho: *np.ndarray*
+                Derivative dA/drho evaluated at each epoch.
         """
-        raise NotImplementedError(
-            'Derivative calculations Not Implemented for WittMao94')
+        return self._get_d_A_d_u_and_rho()[1]
 
-    def get_d_A_d_u(self):
+    def _get_d_A_d_u_and_rho(self):
         """
-        Derivative calculations Not Implemented for WittMao94
+        Calculate dA/du and dA/drho for all epochs. Both are calculated at
+        once and remembered.
         """
-        raise NotImplementedError(
-            'Derivative calculations Not Implemented for WittMao94')
+        if self._d_A_d_u_and_rho is None:
+            rho = float(self.trajectory.parameters.rho)
+            self._d_A_d_u_and_rho = self._get_d_magnification_WM94(self.u_, rho)
 
-    def get_d_A_d_rho(self):
-        """
-        Derivative calculations Not Implemented for WittMao94
-        """
-        raise NotImplementedError(
-            'Derivative calculations Not Implemented for WittMao94')
+        return self._d_A_d_u_and_rho
 
 
 class FiniteSourceLDWittMao94Magnification(FiniteSourceUniformWittMao94Magnification):
@@ -819,34 +904,58 @@ class FiniteSourceLDWittMao94Magnification(FiniteSourceUniformWittMao94Magnifica
                 The finite-source source magnification for each epoch.
 
         """
-        out = [self._get_magnification_WM94_B18(u_) for u_ in self.u_]
-        self._magnification = np.array(out)
+        self._magnification = self._get_magnification_WM94_B18(self.u_)
         return self._magnification
 
     def _get_magnification_WM94_B18(self, u):
         """
         Get point-lens finite-source magnification with LD using
         Witt & Mao 1994 approach and equations 16-19 from Bozza et al. 2018.
+        All epochs and all annuli are calculated at once.
         """
-        n_annuli = self.n_annuli + 1  # It's easier to have r=0 ring as well.
-        annuli = np.linspace(0, 1., n_annuli)
-        r2 = annuli**2
+        u = np.atleast_1d(u)
+        annuli = self._get_annuli()
+        radii = annuli[1:] * self.trajectory.parameters.rho
+        magnification = self._get_magnification_WM94(u=u[:, np.newaxis], rho=radii[np.newaxis, :])
 
-        magnification = np.zeros(n_annuli)
-        for (i, a) in enumerate(annuli * self.trajectory.parameters.rho):
-            if i == 0:
-                continue
+        return self._sum_annuli(magnification, annuli)
 
-            magnification[i] = self._get_magnification_WM94(u=u, rho=a)
+    def _get_annuli(self):
+        """
+        Radii of annuli relative to rho, including r=0.
+        """
+        n_annuli = self.n_annuli + 1  # It's easier to have r=0 ring as well.
+        return np.linspace(0, 1., n_annuli)
 
+    def _sum_annuli(self, values, annuli):
+        """
+        Combine values (or derivatives) of uniform-source magnification
+        for annuli (excluding r=0) using equations 16-19 from Bozza et al.
+        2018. The input array has shape (N, n_annuli).
+        """
+        r2 = annuli**2
         cumulative_profile = self.gamma + (1. - self.gamma) * r2 - self.gamma * (1. - r2)**1.5
         d_cumulative_profile = cumulative_profile[1:] - cumulative_profile[:-1]
         d_r2 = r2[1:] - r2[:-1]
-        temp = magnification * r2
-        d_mag_r2 = temp[1:] - temp[:-1]
-        out = np.sum(d_mag_r2 * d_cumulative_profile / d_r2)
+        temp = np.zeros((len(values), len(annuli)))
+        temp[:, 1:] = values * r2[1:]
+        d_mag_r2 = temp[:, 1:] - temp[:, :-1]
 
-        return out
+        return np.sum(d_mag_r2 * d_cumulative_profile / d_r2, axis=1)
+
+    def _get_d_A_d_u_and_rho(self):
+        """
+        Calculate dA/du and dA/drho for all epochs using the derivatives
+        for each annulus. Both are calculated at once and remembered.
+        """
+        if self._d_A_d_u_and_rho is None:
+            u = np.atleast_1d(self.u_)
+            annuli = self._get_annuli()
+            radii = annuli[1:] * self.trajectory.parameters.rho
+            (d_u, d_rho) = self._get_d_magnification_WM94(u=u[:, np.newaxis], rho=radii[np.newaxis, :])
+            self._d_A_d_u_and_rho = (self._sum_annuli(d_u, annuli), self._sum_annuli(d_rho * annuli[1:], annuli))
+
+        return self._d_A_d_u_and_rho
 
     @property
     def gamma(self):
@@ -880,6 +989,8 @@ class FiniteSourceUniformLee09Magnification(_PointLensMagnification):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.n = 100
+        self._simpson_weights = {}
+        self._derivatives = None
 
     def get_magnification(self):
         """
@@ -889,64 +1000,107 @@ class FiniteSourceUniformLee09Magnification(_PointLensMagnification):
             magnification: *np.array*
                 The finite source magnification.
         """
+        if self.n % 2 != 0:
+            raise ValueError('internal error - odd number expected')
 
         u = self.u_
-
         mag = np.zeros_like(u)
 
-        for i in range(len(u)):
-            if u[i] > self.trajectory.parameters.rho:
-                mag[i] = self._noLD_Lee09_large_u(u[i])
-            else:
-                mag[i] = self._noLD_Lee09_small_u(u[i])
+        large = (u > self.trajectory.parameters.rho)
+        if np.any(large):
+            mag[large] = self._noLD_Lee09_large_u(u[large])
+        small = np.logical_not(large)
+        if np.any(small):
+            mag[small] = self._noLD_Lee09_small_u(u[small])
 
         self._magnification = mag
 
         return self._magnification
 
-    def _u_1_Lee09(self, theta, u, theta_max=None):
+    def get_d_A_d_u(self):
+        """
+        Calculate dA/du for uniform-source--point-lens model.
+        The derivatives are calculated analytically using
+        :py:class:`FiniteSourceUniformWittMao94Magnification`.
+
+        No parameters.
+
+        Returns :
+            dA_du: *np.ndarray*
+                Derivative dA/du evaluated at each epoch.
+        """
+        return self._get_derivatives_object().get_d_A_d_u()
+
+    def get_d_A_d_rho(self):
+        """
+        Return the derivative of the magnification with respect to rho
+        for each epoch. The derivatives are calculated analytically using
+        :py:class:`FiniteSourceUniformWittMao94Magnification`.
+
+        No parameters.
+
+        Returns :
+            dA_drho: *np.ndarray*
+                Derivative dA/drho evaluated at each epoch.
+        """
+        return self._get_derivatives_object().get_d_A_d_rho()
+
+    def _get_derivatives_object(self):
+        """
+        Object that calculates derivatives of magnification for the same
+        trajectory.
+        """
+        if self._derivatives is None:
+            self._derivatives = FiniteSourceUniformWittMao94Magnification(trajectory=self.trajectory)
+
+        return self._derivatives
+
+    def _get_simpson_weights(self, n_points):
+        """
+        Weights of Simpson's rule for *n_points* equally spaced points
+        and unit spacing. The weights are cached for each *n_points*.
+        """
+        if n_points not in self._simpson_weights:
+            identity = np.identity(n_points)
+            try:
+                weights = integrate.simpson(identity, dx=1., axis=-1)
+            except AttributeError:
+                weights = integrate.simps(identity, dx=1., axis=-1)
+            self._simpson_weights[n_points] = weights
+
+        return self._simpson_weights[n_points]
+
+    def _u_1_Lee09(self, theta, u):
         """
         Calculates Equation 4 of Lee et al. 2009.
-        The u variable is float, theta is np.ndarray.
+        The u and theta variables are np.ndarrays that can be broadcast
+        together. All theta values have to be below theta_max.
         """
         rho = self.trajectory.parameters.rho
 
-        if u <= rho:
-            return 0. * theta
-
-        out = np.zeros_like(theta)
-        mask = (theta <= theta_max)
-        if np.any(mask):
-            ucos = u * np.cos(theta[mask])
-            out[mask] = ucos - np.sqrt(rho * rho - u * u + ucos**2)
+        ucos = u * np.cos(theta)
+        out = ucos - np.sqrt(np.maximum(rho * rho - u * u + ucos**2, 0.))
 
-        return out
+        return np.where(u > rho, out, 0.)
 
-    def _u_2_Lee09(self, theta, u, theta_max=None):
+    def _u_2_Lee09(self, theta, u):
         """
         Calculates Equation 5 of Lee et al. 2009.
-        The u variable is float, theta is np.ndarray.
+        The u and theta variables are np.ndarrays that can be broadcast
+        together. All theta values have to be below theta_max.
         """
         rho = self.trajectory.parameters.rho
 
-        if u <= rho:
-            ucos = u * np.cos(theta)
-            return ucos + np.sqrt(rho * rho - u * u + ucos**2)
-        else:
-            out = np.zeros_like(theta)
-            mask = (theta <= theta_max)
-            if np.any(mask):
-                ucos = u * np.cos(theta[mask])
-                out[mask] = ucos + np.sqrt(rho * rho - u * u + ucos**2)
+        ucos = u * np.cos(theta)
 
-            return out
+        return ucos + np.sqrt(np.maximum(rho * rho - u * u + ucos**2, 0.))
 
-    def _f_Lee09(self, theta, u, theta_max=None):
+    def _f_Lee09(self, theta, u):
         """
         Calculates equation in text between Eq. 7 and 8 from Lee et al. 2009.
         """
-        u_1_ = self._u_1_Lee09(theta, u, theta_max)
-        u_2_ = self._u_2_Lee09(theta, u, theta_max)
+        u_1_ = self._u_1_Lee09(theta, u)
+        u_2_ = self._u_2_Lee09(theta, u)
 
         f_u_1 = u_1_ * np.sqrt(u_1_**2 + 4.)
         f_u_2 = u_2_ * np.sqrt(u_2_**2 + 4.)
@@ -956,42 +1110,31 @@ class FiniteSourceUniformLee09Magnification(_PointLensMagnification):
     def _noLD_Lee09_large_u(self, u):
         """
         Calculates Equation 7 from Lee et al. 2009 in case u > rho.
+        Input u is np.ndarray and all epochs are calculated at once.
         """
         rho = self.trajectory.parameters.rho
         n = self.n
 
-        if n % 2 != 0:
-            raise ValueError('internal error - odd number expected')
-
-        theta_max = np.arcsin(rho / u)
-        out = (u + rho) * sqrt((u + rho)**2 + 4.) - (u - rho) * sqrt((u - rho)**2 + 4.)
-        vector_1 = np.arange(1., (n / 2 - 1.) + 1)
-        vector_2 = np.arange(1., n / 2 + 1)
-        arg_1 = 2. * vector_1 * theta_max / n
-        arg_2 = (2. * vector_2 - 1.) * theta_max / n
-        out += 2. * np.sum(self._f_Lee09(arg_1, u, theta_max))
-        out += 4. * np.sum(self._f_Lee09(arg_2, u, theta_max))
-        out *= theta_max / (3. * np.pi * rho * rho * n)
+        theta_max = np.arcsin(rho / u)[:, np.newaxis]
+        theta = theta_max * np.linspace(0., 1., n + 1)
+        values = self._f_Lee09(theta, u[:, np.newaxis])
+        out = np.sum(values * self._get_simpson_weights(n + 1), axis=1)
+        out *= theta_max[:, 0] / (np.pi * rho * rho * n)
 
         return out
 
     def _noLD_Lee09_small_u(self, u):
         """
         Calculates Equation 7 from Lee et al. 2009 in case u < rho.
+        Input u is np.ndarray and all epochs are calculated at once.
         """
         rho = self.trajectory.parameters.rho
         n = self.n
 
-        if n % 2 != 0:
-            raise ValueError('internal error - odd number expected')
-        out = (u + rho) * sqrt((u + rho)**2 + 4.) - (u - rho) * sqrt((u - rho)**2 + 4.)
-        vector_1 = np.arange(1., (n - 1.) + 1)
-        vector_2 = np.arange(1., n + 1)
-        arg_1 = vector_1 * np.pi / n
-        arg_2 = (2. * vector_2 - 1.) * np.pi / (2. * n)
-        out += 2. * np.sum(self._f_Lee09(arg_1, u, rho))
-        out += 4. * np.sum(self._f_Lee09(arg_2, u, rho))
-        out /= 2. * 3. * n * rho * rho
+        theta = np.linspace(0., np.pi, 2 * n + 1)
+        values = self._f_Lee09(theta, u[:, np.newaxis])
+        out = np.sum(values * self._get_simpson_weights(2 * n + 1), axis=1)
+        out /= 2. * n * rho * rho
 
         return out
 
@@ -1024,6 +1167,17 @@ class FiniteSourceLDLee09Magnification(FiniteSourceUniformLee09Magnification):
         self._gamma = gamma
         self.n_theta = 90
         self.n_u = 1000
+        self._max_grid_size = 250000  # Limits memory used by the 3D grid.
+
+    def _get_derivatives_object(self):
+        """
+        Object that calculates derivatives of magnification for the same
+        trajectory, i.e., :py:class:`FiniteSourceLDWittMao94Magnification`.
+        """
+        if self._derivatives is None:
+            self._derivatives = FiniteSourceLDWittMao94Magnification(trajectory=self.trajectory, gamma=self._gamma)
+
+        return self._derivatives
 
     def get_magnification(self):
         """
@@ -1037,8 +1191,14 @@ class FiniteSourceLDLee09Magnification(FiniteSourceUniformLee09Magnification):
         """
         mag = np.zeros_like(self.u_)
 
-        for i in range(len(self.u_)):
-            mag[i] = self._LD_Lee09(self.u_[i])
+        if self.n_theta % 2 != 0:
+            raise ValueError('internal error - even number expected')
+        if self.n_u % 2 != 0:
+            raise ValueError('internal error - even number expected')
+
+        step = max(1, self._max_grid_size // (self.n_theta * self.n_u))
+        for i in range(0, len(mag), step):
+            mag[i:i+step] = self._LD_Lee09(self.u_[i:i+step])
 
         self._magnification = mag
 
@@ -1047,49 +1207,35 @@ class FiniteSourceLDLee09Magnification(FiniteSourceUniformLee09Magnification):
     def _LD_Lee09(self, u):
         """
         Calculates Equation 13 from Lee et al. 2009.
+        Input u is np.ndarray and all epochs are calculated at once using
+        (epoch x theta x u) grid.
 
         Accuracy of these calculations is on the order of 1e-4
         """
-        n_theta = self.n_theta
-        n_u = self.n_u
         rho = self.trajectory.parameters.rho
 
         theta_sub = 1.e-12
         u_1_min = 1.e-13
 
-        if n_theta % 2 != 0:
-            raise ValueError('internal error - even number expected')
-        if n_u % 2 != 0:
-            raise ValueError('internal error - even number expected')
+        theta_max = np.full(u.shape, np.pi)
+        large = (u > rho)
+        theta_max[large] = np.arcsin(rho / u[large])
 
-        if u > rho:
-            theta_max = np.arcsin(rho / u)
-        else:
-            theta_max = np.pi
+        theta_max = theta_max[:, np.newaxis]
+        u_ = u[:, np.newaxis]
+        theta = (theta_max - theta_sub) * np.linspace(0., 1., self.n_theta)
+        u_1 = self._u_1_Lee09(theta, u_) + u_1_min
+        u_2 = self._u_2_Lee09(theta, u_)
 
-        theta = np.linspace(0, theta_max - theta_sub, n_theta)
-        integrand_values = np.zeros_like(theta)
-        u_1 = self._u_1_Lee09(theta, u, theta_max) + u_1_min
-        u_2 = self._u_2_Lee09(theta, u, theta_max)
-
-        size = (len(theta), n_u)
-        temp = np.zeros(size)
-        temp2 = (np.zeros(size).T + np.cos(theta)).T
-        for (i, (u_1_, u_2_)) in enumerate(zip(u_1, u_2)):
-            temp[i] = np.linspace(u_1_, u_2_, n_u)
+        fraction = np.linspace(0., 1., self.n_u)
+        temp = u_1[..., np.newaxis] + (u_2 - u_1)[..., np.newaxis] * fraction
+        temp2 = np.cos(theta)[..., np.newaxis]
 
         integrand = self._integrand_Lee09_v2(temp, u, temp2)
-        dx = temp[:, 1] - temp[:, 0]
-        for (i, dx_) in enumerate(dx):
-            try:
-                integrand_values[i] = integrate.simpson(integrand[i], dx=dx_)
-            except AttributeError:
-                integrand_values[i] = integrate.simps(integrand[i], dx=dx_)
-        try:
-            out = integrate.simpson(integrand_values, dx=theta[1] - theta[0])
-        except AttributeError:
-            out = integrate.simps(integrand_values, dx=theta[1] - theta[0])
-        out *= 2. / (np.pi * rho**2)
+        dx = temp[:, :, 1] - temp[:, :, 0]
+        integrand_values = dx * np.dot(integrand, self._get_simpson_weights(self.n_u))
+        out = np.dot(integrand_values, self._get_simpson_weights(self.n_theta))
+        out *= (theta[:, 1] - theta[:, 0]) * 2. / (np.pi * rho**2)
 
         return out
 
@@ -1097,38 +1243,52 @@ class FiniteSourceLDLee09Magnification(FiniteSourceUniformLee09Magnification):
         """
         Integrand in Equation 13 in Lee et al. 2009.
 
-        u_ and theta_ are np.ndarray, other parameters are scalars.
+        u_ and theta_ are np.ndarray of (epoch x theta x u) shape,
+        u is np.ndarray with value for each epoch, gamma and rho are scalars.
         theta_ is in fact cos(theta_) here
         """
         rho = self.trajectory.parameters.rho
         gamma = self.gamma
 
-        values = 1. - (u_ * (u_ - 2. * u * theta_) + u**2) / rho**2
-        values[:, -1] = 0.
-        if values[-1, 0] < 0.:
-            values[-1, 0] = 0.
-            if values[-1, 1] < 0.:  # This sometimes happens due to rounding
-                values[-1, 1] = .5 * values[-1, 2]  # errors above. Using
-                # math.fsum in "values = ..." doesn't help in all cases.
-
-        if np.any(values < 0.):
-            if u / rho < 5.:
+        u = u[:, np.newaxis, np.newaxis]
+        values = u_ - 2. * u * theta_
+        values *= u_
+        values += u**2
+        values *= -1. / rho**2
+        values += 1.
+        values[:, :, -1] = 0.
+        mask = (values[:, -1, 0] < 0.)
+        values[mask, -1, 0] = 0.
+        mask &= (values[:, -1, 1] < 0.)  # This sometimes happens due to
+        values[mask, -1, 1] = .5 * values[mask, -1, 2]  # rounding errors
+        # above. Using math.fsum in "values = ..." doesn't help in all cases.
+
+        negative = (values < 0.)
+        if np.any(negative):
+            u_negative = u[np.any(negative, axis=(1, 2)), 0, 0]
+            if np.any(u_negative / rho < 5.):
                 raise ValueError(
                     "PointLens.get_point_lens_LD_integrated_magnification() " +
-                    "unexpected error for:\nu = {:}\n".format(repr(u)) +
+                    "unexpected error for:\nu = {:}\n".format(repr(u_negative[u_negative / rho < 5.][0])) +
                     "rho = {:}\ngamma = {:}".format(repr(rho), repr(gamma)))
             else:
                 message = (
                     "PointLens.get_point_lens_LD_integrated_magnification() " +
                     "warning! The arguments are strange: u/rho = " +
-                    "{:}.\nThere are numerical issues. You ".format(u / rho) +
+                    "{:}.\nThere are numerical issues. You ".format(u_negative[0] / rho) +
                     "can use other methods for such large u value.")
                 warnings.warn(message, UserWarning)
-                values[values < 0.] = 0.
+                values[negative] = 0.
 
-        out = 1. - gamma * (1. - 1.5 * np.sqrt(values))
+        out = np.sqrt(values, out=values)
+        out *= 1.5 * gamma
+        out += 1. - gamma
+        u_2 = u_**2
+        out *= u_2 + 2.
+        u_2 += 4.
+        out /= np.sqrt(u_2, out=u_2)
 
-        return out * (u_**2 + 2.) / np.sqrt(u_**2 + 4.)
+        return out
 
     @property
     def gamma(self):
@@ -1,6 +1,7 @@
 import numpy as np
 
 from MulensModel.pointlens import _PointLensMagnification
+from MulensModel.utils import Utils
 
 
 class PointSourcePointLensWithShearMagnification(_PointLensMagnification):
@@ -52,25 +53,36 @@ class PointSourcePointLensWithShearMagnification(_PointLensMagnification):
              zeta_conj,
              temp * len(zeta)], axis=1)
 
-        magnification = []
+        roots = self._get_roots(coeffs_array)
+        roots_conj = np.conjugate(roots)
         const = (1. - convergence_K)**2
-        for coeffs in coeffs_array:
-            mag = 0.
-            roots = np.polynomial.polynomial.polyroots(coeffs)
-            for root in roots:
-                if root == 0:
-                    continue
-                root_conj = np.conjugate(root)
-                mag += 1. / abs(
-                    const -
-                    (root_conj**-2 - shear_G) * (root**-2 - shear_G_conj))
-            magnification.append(mag)
-
-        magnification = np.array(magnification)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            jacobian = const - (roots_conj**-2 - shear_G) * (roots**-2 - shear_G_conj)
+            magnification = 1. / np.abs(jacobian)
+        magnification = np.sum(np.where(roots == 0., 0., magnification), axis=1)
+
         self._test_magnification_values(magnification)
 
         return magnification
 
+    def _get_roots(self, coeffs_array):
+        """
+        Find roots of all polynomials at once. The first and the last
+        coefficients do not depend on epoch, hence, if they are zero, then
+        the degree of all polynomials is reduced. A root equal to zero
+        does not correspond to an image, so it is removed as well.
+        """
+        n_epochs = len(coeffs_array)
+        while coeffs_array.shape[1] > 1 and np.all(coeffs_array[:, -1] == 0.):
+            coeffs_array = coeffs_array[:, :-1]
+        while coeffs_array.shape[1] > 1 and np.all(coeffs_array[:, 0] == 0.):
+            coeffs_array = coeffs_array[:, 1:]
+
+        if coeffs_array.shape[1] < 2:
+            return np.zeros((n_epochs, 0), dtype=complex)
+
+        return Utils.polynomial_roots_vectorized(coeffs_array)
+
     def _test_magnification_values(self, magnification):
         """
         Test if all magnifications are > 1 and raise ValueError if not.
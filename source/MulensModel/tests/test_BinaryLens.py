@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import unittest
 
 import MulensModel as mm
@@ -44,6 +45,47 @@ class TestBinaryLensPointSourceMagnification(unittest.TestCase):
         result = lens.get_magnification()
         np.testing.assert_almost_equal(result, self.expected, decimal=3)
 
+    def test_BLPS_vectorized(self):
+        lens = mm.BinaryLensPointSourceVectorizedMagnification(trajectory=self.trajectory)
+        result = lens.get_magnification()
+        np.testing.assert_almost_equal(result, self.expected, decimal=3)
+
+
+def test_BinaryLensPointSourceVectorizedMagnification():
+    """
+    Compare vectorized point-source calculation with the default one
+    for a light curve that includes caustic crossings.
+    """
+    times = np.linspace(-2., 2., 1000)
+    parameters = mm.ModelParameters({'t_0': 0., 'u_0': 0.05, 't_E': 1., 's': 0.8, 'q': 0.1, 'alpha': 30.})
+    trajectory = mm.Trajectory(times=times, parameters=parameters)
+
+    expected = mm.binarylens.BinaryLensPointSourceMagnification(trajectory=trajectory).get_magnification()
+    result = mm.BinaryLensPointSourceVectorizedMagnification(trajectory=trajectory).get_magnification()
+    np.testing.assert_allclose(result, expected, rtol=1.e-9)
+
+
+def test_BinaryLensPointSourceMagnification_get_d_A_d_params():
+    """
+    Compare derivatives of point-source--binary-lens magnification
+    with finite differences.
+    """
+    times = np.linspace(-2., 2., 200)
+    parameters = {'t_0': 0., 'u_0': 0.05, 't_E': 1., 's': 0.8, 'q': 0.1, 'alpha': 30.}
+    trajectory = mm.Trajectory(times=times, parameters=mm.ModelParameters(parameters))
+    result = mm.binarylens.BinaryLensPointSourceMagnification(
+        trajectory=trajectory).get_d_A_d_params(list(parameters.keys()))
+
+    for (key, value) in parameters.items():
+        magnifications = []
+        for step in [1.e-7, -1.e-7]:
+            parameters_ = {**parameters, key: value + step}
+            trajectory = mm.Trajectory(times=times, parameters=mm.ModelParameters(parameters_))
+            lens = mm.BinaryLensPointSourceVectorizedMagnification(trajectory=trajectory)
+            magnifications.append(lens.get_magnification())
+        expected = (magnifications[0] - magnifications[1]) / 2.e-7
+        np.testing.assert_allclose(result[key], expected, rtol=1.e-4, atol=1.e-4*np.max(np.abs(expected)))
+
 
 class TestBinaryLensHexadecapoleMagnification(unittest.TestCase):
     """
@@ -61,9 +103,10 @@ class TestBinaryLensHexadecapoleMagnification(unittest.TestCase):
 
         self.pspl_mag = 4.691830779895085
         # The order of approximations below is [hexa, quad, pspl].
-        self.reference_00 = [5.017252440557196, 4.9587638949353146, self.pspl_mag]
-        self.reference_05 = [4.981368071884021, 4.932070583431292, self.pspl_mag]
-        self.reference_10 = [4.9454837032108445, 4.905377271927269, self.pspl_mag]
+        # Hexadecapole values agree with VBBL to better than 1e-4.
+        self.reference_00 = [4.844793519316214, 4.825297337615338, self.pspl_mag]
+        self.reference_05 = [4.828383177852931, 4.811950681847908, self.pspl_mag]
+        self.reference_10 = [4.8119728363896535, 4.798604026080481, self.pspl_mag]
 
     def _test_gamma(self, gamma, reference):
         """
@@ -111,6 +154,91 @@ class TestBinaryLensQuadrupoleMagnification(TestBinaryLensHexadecapoleMagnificat
         self._test_gamma_quad(1.0, self.reference_10[1])
 
 
+def test_BinaryLensPointSourceWM95Magnification_warm_start():
+    """
+    Check that starting root solver from the roots of previous epoch
+    does not change the results.
+    """
+    parameters = mm.ModelParameters({'t_0': 0., 'u_0': 0.05, 't_E': 20., 's': 1.2, 'q': 0.1, 'alpha': 30.})
+    trajectory = mm.Trajectory(np.linspace(-10., 10., 200), parameters=parameters)
+
+    lens = mm.BinaryLensPointSourceWM95Magnification(trajectory=trajectory, warm_start=True)
+    lens_cold = mm.BinaryLensPointSourceWM95Magnification(trajectory=trajectory, warm_start=False)
+    np.testing.assert_allclose(lens.get_magnification(), lens_cold.get_magnification(), rtol=1.e-10)
+
+
+def _get_hexadecapole_one_by_one(point_source, x, y, separation, rho, gamma):
+    """
+    Reference calculation of Gould (2008) eqs. 6-9 for a single epoch.
+    Point-source magnifications are calculated one by one using
+    Skowron & Gould (2012) solver. Returns hexadecapole, quadrupole, and
+    point source approximations.
+    """
+    def get_a_ring(radius, angles):
+        a_ring = [point_source._get_1_magnification_point_source(
+            x + radius * np.cos(angle), y + radius * np.sin(angle), separation) for angle in angles]
+        return np.mean(a_ring) - a_center
+
+    plus = np.pi * np.array([0., 0.5, 1., 1.5])
+    a_center = point_source._get_1_magnification_point_source(x, y, separation)
+    a_rho_half_plus = get_a_ring(0.5 * rho, plus)
+    a_rho_plus = get_a_ring(rho, plus)
+    a_rho_times = get_a_ring(rho, plus + 0.25 * np.pi)
+
+    a_2_rho_square = (16. * a_rho_half_plus - a_rho_plus) / 3.
+    a_4_rho_power4 = 0.5 * (a_rho_plus + a_rho_times) - a_2_rho_square
+    a_quadrupole = a_center + 0.5 * a_2_rho_square * (1. - 0.2 * gamma)
+    a_hexadecapole = a_quadrupole + a_4_rho_power4 * (1. - 11. * gamma / 35.) / 3.
+
+    return (a_hexadecapole, a_quadrupole, a_center)
+
+
+def test_BinaryLensHexadecapoleMagnification_stencil():
+    """
+    Check that vectorized stencil calculations for many epochs give
+    the same results as calculations for each epoch separately.
+    """
+    parameters = mm.ModelParameters({
+        't_0': 0., 'u_0': 0.05, 't_E': 20., 's': 1.2, 'q': 0.1, 'alpha': 30., 'rho': 0.002})
+    trajectory = mm.Trajectory(np.linspace(-10., 10., 200), parameters=parameters)
+    separations = 1.2 * np.ones(200)
+
+    lens = mm.BinaryLensHexadecapoleMagnification(trajectory=trajectory, gamma=0.5, all_approximations=True)
+    result = lens.get_magnification()
+    point_source = mm.BinaryLensPointSourceWM95Magnification(trajectory=trajectory)
+    expected = [_get_hexadecapole_one_by_one(point_source, *args, rho=0.002, gamma=0.5)
+                for args in zip(trajectory.x, trajectory.y, separations)]
+    np.testing.assert_allclose(result, expected, rtol=1.e-8)
+
+    lens = mm.BinaryLensQuadrupoleMagnification(trajectory=trajectory, gamma=0.5)
+    np.testing.assert_allclose(lens.get_magnification(), np.array(expected)[:, 1], rtol=1.e-8)
+
+
+def test_BinaryLensAdaptiveMagnification():
+    """
+    Check that adaptive selection of methods gives the same results as VBBL
+    and that all three methods are used.
+    """
+    parameters = mm.ModelParameters({
+        't_0': 0., 'u_0': 0.05, 't_E': 20., 's': 1.2, 'q': 0.1, 'alpha': 30., 'rho': 0.002})
+    trajectory = mm.Trajectory(np.linspace(-10., 10., 400), parameters=parameters)
+    kwargs = {'trajectory': trajectory, 'gamma': 0.5}
+
+    lens = mm.BinaryLensAdaptiveMagnification(tolerance=0.001, finite_source_kwargs={'accuracy': 1.e-4}, **kwargs)
+    result = lens.get_magnification()
+    expected = mm.BinaryLensVBBLMagnification(accuracy=1.e-4, **kwargs).get_magnification()
+
+    np.testing.assert_allclose(result, expected, rtol=0.002)
+    assert set(lens.methods) == {'point_source', 'hexadecapole', 'VBBL'}
+    assert np.sum(lens.methods == 'VBBL') < len(result) / 10
+
+    model = mm.Model(parameters)
+    model.set_magnification_methods([-10.5, 'adaptive', 10.5])
+    model.set_magnification_methods_parameters({'adaptive': {'tolerance': 0.001}, 'VBBL': {'accuracy': 1.e-4}})
+    result = model.get_magnification(trajectory.times, gamma=0.5)
+    np.testing.assert_allclose(result, expected, rtol=0.002)
+
+
 def test_BinaryLensVBBLMagnification_1():
     """
     check basic magnification calculation using VBBL
@@ -195,3 +323,37 @@ def test_BinaryLensAdaptiveContouringMagnification():
         trajectory=trajectory,  accuracy=0.019, ld_accuracy=1e-3)
     result = lens.get_magnification()
     np.testing.assert_almost_equal(result, 11.403036510555962, decimal=3)
+
+
+def test_BinaryLensVBBLMagnification_n_threads():
+    """
+    Check that VBBL calculations split into multiple threads give the same
+    results as a single thread.
+    """
+    times = np.linspace(-0.3, 0.3, 300)
+    parameters = mm.ModelParameters({
+        't_0': 0., 'u_0': 0.05, 't_E': 1., 's': 0.8, 'q': 0.1, 'alpha': 30., 'rho': 0.01})
+    trajectory = mm.Trajectory(times=times, parameters=parameters)
+
+    expected = mm.BinaryLensVBBLMagnification(trajectory=trajectory).get_magnification()
+    lens = mm.BinaryLensVBBLMagnification(trajectory=trajectory, n_threads=4)
+    np.testing.assert_allclose(lens.get_magnification(), expected, rtol=1.e-9)
+
+    with pytest.raises(ValueError):
+        mm.BinaryLensVBBLMagnification(trajectory=trajectory, n_threads=0)
+
+
+def test_BinaryLensAdaptiveContouringMagnification_n_threads():
+    """
+    Check that AdaptiveContouring calculations split into multiple threads
+    give the same results as a single thread.
+    """
+    times = np.linspace(0.5, 0.6, 20)
+    parameters = mm.ModelParameters({
+        't_0': 0., 'u_0': 0.3, 't_E': 1., 's': 0.8, 'q': 0.1, 'alpha': 180., 'rho': 0.01})
+    trajectory = mm.Trajectory(times=times, parameters=parameters)
+    kwargs = {'trajectory': trajectory, 'accuracy': 0.019, 'ld_accuracy': 1e-3}
+
+    expected = mm.BinaryLensAdaptiveContouringMagnification(**kwargs).get_magnification()
+    lens = mm.BinaryLensAdaptiveContouringMagnification(n_threads=3, **kwargs)
+    np.testing.assert_almost_equal(lens.get_magnification(), expected)
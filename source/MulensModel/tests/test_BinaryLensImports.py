@@ -1,3 +1,4 @@
+import numpy as np
 from numpy.testing import assert_almost_equal
 import warnings
 
@@ -109,3 +110,77 @@ def test_VBBL_SG12_9():
         -3.63807783,  0.90118702, 1.29719497, 0.60196247, -0.63649524,
         0.0565556, -0.0138864,  -0.03508702]
     assert_almost_equal(out, expected)
+
+
+def test_VBBL_SG12_9_array():
+    """
+    Directly (hence, calling private function) test imported VBBL function:
+    _vbbl_SG12_9_array() against _vbbl_SG12_9()
+    """
+    if not mm.binarylensimports._vbbl_wrapped:
+        warnings.warn("VBBL not imported", UserWarning)
+        return
+
+    polynomial = np.array([
+        -0.0006162037037037004, 0.018455861111111117, 0.06027712777777768,
+        -0.08050824074074037, -0.30724011207070717, -0.5752337759963271,
+        -0.524794951286975, -0.2288742865013774, -0.0350081818181818, 0.0,
+        0.0006162037037037004, 0.005693722222222227, 0.006298813888888853,
+        -0.0035301525925927266, 0.063350366010101, 0.1906118155555555,
+        0.09094615694687937, 0.029791669421487667, 0.03019545454545458,
+        0.0158])
+    polynomials = np.concatenate([polynomial, 0.9 * polynomial])
+    roots = np.empty(2 * 18)
+    mm.binarylensimports._vbbl_SG12_9_array(polynomials, roots)
+    for i in range(2):
+        expected = np.array(mm.binarylensimports._vbbl_SG12_9(*polynomials[20*i:20*(i+1)]))
+        assert_almost_equal(roots[18*i:18*(i+1)], expected)
+
+
+def test_VBBL_SG12_warm_start():
+    """
+    Directly (hence, calling private function) test imported VBBL function:
+    _vbbl_SG12_warm_start() against _vbbl_SG12_5() for cold start and
+    for starting points close to the roots.
+    """
+    if not mm.binarylensimports._vbbl_wrapped:
+        warnings.warn("VBBL not imported", UserWarning)
+        return
+
+    polynomial = np.array([
+        -0.0006, 0.0185, 0.0603, -0.0805, -0.3072, 1.,
+        -0.5752, 0.025, 0.1, -0.01, 0.0603, 0.])
+    expected = np.array(mm.binarylensimports._vbbl_SG12_5(*polynomial))
+    expected = np.sort_complex(expected[:5] + 1.j * expected[5:])
+
+    roots = np.zeros(10)
+    mm.binarylensimports._vbbl_SG12_warm_start(polynomial, roots)
+    assert_almost_equal(np.sort_complex(roots[:5] + 1.j * roots[5:]), expected)
+
+    roots += 0.01
+    mm.binarylensimports._vbbl_SG12_warm_start(polynomial, roots)
+    assert_almost_equal(np.sort_complex(roots[:5] + 1.j * roots[5:]), expected)
+
+
+def test_VBBL_finite_and_dark_array():
+    """
+    Directly (hence, calling private function) test imported VBBL functions:
+    _vbbl_binary_mag_finite_array() and _vbbl_binary_mag_dark_array()
+    """
+    if not mm.binarylensimports._vbbl_wrapped:
+        warnings.warn("VBBL not imported", UserWarning)
+        return
+
+    s = np.array([0.8, 1.35])
+    q = 0.1
+    x = np.array([0.01, 0.6598560303179819])
+    y = np.array([0.01, -0.05280389642190758])
+    out = np.empty(2)
+    mm.binarylensimports._vbbl_binary_mag_finite_array(s, q, x, y, 0.01, 0.001, out)
+    expected = [mm.binarylensimports._vbbl_binary_mag_finite(s[i], q, x[i], y[i], 0.01, 0.001) for i in range(2)]
+    assert_almost_equal(out, expected)
+    assert_almost_equal(out[0], 18.283392940574107)
+
+    mm.binarylensimports._vbbl_binary_mag_dark_array(s, q, x, y, 0.01, 0.001, 0.5, out)
+    expected = [mm.binarylensimports._vbbl_binary_mag_dark(s[i], q, x[i], y[i], 0.01, 0.001, 0.5) for i in range(2)]
+    assert_almost_equal(out, expected)
@@ -110,3 +110,22 @@ def test_standard_vs_shear():
     result = lens.get_magnification()
     result_standard = lens_standard.get_magnification()
     np.testing.assert_almost_equal(result, result_standard, decimal=5)
+
+
+def test_vectorized_vs_WM95():
+    """
+    check if vectorized calculations give the same results as
+    the ones for each epoch separately
+    """
+    s = 1.1
+    q = 0.2
+    x = np.linspace(-1.5, 1.5, 101)
+    y = 0.05
+
+    trajectory = make_trajectory((x, y), {'s': s, 'q': q})
+    kwargs = {'trajectory': trajectory, 'convergence_K': 0.05, 'shear_G': complex(0.1, -0.06)}
+
+    lens = mm.BinaryLensPointSourceWithShearVectorizedMagnification(**kwargs)
+    lens_wm95 = mm.BinaryLensPointSourceWithShearWM95Magnification(**kwargs)
+
+    np.testing.assert_allclose(lens.get_magnification(), lens_wm95.get_magnification(), rtol=1e-8)
@@ -33,3 +33,25 @@ def test_caustic():
             x[i], test_caustics['X'][index], decimal=5)
         np.testing.assert_almost_equal(
             y[i], test_caustics['Y'][index], decimal=5)
+
+
+def test_caustic_adaptive():
+    """
+    Check that adaptive sampling gives points on the same caustic and
+    puts more points near a cusp.
+    """
+    (s, q) = (1.2, 0.5)
+    (x_ref, y_ref) = mm.CausticsBinary(q=q, s=s).get_caustics(n_points=40000)
+    (x_1, y_1) = mm.CausticsBinary(q=q, s=s).get_caustics(n_points=1000)
+    (x_2, y_2) = mm.CausticsBinary(q=q, s=s).get_caustics(n_points=1000, adaptive=True)
+    assert isinstance(x_2, np.ndarray)
+    assert len(x_2) == 1000
+
+    distance = np.hypot(x_2[:, np.newaxis] - x_ref, y_2[:, np.newaxis] - y_ref)
+    assert np.max(np.min(distance, axis=1)) < 1.e-3
+
+    index = np.argmax(x_1)  # This is a cusp on the binary axis.
+    radius = 0.01 * np.ptp(x_1)
+    n_1 = np.sum(np.hypot(x_1 - x_1[index], y_1 - y_1[index]) < radius)
+    n_2 = np.sum(np.hypot(x_2 - x_1[index], y_2 - y_1[index]) < radius)
+    assert n_2 > 1.5 * n_1
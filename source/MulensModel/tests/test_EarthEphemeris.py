@@ -0,0 +1,54 @@
+import os
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import get_body_barycentric
+from astropy.time import Time
+
+import MulensModel as mm
+
+
+def test_get_position():
+    """
+    Compare interpolated positions with Astropy calculations.
+    """
+    times = np.array([2450000.123, 2455555.5, 2456000., 2459123.456789, 2460800.9])
+    expected = get_body_barycentric(
+        body='earth', time=Time(times, format='jd', scale='tdb'))
+    expected = expected.xyz.T.to(u.au).value
+
+    result = mm.EarthEphemeris().get_position(times)
+    np.testing.assert_allclose(result, expected, rtol=0., atol=1.e-9)
+
+
+def test_get_velocity():
+    """
+    Check velocity against Utils.velocity_of_Earth()
+    """
+    time = 2456789.012345
+    expected = mm.Utils.velocity_of_Earth(time) / 1731.45683
+    np.testing.assert_almost_equal(mm.EarthEphemeris().get_velocity(time), expected)
+
+
+def test_cache_dir(tmp_path):
+    """
+    Check that tables are saved and then read from disk.
+    """
+    times = np.array([2458000.25, 2458001.75])
+    cache_dir = mm.EarthEphemeris.cache_dir
+    blocks = mm.EarthEphemeris._blocks
+    try:
+        mm.EarthEphemeris.cache_dir = str(tmp_path)
+        mm.EarthEphemeris._blocks = dict()
+        result_1 = mm.EarthEphemeris().get_position(times)
+        files = os.listdir(tmp_path)
+        assert len(files) == 1
+        assert files[0].endswith(".npy")
+
+        mm.EarthEphemeris._blocks = dict()
+        result_2 = mm.EarthEphemeris().get_position(times)
+        table = list(mm.EarthEphemeris._blocks.values())[0]
+        assert isinstance(table, np.memmap)
+        np.testing.assert_equal(result_1, result_2)
+    finally:
+        mm.EarthEphemeris.cache_dir = cache_dir
+        mm.EarthEphemeris._blocks = blocks
@@ -1,5 +1,6 @@
 from os.path import join
 import unittest
+import pickle
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
@@ -390,6 +391,13 @@ class TestChi2Gradient(unittest.TestCase):
             fix_blend_flux={self.data: 0.}, coords=self.coords)
         return event
 
+    def test_get_chi2_and_gradient(self):
+        """test calculation of chi2 and gradient in a single pass"""
+        event = self._make_event()
+        (chi2, gradient) = event.get_chi2_and_gradient(self.grad_params)
+        np.testing.assert_almost_equal(gradient / self.reference, 1., decimal=1)
+        np.testing.assert_almost_equal(chi2, event.get_chi2())
+
     def test_1(self):
         """test calculation of chi2 gradient"""
         event = self._make_event()
@@ -620,6 +628,200 @@ def test_get_flux_for_dataset():
     np.testing.assert_almost_equal(blend_flux_fix, 0.)
 
 
+def test_fits_reused():
+    """
+    Check that FitData objects are reused between calls of fit_fluxes()
+    and re-created only if needed.
+    """
+    (model, model_1, model_2) = generate_binary_source_models()
+    (data_1, data_2) = generate_binary_source_datasets(model_1, model_2)
+    event = mm.Event([data_1, data_2], model)
+
+    chi2_1 = event.get_chi2()
+    fits = list(event.fits)
+    event.model.parameters.t_E = 30.
+    chi2_2 = event.get_chi2()
+    assert event.fits[0] is fits[0] and event.fits[1] is fits[1]
+    assert chi2_2 != chi2_1
+    event_new = mm.Event([data_1, data_2], model)
+    np.testing.assert_almost_equal(event_new.get_chi2(), chi2_2)
+
+    event.fix_blend_flux[data_2] = 0.
+    event.fit_fluxes()
+    assert event.fits[0] is fits[0]
+    assert event.fits[1] is not fits[1]
+    np.testing.assert_almost_equal(event.get_flux_for_dataset(1)[1], 0.)
+
+    event.datasets = [data_2]
+    event.fit_fluxes()
+    assert len(event.fits) == 1
+    assert event.fits[0].dataset is data_2
+
+
+def test_fits_reused_data_changed_in_place():
+    """
+    Check that chi2 is correct when the dataset arrays are changed in place
+    after the fits were created.
+    """
+    data = mm.MulensData(file_name=SAMPLE_FILE_01)
+    model = mm.Model({'t_0': 5379.57091, 'u_0': 0.52298, 't_E': 17.94002})
+    event = mm.Event(data, model)
+    event.get_chi2()
+
+    data.good[:50] = False
+    data.err_flux[50:100] *= 2.
+    event_new = mm.Event(data, model)
+    np.testing.assert_almost_equal(event.get_chi2(), event_new.get_chi2())
+    assert event.fits[0].chi2_per_point.size == data.n_epochs
+
+
+def test_share_magnification():
+    """
+    Check that magnification calculated once for all datasets gives
+    the same results as separate calculations.
+    """
+    (model, model_1, model_2) = generate_binary_source_models()
+    (data_1, data_2) = generate_binary_source_datasets(model_1, model_2)
+    data_2.bad = np.arange(data_2.n_epochs) % 3 == 0
+    events = [mm.Event([data_1, data_2], model) for _ in range(2)]
+    events[1].share_magnification = False
+
+    np.testing.assert_almost_equal(events[0].get_chi2(), events[1].get_chi2())
+    assert events[0].fits[1]._magnification_curves_bad is False
+    chi2 = [event.get_chi2_per_point(bad=True) for event in events]
+    for (chi2_0, chi2_1) in zip(*chi2):
+        np.testing.assert_almost_equal(chi2_0, chi2_1)
+
+    curves = events[0].fits[1].magnification_curves
+    np.testing.assert_almost_equal(
+        curves[0].get_magnification(), events[1].fits[1].magnification_curves[0].get_magnification())
+
+
+def test_share_magnification_derivatives_bad_epochs():
+    """
+    Check that derivatives of magnification are calculated for good epochs
+    only, no matter if magnification is shared between datasets.
+    """
+    model = mm.Model({'t_0': 5000., 'u_0': 0.002, 't_E': 20., 'rho': 0.005})
+    model.set_magnification_methods([4999.8, 'finite_source_uniform_Gould94', 5000.2])
+    times = np.linspace(4999.7, 5000.3, 300)
+    flux = 100. * model.get_magnification(times) + 10.
+    bad = np.zeros(len(times), dtype=bool)
+    bad[::10] = True
+    datasets = [mm.MulensData([times, flux, 1. + 0. * flux], phot_fmt='flux', bad=bad) for _ in range(2)]
+
+    for share_magnification in [True, False]:
+        event = mm.Event(datasets, model)
+        event.share_magnification = share_magnification
+        event.get_chi2()
+        fit = event.fits[0]
+        assert len(fit.get_d_A_d_rho()) == 270
+        assert len(fit.get_d_A_d_params_for_point_lens_model(['u_0'])['u_0']) == 270
+
+
+def _get_chi2_one_by_one(event, parameters, parameter_names):
+    """get chi2 for each set of parameters by changing model parameters"""
+    chi2 = []
+    for values in parameters:
+        for (name, value) in zip(parameter_names, values):
+            setattr(event.model.parameters, name, value)
+        chi2.append(event.get_chi2())
+    return np.array(chi2)
+
+
+def test_get_chi2_batch():
+    """
+    Check that chi2 calculated for many parameters at once is the same
+    as chi2 calculated one by one for point and binary lenses.
+    """
+    data_1 = mm.MulensData(file_name=SAMPLE_FILE_01)
+    data_2 = mm.MulensData(file_name=SAMPLE_FILE_01, bandpass='I')
+    data_2.bad = np.arange(data_2.n_epochs) % 4 == 0
+    generator = np.random.default_rng(12345)
+    settings = [
+        ({'t_0': 5379.571, 'u_0': 0.01, 't_E': 17.94, 'rho': 0.02}, [0.1, 0.001, 0.2, 0.001],
+         [5370., 'finite_source_LD_Yoo04', 5390.]),
+        ({'t_0': 5379.571, 'u_0': 0.1, 't_E': 17.94, 's': 1.1, 'q': 0.01, 'alpha': 30.},
+         [0.1, 0.01, 0.2, 0.01, 0.001, 1.], None)]
+    for (parameters, sigma, methods) in settings:
+        model = mm.Model(parameters)
+        model.set_limb_coeff_gamma('I', 0.5)
+        if methods is not None:
+            model.set_magnification_methods(methods)
+        event = mm.Event([data_1, data_2], model, fix_blend_flux={data_2: 0.})
+        names = list(parameters.keys())
+        values = np.array(list(parameters.values())) + generator.normal(size=(6, len(names))) * sigma
+
+        result = event.get_chi2_batch(values, names)
+        assert model.parameters.parameters == parameters
+        expected = _get_chi2_one_by_one(event, values, names)
+        np.testing.assert_allclose(result, expected, rtol=1.e-9)
+
+
+def test_get_chi2_batch_loop():
+    """
+    Check get_chi2_batch() for a binary source model, which is calculated
+    one set of parameters after another.
+    """
+    (model, model_1, model_2) = generate_binary_source_models()
+    (data_1, data_2) = generate_binary_source_datasets(model_1, model_2)
+    event = mm.Event([data_1, data_2], model)
+    values = np.array([[5000., 0.05], [5001., 0.06], [4999., 0.04]])
+
+    result = event.get_chi2_batch(values, ['t_0_1', 'u_0_1'])
+    assert model.parameters.t_0_1 == 5000.
+    expected = _get_chi2_one_by_one(event, values, ['t_0_1', 'u_0_1'])
+    np.testing.assert_allclose(result, expected, rtol=1.e-12)
+
+
+def test_pickle():
+    """
+    Check that pickled event gives the same chi2 and fluxes and that
+    magnification curves are not pickled.
+    """
+    data_1 = mm.MulensData(file_name=SAMPLE_FILE_01)
+    data_2 = mm.MulensData(file_name=SAMPLE_FILE_01, bandpass='I')
+    model = mm.Model({'t_0': 5379.571, 'u_0': 0.01, 't_E': 17.94, 'rho': 0.02})
+    model.set_magnification_methods([5370., 'finite_source_LD_Yoo04', 5390.])
+    model.set_limb_coeff_gamma('I', 0.5)
+    event = mm.Event([data_1, data_2], model, fix_blend_flux={data_2: 0.})
+    chi2 = event.get_chi2()
+
+    event_2 = pickle.loads(pickle.dumps(event))
+    assert event_2.fits[1]._data_magnification_curve is None
+    assert event_2.fix_blend_flux[event_2.datasets[1]] == 0.
+    assert event_2.chi2 == chi2
+    np.testing.assert_almost_equal(event_2.get_chi2(), chi2)
+    np.testing.assert_almost_equal(event_2.fits[0].source_flux, event.fits[0].source_flux)
+
+
+def test_get_chi2_and_gradient():
+    """
+    Check that chi2 and gradient calculated in a single pass are the same
+    as calculated separately for binary source and binary lens models.
+    """
+    (model, model_1, model_2) = generate_binary_source_models()
+    (data_1, data_2) = generate_binary_source_datasets(model_1, model_2)
+    data_1.bad = np.arange(data_1.n_epochs) % 10 == 0
+    assert np.sum(data_1.good) == data_1.n_epochs - 60
+    event = mm.Event([data_1, data_2], model, fix_blend_flux={data_2: 50.})
+    event.model.parameters.t_E = 27.
+    parameters = ['t_0_1', 'u_0_2', 't_E']
+    (chi2, gradient) = event.get_chi2_and_gradient(parameters)
+    np.testing.assert_almost_equal(chi2, event.get_chi2())
+    np.testing.assert_allclose(gradient, event.get_chi2_gradient(parameters), rtol=1.e-10)
+    assert event.chi2 == chi2
+
+    model = mm.Model({'t_0': 5000., 'u_0': 0.1, 't_E': 25., 'alpha': 130., 's': 1.2, 'q': 0.05})
+    event = mm.Event([data_1, data_2], model)
+    parameters = ['t_0', 'u_0', 't_E', 'alpha', 's', 'q']
+    (chi2, gradient) = event.get_chi2_and_gradient(parameters)
+    np.testing.assert_allclose(chi2, event.get_chi2(), rtol=1.e-8)
+    np.testing.assert_allclose(gradient, event.get_chi2_gradient(parameters), rtol=1.e-6)
+    (chi2, gradient) = event.get_chi2_and_gradient('q')
+    np.testing.assert_allclose(gradient, event.get_chi2_gradient('q'), rtol=1.e-6)
+
+
 def test_get_chi2_per_point():
     """
     test format of output: access a specific point in an event with multiple
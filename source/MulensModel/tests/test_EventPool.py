@@ -0,0 +1,31 @@
+from os.path import join
+import unittest
+import numpy as np
+
+import MulensModel as mm
+
+
+SAMPLE_FILE_01 = join(mm.DATA_PATH, "photometry_files", "OB08092", "phot_ob08092_O4.dat")
+
+
+def test_get_chi2_batch():
+    """
+    Check that chi2 calculated using a pool of processes is the same as
+    calculated in the main process.
+    """
+    data = mm.MulensData(file_name=SAMPLE_FILE_01)
+    model = mm.Model({'t_0': 5379.571, 'u_0': 0.01, 't_E': 17.94, 'rho': 0.02})
+    model.set_magnification_methods([5370., 'finite_source_uniform_Gould94', 5390.])
+    event = mm.Event(data, model)
+    parameters = np.array([[5379.571, 0.01], [5379.6, 0.02], [5379.5, 0.005], [5379.4, 0.1], [5379.7, 0.5]])
+    expected = event.get_chi2_batch(parameters, ['t_0', 'u_0'])
+
+    with mm.EventPool(event, ['t_0', 'u_0'], processes=2) as pool:
+        np.testing.assert_almost_equal(pool.get_chi2_batch(parameters), expected)
+        np.testing.assert_almost_equal(pool.get_chi2_batch(parameters[:1, ::-1], ['u_0', 't_0']), expected[:1])
+
+
+class TestEventPool(unittest.TestCase):
+    def test_wrong_event(self):
+        with self.assertRaises(TypeError):
+            mm.EventPool(mm.Model({'t_0': 0., 'u_0': 0.1, 't_E': 10.}))
@@ -333,6 +333,39 @@ def test_fit_fluxes():
     assert (chi2_1 != my_fit.chi2)
 
 
+def test_fit_fluxes_normal_equations():
+    """
+    Compare the closed-form solution of normal equations with np.linalg.lstsq()
+    for 1, 2, and 3 free fluxes and check fallback for ill-conditioned case.
+    """
+    (model, t, A_1, A_2) = generate_binary_model()
+    np.random.seed(12345)
+    f_mod = 1. * A_1 + 0.5 * A_2 + 0.2
+    dataset = generate_dataset(f_mod * (1. + 0.01 * np.random.randn(len(t))), t)
+    settings = [{}, {'fix_blend_flux': 0.}, {'fix_blend_flux': 0., 'fix_source_flux': [1., False]},
+                {'fix_source_flux_ratio': 0.5}]
+    for kwargs in settings:
+        fit = mm.FitData(model=model, dataset=dataset, **kwargs)
+        fit.fit_fluxes()
+        expected = fit._solve_lstsq(*fit._create_arrays())
+        result = fit._solve_normal_equations(*fit._create_arrays())
+        assert_allclose(result, expected, rtol=1.e-10)
+
+    # Magnification is almost constant, hence, lstsq() has to be used:
+    model_2 = mm.Model({'t_0': 0., 'u_0': 10., 't_E': 1.})
+    fit = mm.FitData(model=model_2, dataset=dataset)
+    assert fit._solve_normal_equations(*fit._create_arrays()) is None
+    fit.fit_fluxes()
+    assert np.isfinite(fit.source_flux)
+
+    # Weights have to be updated if the data are changed:
+    fit = mm.FitData(model=model, dataset=dataset)
+    fit.fit_fluxes()
+    dataset.bad = np.arange(len(t)) > 500
+    fit.fit_fluxes()
+    assert_allclose(fit._get_weights(), dataset.err_flux[dataset.good]**-2)
+
+
 def create_0939_parallax_model():
     """Create Model instance with parallax"""
     model_parameters = {
@@ -663,6 +696,123 @@ class TestGradient(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             fit.get_chi2_gradient(['t_0', 'u_0', 't_E'])
 
+    def test_no_gradient_for_finite_source_binary_lens(self):
+        """
+        Make sure that gradient for finite-source binary-lens methods is not implemented.
+        """
+        data = mm.MulensData(file_name=SAMPLE_FILE_02)
+        model = mm.Model({'t_0': 2456836.22, 'u_0': 0.922, 't_E': 22.87, 's': 1.1, 'q': 0.1, 'alpha': 30., 'rho': 0.01})
+        model.set_magnification_methods([2456830., 'quadrupole', 2456840.])
+        fit = mm.FitData(model, data)
+
+        with self.assertRaises(NotImplementedError):
+            fit.get_chi2_gradient(['t_0', 'u_0', 't_E'])
+
+
+def _get_chi2_gradient_finite_differences(model, dataset, parameters, step=1.e-6):
+    """
+    Calculate chi^2 gradient using central finite differences.
+    """
+    out = []
+    for parameter in parameters:
+        value = getattr(model.parameters, parameter)
+        chi2 = []
+        for step_ in [step, -step]:
+            setattr(model.parameters, parameter, value + step_)
+            fit = mm.FitData(model=model, dataset=dataset)
+            fit.update()
+            chi2.append(fit.chi2)
+        setattr(model.parameters, parameter, value)
+        out.append((chi2[0] - chi2[1]) / (2. * step))
+
+    return np.array(out)
+
+
+def _get_simulated_dataset(model, times):
+    """
+    Simulate a dataset for given model.
+    """
+    magnification = model.get_magnification(times)
+    if model.n_sources == 1:
+        flux = 1000. * magnification + 100.
+    else:
+        flux = 1000. * magnification[0] + 500. * magnification[1] + 100.
+
+    flux *= 1. + 0.01 * np.sin(17. * times)
+    bad = np.arange(len(times)) % 20 == 0
+    return mm.MulensData([times, flux, 0.01 * flux], phot_fmt='flux', bad=bad)
+
+
+def test_chi2_gradient_binary_lens():
+    """
+    Compare chi^2 gradient for binary lens with finite differences.
+    """
+    model = mm.Model({'t_0': 2456789., 'u_0': 0.1, 't_E': 25., 'alpha': 130., 's': 1.2, 'q': 0.05})
+    dataset = _get_simulated_dataset(model, np.linspace(2456760., 2456820., 300))
+    parameters = ['t_0', 'u_0', 't_E', 'alpha', 's', 'q']
+
+    gradient = mm.FitData(model=model, dataset=dataset).get_chi2_gradient(parameters)
+    expected = _get_chi2_gradient_finite_differences(model, dataset, parameters)
+    assert_allclose(gradient, expected, rtol=1.e-3)
+
+
+def test_chi2_gradient_binary_source():
+    """
+    Compare chi^2 gradient for binary source with finite differences.
+    """
+    model = mm.Model({'t_0_1': 2456789., 'u_0_1': 0.1, 't_0_2': 2456795., 'u_0_2': 0.3, 't_E': 25.})
+    dataset = _get_simulated_dataset(model, np.linspace(2456760., 2456820., 300))
+    parameters = ['t_0_1', 'u_0_1', 't_0_2', 'u_0_2', 't_E']
+
+    gradient = mm.FitData(model=model, dataset=dataset).get_chi2_gradient(parameters)
+    expected = _get_chi2_gradient_finite_differences(model, dataset, parameters)
+    assert_allclose(gradient, expected, rtol=1.e-3)
+
+
+def test_get_chi2_and_gradient_keeps_magnification_curves():
+    """
+    Check that get_chi2_and_gradient() gives the same results as separate
+    calls and keeps the magnification curves it has calculated.
+    """
+    model = mm.Model({'t_0_1': 2456789., 'u_0_1': 0.1, 't_0_2': 2456795., 'u_0_2': 0.3, 't_E': 25.})
+    dataset = _get_simulated_dataset(model, np.linspace(2456760., 2456820., 300))
+    parameters = ['t_0_1', 'u_0_1', 't_0_2', 'u_0_2', 't_E']
+
+    fit = mm.FitData(model=model, dataset=dataset)
+    (chi2, gradient) = fit.get_chi2_and_gradient(parameters)
+    curves = (fit._data_magnification_curve_1, fit._data_magnification_curve_2)
+    assert curves[0] is not None and curves[1] is not None
+    assert fit.magnification_curves == curves
+    assert fit.data_magnification[0][dataset.bad].tolist() == [0.] * np.sum(dataset.bad)
+
+    fit_2 = mm.FitData(model=model, dataset=dataset)
+    fit_2.update()
+    assert_allclose(chi2, fit_2.chi2)
+    assert_allclose(gradient, fit_2.get_chi2_gradient(parameters), rtol=1.e-10)
+    assert_allclose(fit.source_fluxes, fit_2.source_fluxes)
+
+
+def test_chi2_gradient_WittMao94():
+    """
+    Compare chi^2 gradient for Witt & Mao (1994) methods with finite
+    differences.
+    """
+    model = mm.Model({'t_0': 6789., 'u_0': 0.003, 't_E': 25., 'rho': 0.005})
+    model.set_magnification_methods([6788.5, 'finite_source_uniform_WittMao94', 6789.5])
+    dataset = _get_simulated_dataset(model, np.linspace(6788.7, 6789.3, 200))
+    parameters = ['t_0', 'u_0', 't_E', 'rho']
+
+    gradient = mm.FitData(model=model, dataset=dataset).get_chi2_gradient(parameters)
+    expected = _get_chi2_gradient_finite_differences(model, dataset, parameters, step=1.e-7)
+    assert_allclose(gradient, expected, rtol=1.e-4)
+
+    model.set_magnification_methods([6788.5, 'finite_source_LD_WittMao94', 6789.5])
+    model.set_limb_coeff_gamma('I', 0.5)
+    dataset.bandpass = 'I'
+    gradient = mm.FitData(model=model, dataset=dataset).get_chi2_gradient(parameters)
+    expected = _get_chi2_gradient_finite_differences(model, dataset, parameters, step=1.e-7)
+    assert_allclose(gradient, expected, rtol=1.e-3)
+
 
 class TestFSPLGradient(unittest.TestCase):
     """ Compares various parts of the FSPL Derivative calculations to the
@@ -880,19 +1030,25 @@ class TestFSPLGradient(unittest.TestCase):
         with self.assertRaises(AttributeError):
             fit.get_d_A_d_rho()
 
-    def test_check_FSPLDerivs_errors_1(self):
+    def test_d_A_d_rho_WittMao94(self):
+        """
+        For small rho, d A / d rho from Witt & Mao (1994) and Gould (1994)
+        methods should be very similar.
+        """
         parameters = ['t_0', 'u_0', 't_E', 'rho']
-        model = mm.Model(dict(zip(parameters, self.sfit_mat.a)))
-        self._set_limb_coeffs(model)
-
-        t_star = model.parameters.rho * model.parameters.t_E
-        n_t_star = 9.
-        t_lim_1 = model.parameters.t_0 - n_t_star * t_star
-        t_lim_2 = model.parameters.t_0 + n_t_star * t_star
-        model.set_magnification_methods([t_lim_1, 'finite_source_uniform_WittMao94', t_lim_2])
-        fit = mm.FitData(model=model, dataset=self.datasets[0])
-        with self.assertRaises(NotImplementedError):
-            fit.get_d_A_d_rho()
+        d_A_d_rho = {}
+        for method in ['finite_source_uniform_WittMao94', 'finite_source_uniform_Gould94']:
+            model = mm.Model(dict(zip(parameters, self.sfit_mat.a)))
+            self._set_limb_coeffs(model)
+            t_star = model.parameters.rho * model.parameters.t_E
+            n_t_star = 9.
+            t_lim_1 = model.parameters.t_0 - n_t_star * t_star
+            t_lim_2 = model.parameters.t_0 + n_t_star * t_star
+            model.set_magnification_methods([t_lim_1, method, t_lim_2])
+            fit = mm.FitData(model=model, dataset=self.datasets[0])
+            d_A_d_rho[method] = fit.get_d_A_d_rho()
+
+        assert_allclose(*d_A_d_rho.values(), rtol=0.001)
 
     def test_magnification_methods_parameters(self):
         parameters = ['t_0', 'u_0', 't_E', 'rho']
@@ -133,14 +133,17 @@ def test_Lee09_and_WittMao94():
     np.testing.assert_almost_equal(expected_1, results_1, decimal=3)
 
     # Tests for Witt & Mao 1994 start here
+    mag_curve_2 = mm.MagnificationCurve(times=t_vec, parameters=params_0)
     methods_2 = [-5., 'finite_source_uniform_WittMao94', 5.]
-    mag_curve_0.set_magnification_methods(methods_2, 'point_source')
-    results_2 = mag_curve_0.get_point_lens_magnification()
+    mag_curve_2.set_magnification_methods(methods_2, 'point_source')
+    results_2 = mag_curve_2.get_point_lens_magnification()
     np.testing.assert_almost_equal(expected_0, results_2, decimal=4)
 
+    mag_curve_3 = mm.MagnificationCurve(times=t_vec, parameters=params_1,
+                                        gamma=0.5)
     methods_3 = [-5., 'finite_source_LD_WittMao94', 5.]
-    mag_curve_1.set_magnification_methods(methods_3, 'point_source')
-    results_3 = mag_curve_1.get_point_lens_magnification()
+    mag_curve_3.set_magnification_methods(methods_3, 'point_source')
+    results_3 = mag_curve_3.get_point_lens_magnification()
     np.testing.assert_almost_equal(expected_1, results_3, decimal=3)
 
 
@@ -161,6 +164,20 @@ def test_PSPL_for_binary():
     np.testing.assert_almost_equal(pspl, mag_curve.get_magnification())
 
 
+def test_point_source_vectorized_for_binary():
+    """
+    test that point_source_vectorized gives the same results as point_source
+    """
+    t_vec = np.linspace(990., 1010., 200)
+    params = mm.ModelParameters({
+        't_0': 1000., 'u_0': 0.1, 't_E': 20., 's': 1.2, 'q': 0.1, 'alpha': 10.})
+    mag_curve_1 = mm.MagnificationCurve(times=t_vec, parameters=params)
+    mag_curve_1.set_magnification_methods(None, 'point_source')
+    mag_curve_2 = mm.MagnificationCurve(times=t_vec, parameters=params)
+    mag_curve_2.set_magnification_methods([995., 'point_source_vectorized', 1005.], 'point_source')
+    np.testing.assert_allclose(mag_curve_1.get_magnification(), mag_curve_2.get_magnification(), rtol=1.e-9)
+
+
 class TestEvent(unittest.TestCase):
     def test_error_in_init(self):
         """
@@ -266,3 +283,22 @@ class FSMethodWarningsTest(unittest.TestCase):
 
         with self.assertWarns(UserWarning):
             mag_curve.get_magnification()
+
+
+def test_methods_indices():
+    """
+    Check which epochs are assigned to which methods, including a method
+    used in 2 ranges and epochs outside all ranges.
+    """
+    times = np.array([0., 1.5, 2.5, 3.5, 4.5, 5.5])
+    params = mm.ModelParameters({'t_0': 3., 'u_0': 0.1, 't_E': 10., 'rho': 0.01})
+    mag_curve = mm.MagnificationCurve(times=times, parameters=params)
+    methods = [1., 'finite_source_uniform_Gould94', 2., 'point_source', 3.,
+               'finite_source_uniform_Gould94', 4., 'point_source', 5.]
+    mag_curve.set_magnification_methods(methods, 'point_source_point_lens')
+    indices = mag_curve.methods_indices
+    assert set(indices.keys()) == {'point_source_point_lens', 'finite_source_uniform_Gould94', 'point_source'}
+    np.testing.assert_equal(indices['finite_source_uniform_Gould94'], [False, True, False, True, False, False])
+    np.testing.assert_equal(indices['point_source'], [False, False, True, False, True, False])
+    np.testing.assert_equal(indices['point_source_point_lens'], [True, False, False, False, False, True])
+    assert mag_curve.methods_for_epochs[1] == 'finite_source_uniform_Gould94'
@@ -282,8 +282,8 @@ def test_BLPS_02():
     data = mm.MulensData(data_list=[t, t*0.+16., t*0.+0.01])
     result = model.get_magnification(data.time)
 
-    expected = np.array([4.69183078, 2.87659723, 1.83733975, 1.63865704,
-                         1.61038135, 1.63603122, 1.69045492, 1.77012807])
+    expected = np.array([4.69183078, 2.87659723, 1.80993911, 1.63238025,
+                         1.60813527, 1.63603122, 1.69045492, 1.77012807])
     almost(result, expected, decimal=4)
 
     # Possibly, this test should be re-created in test_FitData.py
@@ -352,8 +352,8 @@ class TestBLPS02AC(unittest.TestCase):
     def test_mag_calculation_1(self):
         """Test calculation of magnification"""
         result = self.model_ac_1.get_magnification(self.data.time)
-        expected = np.array([4.69183078, 2.87659723, 1.83733975, 1.63865704,
-                             1.61038135, 1.63603122, 1.69045492, 1.77012807])
+        expected = np.array([4.69183078, 2.87659723, 1.80993911, 1.63238025,
+                             1.60813527, 1.63603122, 1.69045492, 1.77012807])
         almost(result, expected, decimal=3)
 
     def test_methods_parameters_2(self):
@@ -434,6 +434,17 @@ class TestMethodsParameters(unittest.TestCase):
         assert result_1[0] != result_3[0]
         assert result_2[0] != result_3[0]
 
+    def test_mag_calculations_n_threads(self):
+        """
+        Check that n_threads passed via methods parameters does not change
+        the results.
+        """
+        times = np.linspace(2456116.5, 2456117.5, 50)
+        self.model_3.set_magnification_methods_parameters({'VBBL': {'accuracy': 1.e-5, 'n_threads': 3}})
+        result = self.model_3.get_magnification(times)
+        expected = self.model_1.get_magnification(times)
+        almost(result, expected, decimal=3)
+
     def test_get_magnification_methods_parameters(self):
         with self.assertRaises(KeyError):
             self.model_1.get_magnification_methods_parameters('vbbl')
@@ -1025,6 +1036,53 @@ class TestNSources(unittest.TestCase):
 #    raise NotImplementedError()
 
 
+def test_get_magnification_batch():
+    """
+    Check that magnification for many sets of parameters at once is
+    the same as calculated one by one.
+    """
+    model = mm.Model({'t_0': 2456789.0, 'u_0': 0.05, 't_E': 20., 'rho': 0.03})
+    model.set_magnification_methods([2456780., 'finite_source_uniform_Gould94', 2456800.])
+    times = np.linspace(2456770., 2456810., 101)
+    values = np.array([[2456789.0, 0.05], [2456789.5, 0.02], [2456788.0, 0.1]])
+
+    result = model.get_magnification_batch(times, values, ['t_0', 'u_0'])
+    assert result.shape == (3, 101)
+    assert model.parameters.t_0 == 2456789.0
+    for (values_, result_) in zip(values, result):
+        model.parameters.t_0 = values_[0]
+        model.parameters.u_0 = values_[1]
+        np.testing.assert_allclose(result_, model.get_magnification(times), rtol=1.e-12)
+
+
+class TestGetMagnificationBatch(unittest.TestCase):
+    def setUp(self):
+        self.model = mm.Model({'t_0': 2456789.0, 'u_0': 0.05, 't_E': 20.})
+        self.times = np.linspace(2456770., 2456810., 11)
+
+    def test_wrong_name(self):
+        with self.assertRaises(KeyError):
+            self.model.get_magnification_batch(self.times, [[2456789., 0.1]], ['t_0', 'u_1'])
+
+    def test_negative_t_E(self):
+        with self.assertRaises(ValueError):
+            self.model.get_magnification_batch(self.times, [[20.], [-20.]], ['t_E'])
+
+    def test_methods_used(self):
+        """
+        Check that methods are selected the same way as in MagnificationCurve.
+        """
+        model = mm.Model({'t_0': 2456789.0, 'u_0': 0.05, 't_E': 20., 'rho': 0.01})
+        model.set_magnification_methods([2456780., 'finite_source_uniform_WittMao94', 2456790.,
+                                         'point_source', 2456800.])
+        for times in [self.times, self.times[3:6], self.times[5:6], self.times[:1]]:
+            curve = model.get_magnification_curve(times, None, 0.)
+            assert model._get_methods_used(times) == set(curve.methods_indices.keys())
+
+        assert not model._can_use_batch(self.times[3:6], ['t_0'])
+        assert model._can_use_batch(self.times[6:8], ['t_0'])
+
+
 # Tests to Add:
 #
 # test set_times:
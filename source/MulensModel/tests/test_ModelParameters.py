@@ -1,4 +1,5 @@
 import unittest
+import pickle
 import pytest
 import numpy as np
 
@@ -460,6 +461,20 @@ def test_n_lenses():
     assert p_3.n_lenses == 2
 
 
+def test_pickle_Cassan08():
+    """
+    Check that pickled Cassan08 parameters do not contain the table of
+    UniformCausticSampling and give the same standard parameters.
+    """
+    parameters = mm.ModelParameters({'x_caustic_in': 0.1, 'x_caustic_out': 0.15, 't_caustic_in': 1000,
+                                     't_caustic_out': 2000., 's': 1, 'q': 0.8})
+    t_0 = parameters.t_0
+    parameters_2 = pickle.loads(pickle.dumps(parameters))
+    assert parameters_2._uniform_caustic is None
+    assert parameters_2.t_0 == t_0
+    assert parameters_2.t_E == parameters.t_E
+
+
 def test_single_lens_convergence_K_shear_G():
     """
     Test single lens with convergence_K and shear_G in intialized
@@ -894,6 +909,25 @@ def test_reference_position():
     assert text_1 == text_2
 
 
+def test_xallarap_orbit_reused():
+    """
+    Make sure that xallarap Orbit is re-created only if orbital parameters
+    change and that the reference position is updated then.
+    """
+    model = mm.ModelParameters({**xallarap_parameters})
+    orbit = model.xallarap_orbit
+    key = model.xallarap_orbit_key
+    model.t_E = 12.
+    assert model.xallarap_orbit is orbit
+    assert model.xallarap_orbit_key == key
+
+    position = model.xallarap_reference_position
+    model.xi_semimajor_axis = 2. * xallarap_parameters['xi_semimajor_axis']
+    assert model.xallarap_orbit is not orbit
+    assert model.xallarap_orbit_key != key
+    np.testing.assert_almost_equal(model.xallarap_reference_position, 2. * position)
+
+
 class Test1L3SModels(unittest.TestCase):
 
     def setUp(self):
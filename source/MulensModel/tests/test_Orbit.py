@@ -218,3 +218,19 @@ def test_20_OrbitEccentric_based_on_argument_of_latitude():
         epoch_reference=2456789.01234+60)
     position = orbit.get_orbital_plane_position(2456789.01234-180.)
     assert_almost_equal(position, [-2.25, 0.])
+
+
+def test_21_Kepler_equation_solution():
+    """
+    Check that Kepler's equation is solved to machine precision for
+    a range of eccentricities, including the ones very close to 1.
+    """
+    mean_anomaly = np.linspace(-np.pi, np.pi, 1001)
+    for eccentricity in [0.01, 0.5, 0.9, 0.99, 0.9999]:
+        orbit = OrbitEccentric(400., 100., 0., 0., eccentricity, 0., 0.)
+        anomaly = orbit._get_eccentric_anomaly_from_normalized_mean_anomaly(mean_anomaly)
+        residual = anomaly - eccentricity * np.sin(anomaly) - mean_anomaly
+        assert np.max(np.abs(residual)) < 1.e-14
+
+    anomaly = orbit._get_eccentric_anomaly_from_normalized_mean_anomaly(0.1)
+    assert_almost_equal(anomaly - eccentricity * np.sin(anomaly), 0.1, 14)
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+from scipy import integrate
 import os
 
 import MulensModel as mm
@@ -51,6 +52,28 @@ def test_B_1_function():
     np.testing.assert_almost_equal(test_b_1, data['b_1'], decimal=4)
 
 
+def test_B_0_B_1_direct_vs_interpolation():
+    """
+    Direct calculation of B_0 and B_1 should agree with
+    interpolation and also work outside the interpolation table.
+    """
+    parameters = mm.ModelParameters({'t_0': 0., 'u_0': 0.01, 't_E': 1., 'rho': 0.01})
+    times = np.concatenate((np.linspace(-0.1, 0.1, 1001), np.linspace(0.1, 200., 300)))
+    trajectory = mm.Trajectory(times, parameters)
+    kwargs = {'trajectory': trajectory, 'gamma': 0.5}
+    direct = mm.FiniteSourceLDYoo04Magnification(direct=True, **kwargs)
+    interpolated = mm.FiniteSourceLDYoo04Magnification(**kwargs)
+    mask = (direct.z_ < 99.)  # The table is dense only for these values.
+    np.testing.assert_allclose(direct.b0[mask], interpolated.b0[mask], atol=1.e-6)
+    np.testing.assert_allclose(direct.b1[mask], interpolated.b1[mask], atol=1.e-6)
+
+    mask = (direct.z_ > 1000.)
+    assert np.sum(mask) > 10
+    z = direct.z_[mask]
+    np.testing.assert_allclose(direct.b0[mask], 1. + 1. / (8. * z**2), rtol=1.e-12)
+    np.testing.assert_allclose(direct.b1[mask], 1. / (40. * z**2), rtol=1.e-5)
+
+
 def test_get_point_lens_finite_source_magnification():
     """test PLFS"""
     (data, _, trajectory) = get_variables()
@@ -71,6 +94,136 @@ def test_get_point_lens_limb_darkening_magnification():
         fspl_magnification/data['Mag_LD'], 1., decimal=4)
 
 
+def test_Lee09_magnification():
+    """
+    test vectorized Lee et al. 2009 calculations with and without LD
+    """
+    (data, gamma, trajectory) = get_variables()
+    uniform = mm.pointlens.FiniteSourceUniformLee09Magnification(
+        trajectory=trajectory)
+    np.testing.assert_allclose(
+        uniform.get_magnification(), data['Mag_FS'], rtol=3.e-4)
+
+    limb_darkening = mm.pointlens.FiniteSourceLDLee09Magnification(
+        trajectory=trajectory, gamma=gamma)
+    result = limb_darkening.get_magnification()
+    np.testing.assert_allclose(result, data['Mag_LD'], rtol=3.e-4)
+
+    limb_darkening._max_grid_size = 1  # Calculate epochs one by one.
+    np.testing.assert_almost_equal(limb_darkening.get_magnification(), result)
+
+
+def test_WittMao94_magnification():
+    """
+    test vectorized Witt & Mao 1994 calculations with and without LD
+    """
+    (data, gamma, trajectory) = get_variables()
+    uniform = mm.pointlens.FiniteSourceUniformWittMao94Magnification(
+        trajectory=trajectory)
+    np.testing.assert_allclose(
+        uniform.get_magnification(), data['Mag_FS'], rtol=1.e-5)
+
+    limb_darkening = mm.pointlens.FiniteSourceLDWittMao94Magnification(
+        trajectory=trajectory, gamma=gamma)
+    np.testing.assert_allclose(
+        limb_darkening.get_magnification(), data['Mag_LD'], rtol=1.e-4)
+
+
+def test_WittMao94_magnification_small_rho():
+    """
+    Compare Witt & Mao 1994 uniform-source magnification for small rho
+    with direct integration of point-source magnification over the source.
+    """
+    def integrate_over_source(u, rho):
+        def point_source(phi, r):
+            s2 = u**2 + r**2 + 2. * u * r * np.cos(phi)
+            return r * (s2 + 2.) / np.sqrt(s2 * (s2 + 4.))
+
+        return 2. * integrate.dblquad(point_source, 0., rho, 0., np.pi, epsrel=1.e-10)[0] / (np.pi * rho**2)
+
+    for rho in [0.001, 0.01]:
+        u = np.array([2. * rho, 10. * rho, 0.5, 1.8])
+        parameters = mm.ModelParameters({'t_0': 0., 'u_0': 0., 't_E': 1., 'rho': rho})
+        trajectory = mm.Trajectory(u, parameters)
+        uniform = mm.pointlens.FiniteSourceUniformWittMao94Magnification(trajectory=trajectory)
+        expected = [integrate_over_source(u_, rho) for u_ in u]
+        np.testing.assert_allclose(uniform.get_magnification(), expected, rtol=1.e-8)
+
+
+def test_WittMao94_magnification_u_close_to_rho():
+    """
+    Check that epochs with u equal to rho up to rounding errors give
+    finite and continuous magnification.
+    """
+    times = np.linspace(-2., 2., 401)
+    parameters = mm.ModelParameters({'t_0': 0., 'u_0': 0., 't_E': 1., 'rho': 0.1})
+    model = mm.Model(parameters)
+    for method in ['finite_source_uniform_WittMao94', 'finite_source_LD_WittMao94']:
+        model.set_magnification_methods([-2.5, method, 2.5])
+        assert np.all(np.isfinite(model.get_magnification(times, gamma=0.5)))
+
+    trajectory = mm.Trajectory(times, parameters)
+    uniform = mm.pointlens.FiniteSourceUniformWittMao94Magnification(trajectory=trajectory)
+    rho = 0.1
+    u = rho * (1. + np.array([-1.e-8, -1.e-15, 0., 1.e-15, 1.e-8]))
+    u2 = rho**2
+    expected = (2. / rho + (1. + u2) * (np.pi / 2. + np.arcsin((u2 - 1.) / (u2 + 1.))) / u2) / np.pi
+    np.testing.assert_allclose(uniform._get_magnification_WM94(u=u, rho=rho), expected, rtol=1.e-6)
+
+
+def test_WittMao94_magnification_2D_input():
+    """
+    check that 2D input gives the same results as 1D input, including u = rho
+    """
+    (_, _, trajectory) = get_variables()
+    uniform = mm.pointlens.FiniteSourceUniformWittMao94Magnification(
+        trajectory=trajectory)
+    u = np.array([0.001, 0.005, 0.01, 0.1])
+    rho = np.array([0.002, 0.005])
+    result = uniform._get_magnification_WM94(u=u[:, np.newaxis], rho=rho)
+    assert result.shape == (len(u), len(rho))
+    for (i, rho_) in enumerate(rho):
+        expected = uniform._get_magnification_WM94(u=u, rho=rho_)
+        np.testing.assert_almost_equal(result[:, i], expected)
+
+    u2 = 0.005**2
+    expected = 2. / 0.005 + (1. + u2) * (np.pi / 2. + np.arcsin((u2 - 1.) / (u2 + 1.))) / u2
+    np.testing.assert_almost_equal(result[1, 1], expected / np.pi)
+
+
+def test_EllipUtils_ellip3():
+    """
+    check elliptic integral of the third kind against sympy
+    """
+    n = np.array([1.e-5, 0.3, 0.9, 0.999])
+    k = np.array([0.2, 1.e-5, 0.8, 0.9999])
+    expected = np.array([1.659632128, 1.87746582, 8.842065474, 1919.098709])
+    # Values calculated with sympy.elliptic_pi().
+    np.testing.assert_allclose(mm.EllipUtils.ellip3(n, k), expected, rtol=1.e-9)
+    np.testing.assert_allclose(mm.EllipUtils.ellip3(n, k, one_minus_n=1.-n, one_minus_k=1.-k), expected, rtol=1.e-9)
+
+
+def test_B0B1Utils_interpolate():
+    """
+    Compare spline interpolation with scipy interp1d(kind='cubic')
+    and check values outside the table.
+    """
+    from scipy.interpolate import interp1d
+
+    file_name = os.path.join(mm.DATA_PATH, 'interpolation_table_b0b1_v3.dat')
+    table = np.loadtxt(file_name)
+    z = np.concatenate((np.linspace(0., 5., 1001), np.geomspace(5., 9900., 200), [0.5e-5, 1.e4]))
+    utils = mm.B0B1Utils()
+    result = utils.interpolate(z)
+    for i in range(5):
+        fill_value = 1. if i == 0 else 0.
+        expected = interp1d(table[:, 0], table[:, i+1], kind='cubic', bounds_error=False, fill_value=fill_value)(z)
+        np.testing.assert_allclose(result[:, i], expected, rtol=0., atol=1.e-12)
+
+    np.testing.assert_equal(utils.interpolate_B1(z), result[:, 2])
+    assert utils.z_max_interpolation == table[-1, 0]
+
+
 def test_fspl_noLD():
     """
     check if FSPL magnification is calculate properly
@@ -131,6 +284,45 @@ def test_get_d_u_d_params():
         assert (np.abs(ratio - 1.) > 0.001).all()
 
 
+def test_WittMao94_derivatives():
+    """
+    Compare d A / d u and d A / d rho for uniform source with finite
+    differences of magnification calculated with Lee et al. (2009) method.
+    """
+    times = np.linspace(-0.05, 0.05, 101)
+    parameters = {'t_0': 0., 'u_0': 0.01, 't_E': 1., 'rho': 0.02}
+    trajectory = mm.Trajectory(times, mm.ModelParameters(parameters))
+    lens = mm.pointlens.FiniteSourceUniformWittMao94Magnification(trajectory=trajectory)
+    d_A_d_params = lens.get_d_A_d_params(['u_0', 'rho'])
+
+    for key in ['u_0', 'rho']:
+        magnifications = []
+        for step in [1.e-6, -1.e-6]:
+            parameters_ = {**parameters, key: parameters[key] + step}
+            trajectory = mm.Trajectory(times, mm.ModelParameters(parameters_))
+            lens_ = mm.pointlens.FiniteSourceUniformLee09Magnification(trajectory=trajectory)
+            magnifications.append(lens_.get_magnification())
+        expected = (magnifications[0] - magnifications[1]) / 2.e-6
+        np.testing.assert_allclose(d_A_d_params[key], expected, rtol=0.002, atol=1.)
+
+
+def test_get_d_u_d_params_t_E_t_eff():
+    """
+    Check derivatives of u for model defined by t_0, t_E, and t_eff.
+    """
+    times = np.linspace(-2., 2., 11)
+    parameters = {'t_0': 0.1, 't_E': 1.5, 't_eff': 0.3}
+    trajectory = mm.Trajectory(times, mm.ModelParameters(parameters))
+    result = mm.PointSourcePointLensMagnification(trajectory).get_d_u_d_params(list(parameters.keys()))
+
+    for (key, value) in parameters.items():
+        u = []
+        for step in [1.e-6, -1.e-6]:
+            trajectory = mm.Trajectory(times, mm.ModelParameters({**parameters, key: value + step}))
+            u.append(np.sqrt(trajectory.x**2 + trajectory.y**2))
+        np.testing.assert_allclose(result[key], (u[0] - u[1]) / 2.e-6, rtol=1.e-6)
+
+
 # Make sure every element of the PointLensMagnification classes are tested.
 class TestPointSourcePointLensMagnification(unittest.TestCase):
 
@@ -51,6 +51,26 @@ def test_get_ps_with_shear_magnification_2():
     np.testing.assert_almost_equal(test_pspl_shear[0], 11.7608836, decimal=5)
 
 
+def test_get_ps_with_shear_magnification_many_epochs():
+    """
+    Check that magnifications calculated for many epochs at once are
+    the same as for each epoch separately.
+    """
+    parameters = mm.ModelParameters({
+        't_0': 1000., 'u_0': 0.05, 't_E': 20., 'alpha': 30.,
+        'convergence_K': 0.05, 'shear_G': complex(0.1, -0.05)})
+    times = np.linspace(980., 1020., 11)
+    trajectory = mm.Trajectory(times, parameters)
+    result = mm.PointSourcePointLensWithShearMagnification(
+        trajectory=trajectory).get_magnification()
+
+    for (time, magnification) in zip(times, result):
+        trajectory = mm.Trajectory(np.array([time]), parameters)
+        expected = mm.PointSourcePointLensWithShearMagnification(
+            trajectory=trajectory).get_magnification()
+        np.testing.assert_almost_equal(magnification, expected[0])
+
+
 # class test_errors(unittest.TestCase):
 #     # def test_function_input(self):
 #     #     """
@@ -35,3 +35,47 @@ def test_coords_format():
     for trajectory in trajectories:
         assert np.all(trajectory.x == trajectories[0].x)
         assert np.all(trajectory.y == trajectories[0].y)
+
+
+def test_xallarap_cache():
+    """
+    Check that positions on xallarap orbit are reused if only non-orbital
+    parameters change.
+    """
+    cache = mm.Trajectory.xallarap_cache
+    cache.clear()
+    times = np.linspace(2456000., 2456100., 11)
+    params = mm.ModelParameters({
+        't_0': 2456050., 'u_0': 0.1, 't_E': 50., 'xi_period': 30., 'xi_semimajor_axis': 0.1,
+        'xi_Omega_node': 10., 'xi_inclination': 20., 'xi_argument_of_latitude_reference': 30., 't_0_xi': 2456050.})
+
+    trajectory_1 = mm.Trajectory(times, params)
+    assert (cache.n_entries, cache.misses) == (1, 1)
+    params.u_0 = 0.2
+    trajectory_2 = mm.Trajectory(times, params)
+    assert (cache.n_entries, cache.hits) == (1, 1)
+    np.testing.assert_almost_equal(trajectory_2.y - trajectory_1.y, 0.1)
+
+    params.xi_period = 40.
+    mm.Trajectory(times, params)
+    assert cache.n_entries == 2
+
+
+def test_annual_parallax_cache():
+    """
+    Check that annual parallax results are cached and reused.
+    """
+    cache = mm.Trajectory.annual_parallax_cache
+    cache.clear()
+    times = np.linspace(2456000., 2456100., 11)
+    params = mm.ModelParameters({'t_0': 2456050., 'u_0': 0.1, 't_E': 50., 'pi_E_N': 0.1, 'pi_E_E': 0.2})
+    kwargs = {'parameters': params, 'coords': "18:00:00 -30:00:00", 'parallax': {'earth_orbital': True}}
+
+    trajectory_1 = mm.Trajectory(times, **kwargs)
+    assert (cache.n_entries, cache.misses) == (1, 1)
+    trajectory_2 = mm.Trajectory(times.copy(), **kwargs)
+    assert (cache.n_entries, cache.hits) == (1, 1)
+    np.testing.assert_equal(trajectory_1.x, trajectory_2.x)
+
+    mm.Trajectory(times + 1., **kwargs)
+    assert cache.n_entries == 2
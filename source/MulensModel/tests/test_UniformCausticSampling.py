@@ -1,3 +1,5 @@
+import os
+import tempfile
 import numpy as np
 
 import MulensModel as mm
@@ -71,3 +73,63 @@ def test_get_uniform_sampling():
     (x_caustic_in, x_caustic_out) = sampling.get_uniform_sampling(n_points=n)
     assert x_caustic_in.shape == (n,)
     assert x_caustic_out.shape == (n,)
+
+
+def test_critical_curve_branches():
+    """
+    Check that critical curve points calculated for all phi at once are
+    the same as from polyroots() and that for close topology each column
+    follows a single branch.
+    """
+    (s, q) = (0.5, 0.001)
+    sampling = mm.UniformCausticSampling(s=s, q=q, n_points=1000)
+    z_all = sampling._z_all
+    for i in [0, 123, 500, 999]:
+        exp_i_phi = np.exp(1j * sampling._phi[i])
+        coeffs = [-s * s * exp_i_phi / (1. + q), -2. * s * exp_i_phi / (1. + q), s * s - exp_i_phi, 2. * s, 1.]
+        expected = np.polynomial.polynomial.polyroots(coeffs)
+        distances = np.abs(z_all[i][:, np.newaxis] - expected)
+        np.testing.assert_allclose(np.min(distances, axis=1), 0., atol=1.e-12)
+
+    steps = np.abs(z_all[1:] - z_all[:-1])
+    separations = np.abs(z_all[:, :, np.newaxis] - z_all[:, np.newaxis, :])
+    separations[:, np.arange(4), np.arange(4)] = np.inf
+    assert np.max(steps) < 0.5 * np.min(separations)
+    dzeta_dphi = sampling._dzeta_dphi(sampling._z_sum_1[1:], sampling._phi[1:])
+    expected = np.abs(dzeta_dphi) * sampling._d_phi
+    np.testing.assert_allclose(np.diff(sampling._sum_1), expected, rtol=1.e-9, atol=1.e-15)
+
+
+def test_cache():
+    """
+    Check that tables are reused for the same (s, q), including
+    rounding of s and q and reading tables from disk.
+    """
+    cache = mm.UniformCausticSampling.cache
+    try:
+        mm.UniformCausticSampling.cache = mm.ResultsCache()
+        sampling_1 = mm.UniformCausticSampling(s=1.1, q=0.1, n_points=1000)
+        sampling_2 = mm.UniformCausticSampling(s=1.1, q=0.1, n_points=1000)
+        assert mm.UniformCausticSampling.cache.hits == 1
+        assert sampling_1._sum_1 is sampling_2._sum_1
+
+        mm.UniformCausticSampling.cache_tolerance = 0.01
+        sampling_3 = mm.UniformCausticSampling(s=1.1001, q=0.1001, n_points=1000)
+        sampling_4 = mm.UniformCausticSampling(s=1.1002, q=0.1002, n_points=1000)
+        assert sampling_3._sum_1 is sampling_4._sum_1
+        assert abs(sampling_3.s / 1.1001 - 1.) <= 0.005
+        mm.UniformCausticSampling.cache_tolerance = 0.
+
+        with tempfile.TemporaryDirectory() as directory:
+            mm.UniformCausticSampling.cache_dir = directory
+            sampling_5 = mm.UniformCausticSampling(s=0.7, q=0.3, n_points=1000)
+            assert len(os.listdir(directory)) == 1
+            mm.UniformCausticSampling.cache.clear()
+            sampling_6 = mm.UniformCausticSampling(s=0.7, q=0.3, n_points=1000)
+        np.testing.assert_equal(sampling_5._z_sum_2, sampling_6._z_sum_2)
+        assert sampling_5._inflections_fractions == sampling_6._inflections_fractions
+        assert sampling_5.caustic_point(0.3) == sampling_6.caustic_point(0.3)
+    finally:
+        mm.UniformCausticSampling.cache = cache
+        mm.UniformCausticSampling.cache_tolerance = 0.
+        mm.UniformCausticSampling.cache_dir = None
@@ -26,6 +26,18 @@ def test_complex_fsum_1():
     assert mm.Utils.complex_fsum(z) == (1 + 0.8j)
 
 
+def test_polynomial_roots_vectorized():
+    """
+    Compare roots of many polynomials found at once with numpy polyroots().
+    """
+    np.random.seed(12345)
+    coeffs = np.random.normal(size=(100, 6)) + 1.j * np.random.normal(size=(100, 6))
+    result = mm.Utils.polynomial_roots_vectorized(coeffs)
+    for (coeffs_, roots) in zip(coeffs, result):
+        expected = np.polynomial.polynomial.polyroots(coeffs_)
+        np.testing.assert_almost_equal(np.sort_complex(roots), np.sort_complex(expected))
+
+
 def do_mag2flux_conversions_test(mag, mag_err):
     (flux, flux_err) = mm.Utils.get_flux_and_err_from_mag(mag, mag_err)
     (new_mag, new_mag_err) = mm.Utils.get_mag_and_err_from_flux(flux, flux_err)
@@ -61,3 +73,30 @@ def test_n_caustics():
     assert mm.Utils.get_n_caustics(s=s_2, q=q) == 1
     assert mm.Utils.get_n_caustics(s=s_3, q=q) == 1
     assert mm.Utils.get_n_caustics(s=s_4, q=q) == 2
+
+
+def test_ResultsCache():
+    """
+    Check LRU eviction, size limits, and counters of ResultsCache.
+    """
+    cache = mm.ResultsCache(max_entries=2, max_bytes=None)
+    keys = [cache.make_key(np.arange(i, i+10.), 2450000.) for i in range(3)]
+    assert keys[0] == cache.make_key(np.arange(0., 10.), 2450000.)
+    assert keys[0] != cache.make_key(np.arange(0., 10.), 2450001.)
+
+    cache.set(keys[0], {'N': np.zeros(10)})
+    cache.set(keys[1], {'N': np.ones(10)})
+    assert cache.get(keys[0]) is not None
+    cache.set(keys[2], {'N': np.ones(10)})
+    assert cache.get(keys[1]) is None  # It was least recently used.
+    assert cache.get(keys[0]) is not None
+    assert cache.n_entries == 2
+    assert cache.n_bytes == 160
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cache.max_bytes = 100
+    assert cache.n_entries == 1
+    assert cache.get(keys[0]) is not None
+
+    cache.clear()
+    assert (cache.n_entries, cache.n_bytes, cache.hits, cache.misses) == (0, 0, 0, 0)
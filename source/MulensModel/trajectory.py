@@ -1,13 +1,9 @@
 import numpy as np
 
-from astropy import units as u
-from astropy.coordinates import get_body_barycentric
-from astropy.time import Time
-
 from MulensModel import utils
+from MulensModel.earthephemeris import EarthEphemeris
 from MulensModel.modelparameters import ModelParameters
 from MulensModel.coordinates import Coordinates
-from MulensModel.orbits import Orbit
 
 
 class Trajectory(object):
@@ -73,11 +69,23 @@ class Trajectory(object):
 
         coords: :py:class:`~MulensModel.coordinates.Coordinates`
             event coordinates
+
+        annual_parallax_cache: :py:class:`~MulensModel.utils.ResultsCache`
+            class-level cache of Earth positions projected on the sky,
+            which are used for annual parallax; shared by all instances,
+            set its *max_entries* or *max_bytes* to limit memory use
+
+        satellite_parallax_cache: :py:class:`~MulensModel.utils.ResultsCache`
+            the same as *annual_parallax_cache* but for satellite parallax
+
+        xallarap_cache: :py:class:`~MulensModel.utils.ResultsCache`
+            the same as *annual_parallax_cache* but for positions of
+            the source on xallarap orbit; the results are reused if only
+            non-orbital parameters (e.g., u_0 or t_E) change
     """
-    _get_delta_annual_results = dict()
-    _get_delta_annual_last = None
-    _get_delta_annual_last_index = None
-    _get_delta_satellite_results = dict()
+    annual_parallax_cache = utils.ResultsCache()
+    satellite_parallax_cache = utils.ResultsCache()
+    xallarap_cache = utils.ResultsCache()
 
     def __init__(self,
                  times=None, parameters=None, x=None, y=None, parallax=None,
@@ -220,6 +228,60 @@ class Trajectory(object):
         self._x = vector_x
         self._y = vector_y
 
+    def _get_d_xy_d_params(self, parameters):
+        """
+        Calculate derivatives of :py:attr:`~x` and :py:attr:`~y` with
+        respect to *parameters* (*list* of *str*). Parameters that do not
+        change the trajectory (e.g., rho, s, or q) have derivatives of 0.
+        Returns *dict* of (d x / d param, d y / d param) tuples.
+        """
+        d_tau = {param: 0. for param in parameters}
+        d_beta = {param: 0. for param in parameters}
+        as_dict = self.parameters.as_dict()
+        dt = self._times - self.parameters.t_0
+
+        # Exactly 2 out of (u_0, t_E, t_eff) must be defined and derivatives depend on which ones are defined.
+        t_E = self.parameters.t_E
+        if 't_eff' not in as_dict:
+            d_tau['t_0'] = -1. / t_E
+            d_tau['t_E'] = -dt / t_E**2
+            d_beta['u_0'] = 1.
+        elif 't_E' not in as_dict:
+            t_eff = self.parameters.t_eff
+            d_tau['t_0'] = -as_dict['u_0'] / t_eff
+            d_tau['u_0'] = dt / t_eff
+            d_beta['u_0'] = 1.
+            d_tau['t_eff'] = -dt * as_dict['u_0'] / t_eff**2
+        elif 'u_0' not in as_dict:
+            t_eff = self.parameters.t_eff
+            d_tau['t_0'] = -1. / t_E
+            d_tau['t_E'] = -dt / t_E**2
+            d_beta['t_E'] = -t_eff / t_E**2
+            d_beta['t_eff'] = 1. / t_E
+        else:
+            raise KeyError('Something is wrong with ModelParameters in Trajectory._get_d_xy_d_params():\n', as_dict)
+
+        if 'pi_E_N' in as_dict:
+            d_tau['pi_E_N'] = self.parallax_delta_N_E['N']
+            d_beta['pi_E_N'] = self.parallax_delta_N_E['E']
+            d_tau['pi_E_E'] = self.parallax_delta_N_E['E']
+            d_beta['pi_E_E'] = -self.parallax_delta_N_E['N']
+
+        out = dict()
+        if self.parameters.n_lenses == 1 and not self.parameters.is_external_mass_sheet_with_shear:
+            for param in parameters:
+                out[param] = (d_tau[param], d_beta[param])
+        else:
+            alpha = self.parameters.get_alpha(self._times) * (np.pi / 180)
+            (sin_alpha, cos_alpha) = (np.sin(alpha), np.cos(alpha))
+            for param in parameters:
+                out[param] = (-d_tau[param] * cos_alpha + d_beta[param] * sin_alpha,
+                              -d_tau[param] * sin_alpha - d_beta[param] * cos_alpha)
+            if 'alpha' in parameters:
+                out['alpha'] = (-self._y * (np.pi / 180), self._x * (np.pi / 180))
+
+        return out
+
     def _get_shifts_parallax(self):
         """calculate shifts caused by parallax effect"""
         if self.coords is None:
@@ -277,43 +339,35 @@ class Trajectory(object):
         """
         calculates projected Earth positions required by annual parallax
         """
-        index = (self.parameters.t_0_par, self.coords.ra.value,
-                 self.coords.dec.value, tuple(self._times.tolist()))
-        if index == Trajectory._get_delta_annual_last_index:
-            return Trajectory._get_delta_annual_last
-        if index in Trajectory._get_delta_annual_results:
-            return Trajectory._get_delta_annual_results[index]
-        time_ref = self.parameters.t_0_par
+        cache = Trajectory.annual_parallax_cache
+        key = cache.make_key(self._times, self.parameters.t_0_par, self.coords.ra.value, self.coords.dec.value)
+        out = cache.get(key)
+        if out is not None:
+            return out
 
-        velocity = utils.Utils.velocity_of_Earth(time_ref) / 1731.45683
-        # We change units from km/s to AU/d.
+        time_ref = self.parameters.t_0_par
 
         if not np.all(np.isfinite(self._times)):
             msg = "Some times have incorrect values: {:}".format(self._times[~np.isfinite(self._times)])
             raise ValueError(msg)
 
-        position = get_body_barycentric(
-            body='earth', time=Time(self._times, format='jd', scale='tdb'))
-        position_ref = get_body_barycentric(
-            body='earth', time=Time(time_ref, format='jd', scale='tdb'))
-        # Seems that get_body_barycentric depends on time system, but there is
-        # no way to set BJD part of BJD_TDB in astropy.Time(). The option
-        # *format* above indicates if the first argument of Time() is
-        # a float indicating JD or e.g., a string in the form
-        # '1999-01-01T00:00:00.123' - this would be value 'fits'.
+        ephemeris = EarthEphemeris()
+        velocity = ephemeris.get_velocity(time_ref)
+        position = ephemeris.get_position(self._times)
+        position_ref = ephemeris.get_position(time_ref)
+        # Positions are interpolated in tables calculated using
+        # get_body_barycentric - see EarthEphemeris._calculate_block().
         # Hence, the user has to provide BJD times (or at least HJD).
 
         # Main calculation is in 2 lines below:
-        delta_s = (position_ref.xyz.T - position.xyz.T).to(u.au).value
+        delta_s = position_ref - position
         delta_s += np.outer(self._times - time_ref, velocity)
         # and the results require projecting on the plane of the sky:
         out_n = np.dot(delta_s, self.coords.north_projected)
         out_e = np.dot(delta_s, self.coords.east_projected)
 
         out = {'N': out_n, 'E': out_e}
-        Trajectory._get_delta_annual_results[index] = out
-        Trajectory._get_delta_annual_last_index = index + tuple()
-        Trajectory._get_delta_annual_last = out
+        cache.set(key, out)
         return out
 
     def _get_delta_satellite(self):
@@ -321,13 +375,16 @@ class Trajectory(object):
         calculates differences of Earth and satellite positions
         projected on the plane of the sky at event position
         """
-        index = (self.coords.ra.value, self.coords.dec.value,
-                 tuple(self._times.tolist()))
-        if index in Trajectory._get_delta_satellite_results.keys():
-            return Trajectory._get_delta_satellite_results[index]
-
         # Transform the satellite ephemerides.
         satellite = self.satellite_skycoord
+
+        cache = Trajectory.satellite_parallax_cache
+        satellite_digest = cache.make_key(satellite.cartesian.xyz.value)
+        key = cache.make_key(self._times, self.coords.ra.value, self.coords.dec.value, satellite_digest)
+        out = cache.get(key)
+        if out is not None:
+            return out
+
         satellite.transform_to(frame=self.coords.frame)
 
         # Project the satellite parallax effect based on the direction of
@@ -341,16 +398,16 @@ class Trajectory(object):
         delta_satellite['E'] = -dot(satellite.cartesian, east_projected).value
         delta_satellite['D'] = -dot(satellite.cartesian, direction).value
 
-        Trajectory._get_delta_satellite_results[index] = delta_satellite
+        cache.set(key, delta_satellite)
         return delta_satellite
 
     def _get_shifts_xallarap(self):
         """calculate shifts caused by xallarap effect"""
-        zip_ = self.parameters.parameters.items()
-        t_0_xi = self.parameters.t_0_xi
-        orbit_parameters = {
-            key[3:]: value for (key, value) in zip_ if key[:3] == "xi_"}
-        orbit_parameters['epoch_reference'] = t_0_xi
-        orbit = Orbit(**orbit_parameters)
-        positions = orbit.get_reference_plane_position(self._times)
+        cache = Trajectory.xallarap_cache
+        key = cache.make_key(self._times, self.parameters.xallarap_orbit_key)
+        positions = cache.get(key)
+        if positions is None:
+            positions = self.parameters.xallarap_orbit.get_reference_plane_position(self._times)
+            cache.set(key, positions)
+
         return positions - self.parameters.xallarap_reference_position
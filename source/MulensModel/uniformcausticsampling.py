@@ -1,8 +1,9 @@
+import os
 import numpy as np
 import math
 import warnings
 
-from MulensModel.utils import Utils
+from MulensModel.utils import Utils, ResultsCache
 
 
 class UniformCausticSampling(object):
@@ -23,6 +24,26 @@ class UniformCausticSampling(object):
             Number of points used for internal integration.
             Default value should work fine.
 
+    Attributes :
+        cache: :py:class:`~MulensModel.utils.ResultsCache`
+            class-level cache of integrated tables keyed on
+            (*s*, *q*, *n_points*); shared by all instances, hence,
+            creating a new instance for the same (*s*, *q*) does not
+            repeat the integration
+
+        cache_tolerance: *float*
+            If positive, then *s* and *q* are rounded to a grid uniform
+            in log(*s*) and log(*q*) with this step, i.e., nearby values
+            share the same tables and the relative change of *s* and *q*
+            is at most half of *cache_tolerance*. Note that rounded values
+            are returned by :py:attr:`s` and :py:attr:`q`.
+            Default is *0.*, i.e., no rounding.
+
+        cache_dir: *str* or *None*
+            If not *None*, then integrated tables are also saved in this
+            directory and read from it when the same (*s*, *q*, *n_points*)
+            is requested in another process. Default is *None*.
+
     Instead of standard parameters (*t_0*, *u_0*, *t_E*, *alpha*), here
     we use four other parameters: two epochs of caustic crossing
     (*t_caustic_in*, *t_caustic_out*) and two curvelinear coordinates of
@@ -93,15 +114,110 @@ class UniformCausticSampling(object):
     <https://ui.adsabs.harvard.edu/abs/2012MNRAS.426.2228K/abstract>`_
     """
 
+    cache = ResultsCache(max_entries=100)
+    cache_tolerance = 0.
+    cache_dir = None
+    _table_names = [
+        '_phi', '_d_phi', '_z_all', '_sum_1', '_z_sum_1', '_z_index_sum_1',
+        '_sum_2', '_z_sum_2', '_z_index_sum_2', '_inflections_fractions',
+        '_which_caustic']
+
     def __init__(self, s, q, n_points=10000):
-        self._s = s
-        self._q = q
+        (self._s, self._q) = self._round_s_q(s, q)
         self._n_points = n_points
 
         self._n_caustics = Utils.get_n_caustics(s=self.s, q=self.q)
-        self._get_phi()
-        self._integrate()
-        self._find_inflections_and_correct()
+
+        key = (self.s, self.q, self._n_points)
+        tables = UniformCausticSampling.cache.get(key)
+        if tables is None:
+            tables = self._read_tables(key)
+            if tables is None:
+                self._get_phi()
+                self._integrate()
+                self._find_inflections_and_correct()
+                tables = self._get_tables()
+                self._save_tables(key, tables)
+            UniformCausticSampling.cache.set(key, tables)
+
+        for (name, value) in tables.items():
+            setattr(self, name, value)
+
+    def _round_s_q(self, s, q):
+        """
+        Round s and q according to cache_tolerance.
+        """
+        tolerance = self.cache_tolerance
+        if tolerance is None or tolerance <= 0.:
+            return (s, q)
+
+        s = math.exp(tolerance * round(math.log(s) / tolerance))
+        q = math.exp(tolerance * round(math.log(q) / tolerance))
+        return (s, q)
+
+    def _get_tables(self):
+        """
+        Collect results of integration in a dict. The arrays are made
+        read-only, because they are shared by instances.
+        """
+        tables = dict()
+        for name in self._table_names:
+            if hasattr(self, name):
+                value = getattr(self, name)
+                if isinstance(value, np.ndarray):
+                    value.flags.writeable = False
+                tables[name] = value
+
+        return tables
+
+    def _get_file_name(self, key):
+        """
+        Name of the file with tables for given key.
+        """
+        return os.path.join(self.cache_dir, "caustic_sampling_{!r}_{!r}_{:}.npz".format(*key))
+
+    def _read_tables(self, key):
+        """
+        Read tables from cache_dir. Returns *None* if there is no file.
+        """
+        if self.cache_dir is None:
+            return None
+
+        file_name = self._get_file_name(key)
+        if not os.path.isfile(file_name):
+            return None
+
+        with np.load(file_name) as data:
+            tables = {name: data[name] for name in data.files}
+
+        tables['_d_phi'] = float(tables['_d_phi'])
+        tables['_inflections_fractions'] = {1: tables['_inflections_fractions'].tolist()}
+        for value in tables.values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+        return tables
+
+    def _save_tables(self, key, tables):
+        """
+        Save tables in cache_dir. The file is first written under temporary
+        name, so that other processes never read an incomplete file.
+        If the directory cannot be written, then the tables are not saved.
+        """
+        if self.cache_dir is None:
+            return
+
+        data = dict(tables)
+        data['_inflections_fractions'] = np.array(tables['_inflections_fractions'][1])
+        file_name = self._get_file_name(key)
+        temporary = "{:}.{:}.tmp.npz".format(file_name[:-4], os.getpid())
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.savez(temporary, **data)
+            os.replace(temporary, file_name)
+        except OSError:
+            if os.path.isfile(temporary):
+                os.remove(temporary)
 
     def _get_phi(self):
         """
@@ -122,16 +238,13 @@ class UniformCausticSampling(object):
         """
         diff_ = values[1:] - values[:-1]
         diff = np.concatenate(([diff_[-2], diff_[-1]], diff_))
-        out = []
-        for i in range(1, len(diff)-1):
-            if diff[i-1] > diff[i] and diff[i+1] > diff[i]:
-                # parabola = np.polyfit([-1., 0., 1.], diff[i-1:i+2], 2)
-                # shift = -0.5 * parabola[1] / parabola[0]
-                # 1) use it
-                # 2) if shift > 0.5 or < -0.5 than use the other triple
-                #    to calculate it
-                out.append(i)
-        return out
+        mask = (diff[:-2] > diff[1:-1]) & (diff[2:] > diff[1:-1])
+        # parabola = np.polyfit([-1., 0., 1.], diff[i-1:i+2], 2)
+        # shift = -0.5 * parabola[1] / parabola[0]
+        # 1) use it
+        # 2) if shift > 0.5 or < -0.5 than use the other triple
+        #    to calculate it
+        return (np.where(mask)[0] + 1).tolist()
 
     def _zeta(self, z):
         """
@@ -143,36 +256,61 @@ class UniformCausticSampling(object):
         zeta -= self.s * self.q / (1. + self.q)
         return zeta
 
-    def _find_nearest_index(self, array, value):
-        """
-        returns element of array that is closest to value
-        """
-        idx = (np.abs(array - value)).argmin()
-        return array[idx]
-
     def _critical_curve(self, phi):
         """
-        Calculate a point on critical curve - see eq. 6 in Cassan 2008.
+        Calculate points on critical curve - see eq. 6 in Cassan 2008.
+        All quartic equations are solved at once.
+
+        Parameters :
+            phi: *np.ndarray* (N,)
+                Values of phi.
+
+        Returns :
+            roots: *np.ndarray* (N, 4)
+                Critical curve points for each phi. For each phi the roots
+                are sorted the same way as by
+                *np.polynomial.polynomial.polyroots()*.
         """
-        coeffs = [0., 0., 0., 2.*self.s, 1.]
         exp_i_phi = np.exp(1j * phi)
-        coeffs[0] = -self.s * self.s * exp_i_phi / (1. + self.q)
-        coeffs[1] = -2. * self.s * exp_i_phi / (1. + self.q)
-        coeffs[2] = self.s * self.s - exp_i_phi
+        coeffs = np.zeros((len(phi), 5), dtype=np.complex128)
+        coeffs[:, 0] = -self.s * self.s * exp_i_phi / (1. + self.q)
+        coeffs[:, 1] = -2. * self.s * exp_i_phi / (1. + self.q)
+        coeffs[:, 2] = self.s * self.s - exp_i_phi
+        coeffs[:, 3] = 2. * self.s
+        coeffs[:, 4] = 1.
 
-        roots = np.polynomial.polynomial.polyroots(np.array(coeffs))
+        roots = Utils.polynomial_roots_vectorized(coeffs)
+        roots.sort(axis=1)
 
         if self._n_caustics == 3:
-            if self._critical_curve_previous is not None:
-                # This makes sure we're following right branch.
-                new_roots = np.array([0.+0.j, 0.+0.j, 0.+0.j, 0.+0.j])
-                for (i, v) in enumerate(self._critical_curve_previous):
-                    new_roots[i] = self._find_nearest_index(roots, v)
-                roots = new_roots
-            self._critical_curve_previous = roots
+            roots = self._track_branches(roots)
 
         return roots
 
+    def _track_branches(self, roots):
+        """
+        Reorder roots so that each column follows a single branch of
+        the critical curve, i.e., each root is replaced by the root for next
+        phi that is closest to it.
+
+        For each pair of adjacent phi values we find the mapping from
+        the previous roots to the nearest current roots. The mapping for
+        a given phi is a composition of all preceding mappings and these
+        compositions are calculated using prefix scan, which requires
+        only log2(N) vectorized steps.
+        """
+        distance = np.abs(roots[1:, :, np.newaxis] - roots[:-1, np.newaxis, :])
+        mapping = np.zeros(roots.shape, dtype=int)
+        mapping[0] = np.arange(roots.shape[1])
+        mapping[1:] = np.argmin(distance, axis=1)
+
+        step = 1
+        while step < len(mapping):
+            mapping[step:] = np.take_along_axis(mapping[step:], mapping[:-step], axis=1)
+            step *= 2
+
+        return np.take_along_axis(roots, mapping, axis=1)
+
     def _dz_dphi(self, z):
         """
         Eq. 11 from Cassan (2008)
@@ -249,46 +387,31 @@ class UniformCausticSampling(object):
         - self._z_index_sum_1
         - self._z_index_sum_2
         """
-        size = (self._n_points, 4)
-        self._z_all = np.zeros(size, dtype=np.complex128)
-        self._sum_1 = np.zeros(self._n_points)
-        self._z_sum_1 = np.zeros(self._n_points, dtype=np.complex128)
+        self._z_all = self._critical_curve(self._phi)
+        indexes = np.arange(self._n_points)
+
         self._z_index_sum_1 = np.zeros(self._n_points, dtype=int)
+        if self._n_caustics == 1:
+            self._z_index_sum_1 = (self._phi / np.pi).astype(int)
+        if self._n_caustics == 2:
+            self._z_index_sum_2 = (self._phi / np.pi).astype(int)
+            self._z_index_sum_1 = self._z_index_sum_2 + 2
+        if self._n_caustics == 3:
+            signs = (1. / np.conjugate(self._z_all) - self._z_all).imag
+            wrong = np.where(signs[:, 1] * signs[:, 2] >= 0.)[0]
+            if len(wrong) > 0:
+                i = wrong[0]
+                args = [self.s, self.q, self._n_points, i, self._z_all[i]]
+                raise ValueError("Critical error: {:}".format(args))
+            self._z_index_sum_2 = np.where(signs[:, 1] < 0., 2, 1)
+
+        self._z_sum_1 = self._z_all[indexes, self._z_index_sum_1]
+        abs_1 = np.abs(self._dzeta_dphi(self._z_sum_1, self._phi))
+        self._sum_1 = np.cumsum(abs_1 * self._d_phi)
         if self._n_caustics > 1:
-            self._sum_2 = np.zeros(self._n_points)
-            self._z_sum_2 = np.zeros(self._n_points, dtype=np.complex128)
-            self._z_index_sum_2 = np.zeros(self._n_points, dtype=int)
-        self._critical_curve_previous = None
-
-        for (i, phi) in enumerate(self._phi):
-            self._z_all[i] = self._critical_curve(phi)
-
-            if self._n_caustics == 1:
-                self._z_index_sum_1[i] = int(phi / np.pi)
-                self._z_sum_1[i] = self._z_all[i, self._z_index_sum_1[i]]
-                abs_1 = abs(self._dzeta_dphi(self._z_sum_1[i], phi))
-                self._sum_1[i] = self._sum_1[i-1] + abs_1 * self._d_phi
-            if self._n_caustics > 1:
-                if self._n_caustics == 2:
-                    self._z_index_sum_2[i] = int(phi / np.pi)
-                    self._z_index_sum_1[i] = self._z_index_sum_2[i] + 2
-                if self._n_caustics == 3:
-                    signs = 1. / np.conjugate(self._z_all[i])
-                    signs = (signs - self._z_all[i]).imag
-                    if signs[1] * signs[2] >= 0.:
-                        args = [
-                            self.s, self.q, self._n_points, i, self._z_all[i]]
-                        raise ValueError("Critical error: {:}".format(args))
-                    if signs[1] < 0.:
-                        self._z_index_sum_2[i] = 2
-                    else:
-                        self._z_index_sum_2[i] = 1
-                self._z_sum_1[i] = self._z_all[i, self._z_index_sum_1[i]]
-                self._z_sum_2[i] = self._z_all[i, self._z_index_sum_2[i]]
-                abs_1 = abs(self._dzeta_dphi(self._z_sum_1[i], phi))
-                abs_2 = abs(self._dzeta_dphi(self._z_sum_2[i], phi))
-                self._sum_1[i] = self._sum_1[i-1] + abs_1 * self._d_phi
-                self._sum_2[i] = self._sum_2[i-1] + abs_2 * self._d_phi
+            self._z_sum_2 = self._z_all[indexes, self._z_index_sum_2]
+            abs_2 = np.abs(self._dzeta_dphi(self._z_sum_2, self._phi))
+            self._sum_2 = np.cumsum(abs_2 * self._d_phi)
 
     def _find_inflections_and_correct(self):
         """
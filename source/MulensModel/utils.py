@@ -3,6 +3,8 @@ File with general code used in other parts of MulensModel package.
 
 Most importantly there are Utils and PlotUtils classes.
 """
+from collections import OrderedDict
+from hashlib import sha1
 import numpy as np
 from math import fsum, pow, sqrt
 import warnings
@@ -260,6 +262,87 @@ class Utils(object):
         return fsum(real) + fsum(imag) * 1j
     complex_fsum = staticmethod(complex_fsum)
 
+    def polynomial_roots_vectorized(coeffs, initial_roots=None, max_iterations=100, tolerance=1.e-12):
+        """
+        Roots of many polynomials of the same degree found in a single call.
+        Roots are found using Aberth-Ehrlich method that is run for all
+        polynomials simultaneously. Polynomials for which the method does not
+        converge are solved by finding eigenvalues of companion matrices,
+        i.e., the same way as in *np.polynomial.polynomial.polyroots()*.
+
+        Parameters :
+            coeffs: *np.ndarray* (N, n+1)
+                Coefficients of N polynomials of degree n. The order is
+                from the lowest to the highest power (the same as in
+                *np.polynomial.polynomial.polyroots()*). The highest power
+                coefficients must be non-zero.
+
+            initial_roots: *np.ndarray* (N, n), optional
+                Initial guesses of roots. Good guesses significantly reduce
+                the number of iterations. If not provided, then points on
+                a circle are used.
+
+            max_iterations: *int*, optional
+                Maximum number of iterations.
+
+            tolerance: *float*, optional
+                Relative size of correction at which iterations are stopped.
+
+        Returns :
+            roots: *np.ndarray* (N, n)
+                Complex roots of each polynomial.
+        """
+        coeffs = np.atleast_2d(coeffs).astype(complex)
+        degree = coeffs.shape[1] - 1
+        monic = coeffs[:, :-1] / coeffs[:, -1:]
+
+        if initial_roots is None:
+            radius = np.abs(monic[:, 0])**(1. / degree)
+            radius[radius == 0.] = 1.
+            angles = 2. * np.pi * np.arange(degree) / degree + 0.4
+            initial_roots = radius[:, np.newaxis] * np.exp(1.j * angles)
+
+        roots = np.array(initial_roots, dtype=complex)
+        index = np.arange(len(coeffs))
+        c = [monic[:, k] for k in range(degree)]
+        z = [roots[:, k] for k in range(degree)]
+        for _ in range(max_iterations):
+            ratios = []
+            for z_k in z:
+                (value, derivative) = (z_k + c[-1], np.ones_like(z_k))
+                for c_m in c[-2::-1]:
+                    derivative = derivative * z_k + value
+                    value = value * z_k + c_m
+                ratios.append(value / derivative)
+
+            converged = np.ones(len(index), dtype=bool)
+            z_new = []
+            for (k, z_k) in enumerate(z):
+                sum_ = sum(1. / (z_k - z_j) for (j, z_j) in enumerate(z) if j != k)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    correction = ratios[k] / (1. - ratios[k] * sum_)
+                z_new.append(z_k - correction)
+                converged &= (np.abs(correction) <= tolerance * np.abs(z_k))
+            z = z_new
+
+            if np.any(converged):
+                roots[index[converged]] = np.array(z).T[converged]
+                not_converged = np.logical_not(converged)
+                index = index[not_converged]
+                z = [z_k[not_converged] for z_k in z]
+                c = [c_m[not_converged] for c_m in c]
+                if len(index) == 0:
+                    break
+
+        if len(index) > 0:
+            companion = np.zeros((len(index), degree, degree), dtype=complex)
+            companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1.
+            companion[:, :, -1] = -monic[index]
+            roots[index] = np.linalg.eigvals(companion)
+
+        return roots
+    polynomial_roots_vectorized = staticmethod(polynomial_roots_vectorized)
+
     def vector_product_normalized(vector_1, vector_2):
         """
         Get vector that is perpendicular to the 2 input ones and is normalized.
@@ -342,6 +425,180 @@ class Utils(object):
     astropy_version_check = staticmethod(astropy_version_check)
 
 
+class ResultsCache(object):
+    """
+    Least-recently-used cache for results of expensive calculations,
+    e.g., parallax shifts calculated for given time vector.
+
+    The cache is limited both in number of entries and in the total size
+    of :py:class:`numpy.ndarray` objects stored (also inside *dict*,
+    *list*, or *tuple* values). If any limit is exceeded, then the least
+    recently used entries are removed.
+
+    Arguments :
+        max_entries: *int* or *None*
+            Maximum number of stored results. *None* means no limit.
+
+        max_bytes: *int* or *None*
+            Maximum size of stored arrays in bytes. *None* means no limit.
+
+    Attributes :
+        hits: *int*
+            Number of successful :py:func:`get()` calls.
+
+        misses: *int*
+            Number of :py:func:`get()` calls that returned *None*.
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=256*2**20):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all results and reset the counters.
+        """
+        self._data = OrderedDict()
+        self._n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, array, *args):
+        """
+        Prepare a key for given array and other (hashable) arguments.
+        The array is represented by a SHA-1 digest of its buffer, which
+        is much faster than converting it to a *tuple*.
+
+        Parameters :
+            array: *np.ndarray*
+                Main input, e.g., epochs.
+
+            ``*args``:
+                Other hashable values that affect the results.
+
+        Returns :
+            key: *tuple*
+                Key that can be used in :py:func:`get()` and
+                :py:func:`set()`.
+        """
+        array = np.ascontiguousarray(array)
+        digest = sha1(array.data).digest()
+        return (array.dtype.str, array.shape, digest) + args
+
+    def get(self, key):
+        """
+        Get results for given key and mark them as recently used.
+
+        Parameters :
+            key: *tuple*
+                See :py:func:`make_key()`.
+
+        Returns :
+            value:
+                Stored results or *None* if the key is not in the cache.
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value[0]
+
+    def set(self, key, value):
+        """
+        Store results and remove the oldest ones if limits are exceeded.
+
+        Parameters :
+            key: *tuple*
+                See :py:func:`make_key()`.
+
+            value:
+                Results to be stored.
+        """
+        if key in self._data:
+            self._n_bytes -= self._data.pop(key)[1]
+
+        size = self._get_size(value)
+        self._data[key] = (value, size)
+        self._n_bytes += size
+        self._remove_oldest()
+
+    def _get_size(self, value):
+        """
+        Size of arrays in value.
+        """
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        elif isinstance(value, dict):
+            return sum(self._get_size(value_) for value_ in value.values())
+        elif isinstance(value, (list, tuple)):
+            return sum(self._get_size(value_) for value_ in value)
+
+        return 0
+
+    def _remove_oldest(self):
+        """
+        Remove least recently used results until the limits are met.
+        The newest result is always kept.
+        """
+        while len(self._data) > 1:
+            too_many = (self._max_entries is not None and len(self._data) > self._max_entries)
+            too_large = (self._max_bytes is not None and self._n_bytes > self._max_bytes)
+            if not (too_many or too_large):
+                break
+            (_, (_, size)) = self._data.popitem(last=False)
+            self._n_bytes -= size
+
+    @property
+    def max_entries(self):
+        """
+        *int* or *None*
+
+        Maximum number of stored results. *None* means no limit.
+        """
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value):
+        self._max_entries = value
+        self._remove_oldest()
+
+    @property
+    def max_bytes(self):
+        """
+        *int* or *None*
+
+        Maximum size of stored arrays in bytes. *None* means no limit.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._remove_oldest()
+
+    @property
+    def n_entries(self):
+        """
+        *int*
+
+        Number of stored results.
+        """
+        return len(self._data)
+
+    @property
+    def n_bytes(self):
+        """
+        *int*
+
+        Size of stored arrays in bytes.
+        """
+        return self._n_bytes
+
+
 class PlotUtils(object):
     """
     A number of small functions related to plotting used in different places
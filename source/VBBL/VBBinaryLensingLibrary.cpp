@@ -350,15 +350,15 @@ void VBBinaryLensing::SetObjectCoordinates(char *modelfile, char *sateltabledir)
 }
 
 void VBBinaryLensing::ComputeParallax(double t, double t0, double *Et) {
-	static double a0 = 1.00000261, adot = 0.00000562; // Ephemeris from JPL website 
-	static double e0 = 0.01671123, edot = -0.00004392;
-	static double inc0 = -0.00001531, incdot = -0.01294668;
-	static double L0 = 100.46457166, Ldot = 35999.37244981;
-	static double om0 = 102.93768193, omdot = 0.32327364;
-	static double deg = M_PI / 180;
-	static double a, e, inc, L, om, M, EE, dE, dM;
-	static double x1, y1, vx, vy, Ear[3], vEar[3];
-	static double Et0[2], vt0[2], r, sp, ty, Spit;
+	static thread_local double a0 = 1.00000261, adot = 0.00000562; // Ephemeris from JPL website 
+	static thread_local double e0 = 0.01671123, edot = -0.00004392;
+	static thread_local double inc0 = -0.00001531, incdot = -0.01294668;
+	static thread_local double L0 = 100.46457166, Ldot = 35999.37244981;
+	static thread_local double om0 = 102.93768193, omdot = 0.32327364;
+	static thread_local double deg = M_PI / 180;
+	static thread_local double a, e, inc, L, om, M, EE, dE, dM;
+	static thread_local double x1, y1, vx, vy, Ear[3], vEar[3];
+	static thread_local double Et0[2], vt0[2], r, sp, ty, Spit;
 	int c = 0, ic;
 
 	if (t0_par_fixed == 0) t0_par = t0;
@@ -506,14 +506,14 @@ void VBBinaryLensing::ComputeParallax(double t, double t0, double *Et) {
 
 
 double VBBinaryLensing::BinaryMag0(double a1, double q1, double y1v, double y2v, _sols **Images) {
-	static complex a, q, m1, m2, y;
-	static double av = -1.0, qv = -1.0;
-	static complex  coefs[24], d1, d2, dy, dJ, dz;
-	static double Mag, Ai;
+	static thread_local complex a, q, m1, m2, y;
+	static thread_local double av = -1.0, qv = -1.0;
+	static thread_local complex  coefs[24], d1, d2, dy, dJ, dz;
+	static thread_local double Mag, Ai;
     
-	static _theta *stheta;
-	static _curve *Prov, *Prov2;
-	static _point *scan1, *scan2;
+	static thread_local _theta *stheta;
+	static thread_local _curve *Prov, *Prov2;
+	static thread_local _point *scan1, *scan2;
 
 	Mag = Ai = -1.0;
 	stheta = new _theta(-1.);
@@ -594,16 +594,16 @@ double VBBinaryLensing::BinaryMag0(double a1, double q1, double y1v, double y2v,
 }
 
 double VBBinaryLensing::BinaryMag0(double a1, double q1, double y1v, double y2v) {
-	static _sols *images;
-	static double mag;
+	static thread_local _sols *images;
+	static thread_local double mag;
 	mag = BinaryMag0(a1, q1, y1v, y2v, &images);
 	delete images;
 	return mag;
 }
 
 double VBBinaryLensing::BinaryMagSafe(double s, double q, double y1v, double y2v, double RS, _sols **images) {
-	static double Mag, mag1, mag2, RSi, RSo, delta1,delta2;
-	static int NPSsafe;
+	static thread_local double Mag, mag1, mag2, RSi, RSo, delta1,delta2;
+	static thread_local int NPSsafe;
 	Mag = BinaryMag(s, q, y1v, y2v, RS,Tol,images);
 	RSi = RS;
 	RSo = RS;
@@ -638,21 +638,21 @@ double VBBinaryLensing::BinaryMagSafe(double s, double q, double y1v, double y2v
 }
 
 double VBBinaryLensing::BinaryMag(double a1, double q1, double y1v, double y2v, double RSv, double Tol, _sols **Images) {
-	static complex a, q, m1, m2, y0, y, yc, z, zc;
-	static double av = -1.0, qv = -1.0;
-	static complex coefs[24], d1, d2, dy, dJ, dz;
-	static double thoff = 0.01020304,errbuff;
-	static double Mag, th;
+	static thread_local complex a, q, m1, m2, y0, y, yc, z, zc;
+	static thread_local double av = -1.0, qv = -1.0;
+	static thread_local complex coefs[24], d1, d2, dy, dJ, dz;
+	static thread_local double thoff = 0.01020304,errbuff;
+	static thread_local double Mag, th;
 ////////////////////////////  
-	static double errimage, maxerr, currerr, Magold;
-	static int NPSmax, flag, NPSold,flagbad,flagbadmax=3;
-	static _curve *Prov, *Prov2;
-	static _point *scan1, *scan2;
-	static _thetas *Thetas;
-	static _theta *stheta, *itheta;
+	static thread_local double errimage, maxerr, currerr, Magold;
+	static thread_local int NPSmax, flag, NPSold,flagbad,flagbadmax=3;
+	static thread_local _curve *Prov, *Prov2;
+	static thread_local _point *scan1, *scan2;
+	static thread_local _thetas *Thetas;
+	static thread_local _theta *stheta, *itheta;
 
 #ifdef _PRINT_TIMES
-	static double tim0, tim1;
+	static thread_local double tim0, tim1;
 #endif
 
 	// Initialization of the equation coefficients
@@ -869,17 +869,17 @@ double VBBinaryLensing::BinaryMag(double a1, double q1, double y1v, double y2v,
 }
 
 double VBBinaryLensing::BinaryMag(double a1, double q1, double y1v, double y2v, double RSv, double Tol) {
-	static _sols *images;
-	static double mag;
+	static thread_local _sols *images;
+	static thread_local double mag;
 	mag = BinaryMag(a1, q1, y1v, y2v, RSv, Tol, &images);
 	delete images;
 	return mag;
 }
 
 double VBBinaryLensing::BinaryMag2(double s, double q, double y1v, double y2v, double rho) {
-	static double Mag, rho2, y2a;//, sms , dy1, dy2;
-	static int c;
-	static _sols *Images;
+	static thread_local double Mag, rho2, y2a;//, sms , dy1, dy2;
+	static thread_local int c;
+	static thread_local _sols *Images;
 
 	c = 0;
 
@@ -908,14 +908,14 @@ double VBBinaryLensing::BinaryMag2(double s, double q, double y1v, double y2v, d
 
 
 double VBBinaryLensing::BinaryMagDark(double a, double q, double y1, double y2, double RSv, double a1, double Tolnew) {
-	static double Mag, Magold, Tolv;
-    static double LDastrox1,LDastrox2;
-	static double tc, lc, rc, cb,rb;
-	static int c, flag;
-	static double currerr, maxerr;
-	static annulus *first, *scan, *scan2;
-	static int nannold, totNPS;
-	static _sols *Images;
+	static thread_local double Mag, Magold, Tolv;
+    static thread_local double LDastrox1,LDastrox2;
+	static thread_local double tc, lc, rc, cb,rb;
+	static thread_local int c, flag;
+	static thread_local double currerr, maxerr;
+	static thread_local annulus *first, *scan, *scan2;
+	static thread_local int nannold, totNPS;
+	static thread_local _sols *Images;
 
 	Mag = -1.0;
 	Magold = 0.;
@@ -1123,8 +1123,8 @@ void VBBinaryLensing::BinaryMagMultiDark(double a, double q, double y1, double y
 }
 
 double VBBinaryLensing::LDprofile(double r) {
-	static int ir;
-	static double rr,ret;
+	static thread_local int ir;
+	static thread_local double rr,ret;
 	switch(curLDprofile){
 	case LDuser:
 		rr = r * npLD;
@@ -1148,8 +1148,8 @@ double VBBinaryLensing::LDprofile(double r) {
 }
 
 double VBBinaryLensing::rCLDprofile(double tc,annulus *left,annulus *right) {
-	static int ic;
-	static double rc,cb,lc,r2,cr2,cc,lb,rb;
+	static thread_local int ic;
+	static thread_local double rc,cb,lc,r2,cr2,cc,lb,rb;
 
 	switch (curLDprofile) {
 	case LDuser:
@@ -1335,7 +1335,7 @@ void VBBinaryLensing::LoadESPLTable(char *filename){
 
 
 double VBBinaryLensing::PSPLMag(double u) {
-	static double u2,u22;
+	static thread_local double u2,u22;
 	u2 = u * u;
 	u22 = u2 + 2;
 	if (astrometry) {
@@ -2682,16 +2682,16 @@ double VBBinaryLensing::BinSourceBinLensPOX(double* pr, double t) {
 	
 
 _curve* VBBinaryLensing::NewImages(complex yi, complex* coefs, _theta* theta) {
-	static complex  y, yc, z, zc, J1, J1c, dy, dz, dJ, J2, J3, dza, za2, zb2, zaltc, Jalt, Jaltc, JJalt2;
-	static complex zr[5] = { 0.,0.,0.,0.,0. };
-	static double dlmin = 1.0e-4, dlmax = 1.0e-3, good[5], dJ2, ob2, cq;
-	static int worst1, worst2, worst3, bad, f1, checkJac;
-	static double av = 0.0, m1v = 0.0, disim, disisso;
-	static _curve* Prov;
-	static _point* scan, * prin, * fifth, * left, * right, * center;
+	static thread_local complex  y, yc, z, zc, J1, J1c, dy, dz, dJ, J2, J3, dza, za2, zb2, zaltc, Jalt, Jaltc, JJalt2;
+	static thread_local complex zr[5] = { 0.,0.,0.,0.,0. };
+	static thread_local double dlmin = 1.0e-4, dlmax = 1.0e-3, good[5], dJ2, ob2, cq;
+	static thread_local int worst1, worst2, worst3, bad, f1, checkJac;
+	static thread_local double av = 0.0, m1v = 0.0, disim, disisso;
+	static thread_local _curve* Prov;
+	static thread_local _point* scan, * prin, * fifth, * left, * right, * center;
 
 #ifdef _PRINT_TIMES
-	static double tim0, tim1;
+	static thread_local double tim0, tim1;
 #endif
 
 	y = yi + coefs[11];
@@ -2894,15 +2894,15 @@ _curve* VBBinaryLensing::NewImages(complex yi, complex* coefs, _theta* theta) {
 }
 
 void VBBinaryLensing::OrderImages(_sols *Sols, _curve *Newpts) {
-	static double A[5][5];
-	static _curve *cprec[5];
-	static _curve *cpres[5];
-	static _curve *cfoll[5];
-	static _point *scan, *scan2, *scan3, *isso[2];
-	static _curve *scurve, *scurve2;
+	static thread_local double A[5][5];
+	static thread_local _curve *cprec[5];
+	static thread_local _curve *cpres[5];
+	static thread_local _curve *cfoll[5];
+	static thread_local _point *scan, *scan2, *scan3, *isso[2];
+	static thread_local _curve *scurve, *scurve2;
 
 	_theta *theta;
-	static double th, mi, cmp, cmp2,cmp_2,dx2,avgx2,avgx1,avg2x1,pref,d2x2,dx1,d2x1,avgwedgex1,avgwedgex2,parab1,parab2;
+	static thread_local double th, mi, cmp, cmp2,cmp_2,dx2,avgx2,avgx1,avg2x1,pref,d2x2,dx1,d2x1,avgwedgex1,avgwedgex2,parab1,parab2;
         
 	int nprec = 0, npres, nfoll = 0, issoc[2], ij;
 
@@ -4139,7 +4139,7 @@ void VBBinaryLensing::cmplx_roots_gen(complex *roots, complex *poly, int degree,
 	//
 
 	complex poly2[MAXM];
-	static int i, j, n, iter;
+	static thread_local int i, j, n, iter;
 	bool success;
 	complex coef, prev;
 
@@ -4296,7 +4296,7 @@ void VBBinaryLensing::cmplx_laguerre(complex *poly, int degree, complex *root, i
 	//For a summary of the method go to :
 	//http://en.wikipedia.org/wiki/Laguerre's_method
 	//
-	static int FRAC_JUMP_EVERY = 10;
+	static thread_local int FRAC_JUMP_EVERY = 10;
 	const int FRAC_JUMP_LEN = 10;
 	double FRAC_JUMPS[FRAC_JUMP_LEN] = { 0.64109297,
 		0.91577881, 0.25921289, 0.50487203,
@@ -4306,7 +4306,7 @@ void VBBinaryLensing::cmplx_laguerre(complex *poly, int degree, complex *root, i
 	double faq; //jump length
 	double FRAC_ERR = 2.0e-15; //Fractional Error for double precision
 	complex p, dp, d2p_half; //value of polynomial, 1st derivative, and 2nd derivative
-	static int i, j, k;
+	static thread_local int i, j, k;
 	bool good_to_go;
 	complex denom, denom_sqrt, dx, newroot;
 	double ek, absroot, abs2p;
@@ -4939,9 +4939,9 @@ void VBBinaryLensing::cmplx_laguerre2newton(complex *poly, int degree, complex *
 
 
 double VBBinaryLensing_shear::BinaryMag0_shear(double a1, double q1, double y1v, double y2v, double K1, double G1, double Gi, _sols **Images) {
-	static complex a, q, m1, m2, y, yc, mdiff, mtot, K, G;
-	static double av = -1.0, qv = -1.0, Kv = -1.0, Gv = -1.0, Giv = -1.0, cq;
-	static complex  coefs[28], d1, d2, dy, dJ, dz;
+	static thread_local complex a, q, m1, m2, y, yc, mdiff, mtot, K, G;
+	static thread_local double av = -1.0, qv = -1.0, Kv = -1.0, Gv = -1.0, Giv = -1.0, cq;
+	static thread_local complex  coefs[28], d1, d2, dy, dJ, dz;
 	double Mag = -1.0;
 	_theta *stheta;
 	_curve *Prov, *Prov2;
@@ -5027,16 +5027,16 @@ double VBBinaryLensing_shear::BinaryMag0_shear(double a1, double q1, double y1v,
 }
 
 _curve *VBBinaryLensing_shear::NewImages_shear(complex yi, complex  *coefs, _theta *theta) {
-	static complex  y, yc, z, zc, Gc, J1, J1c, dy, dz, dJ,J2,J3,dza,za2,zb2,zaltc,Jalt,Jaltc,JJalt2;
-	static complex zr[9] = { 0.,0.,0.,0.,0.,0.,0.,0.,0.};
-	static double dzmax, dlmax = 1.0e-6, good[9], dJ2,ob2,cq;
-	static int worst1, worst2, worst3, bad, f1;
-	static double av = 0.0, m1v = 0.0, disim, disisso;
-	static _curve *Prov;
-	static _point *scan, *prin, *fifth, *left, *right, *center;
+	static thread_local complex  y, yc, z, zc, Gc, J1, J1c, dy, dz, dJ,J2,J3,dza,za2,zb2,zaltc,Jalt,Jaltc,JJalt2;
+	static thread_local complex zr[9] = { 0.,0.,0.,0.,0.,0.,0.,0.,0.};
+	static thread_local double dzmax, dlmax = 1.0e-6, good[9], dJ2,ob2,cq;
+	static thread_local int worst1, worst2, worst3, bad, f1;
+	static thread_local double av = 0.0, m1v = 0.0, disim, disisso;
+	static thread_local _curve *Prov;
+	static thread_local _point *scan, *prin, *fifth, *left, *right, *center;
 
 #ifdef _PRINT_TIMES
-	static double tim0, tim1;
+	static thread_local double tim0, tim1;
 #endif
 
 	y = yi + coefs[11]; // Coordinate transformation to centre of mass frame
@@ -4,7 +4,7 @@
 
 extern "C" {
   double VBBinaryLensing_BinaryMagDark(double a, double q, double y1, double y2, double RSv, double tolerance, double a1) {
-    static VBBinaryLensing VBBL;
+    static thread_local VBBinaryLensing VBBL;
 
     VBBL.Tol = tolerance;
     VBBL.a1 = a1;
@@ -15,7 +15,7 @@ extern "C" {
 
 extern "C" {
   double VBBinaryLensing_BinaryMagFinite(double a, double q, double y1, double y2, double RSv, double tolerance) {
-    static VBBinaryLensing VBBL;
+    static thread_local VBBinaryLensing VBBL;
 
     VBBL.Tol = tolerance;
 
@@ -23,9 +23,33 @@ extern "C" {
   }
 }
 
+/*
+Array versions of functions above - they calculate n magnifications using
+a single instance of VBBinaryLensing (per thread) and write them to mags.
+*/
+static thread_local VBBinaryLensing VBBL_array;
+
+extern "C" {
+  void VBBinaryLensing_BinaryMagDarkArray(double *a, double q, double *y1, double *y2, double RSv, double tolerance,
+                                          double a1, int n, double *mags) {
+    VBBL_array.Tol = tolerance;
+    VBBL_array.a1 = a1;
+
+    for (int i = 0; i < n; i++)
+      mags[i] = VBBL_array.BinaryMag2(a[i], q, y1[i], y2[i], RSv);
+  }
+}
+
+extern "C" {
+  void VBBinaryLensing_BinaryMagFiniteArray(double *a, double q, double *y1, double *y2, double RSv, double tolerance,
+                                            int n, double *mags) {
+    VBBinaryLensing_BinaryMagDarkArray(a, q, y1, y2, RSv, tolerance, 0., n, mags);
+  }
+}
+
 extern "C" {
   double VBBinaryLensing_BinaryMagPoint(double a, double q, double y1, double y2) {
-    static VBBinaryLensing VBBL;
+    static thread_local VBBinaryLensing VBBL;
 
     return VBBL.BinaryMag0(a, q, y1, y2);
   }
@@ -33,7 +57,7 @@ extern "C" {
 
 extern "C" {
   double VBBinaryLensing_BinaryMagPointShear(double a,double q,double y1,double y2, double K, double G, double Gi) {
-    static VBBinaryLensing_shear VBBL;
+    static thread_local VBBinaryLensing_shear VBBL;
     
     return VBBL.BinaryMag0_shear(a, q, y1, y2, K, G, Gi);
   }
@@ -42,9 +66,9 @@ extern "C" {
 extern "C" double* VBBL_SG12_5(double p0, double p1, 
                     double p2, double p3, double p4, double p5, double p6, 
                     double p7, double p8, double p9, double p10, double p11) {
-    static VBBinaryLensing VBBL;
+    static thread_local VBBinaryLensing VBBL;
     complex complex_poly[6], complex_roots[5];
-    static double roots[10];
+    static thread_local double roots[10];
     int i;
 
     complex_poly[0] = complex(p0, p6);
@@ -69,9 +93,9 @@ extern "C" double* VBBL_SG12_9(double p0, double p1,
                     double p7, double p8, double p9, double p10, double p11,
                     double p12, double p13, double p14, double p15,
                     double p16, double p17, double p18, double p19) {
-    static VBBinaryLensing VBBL;
+    static thread_local VBBinaryLensing VBBL;
     complex complex_poly[10], complex_roots[9];
-    static double roots[18];
+    static thread_local double roots[18];
     int i;
 
     complex_poly[0] = complex(p0, p10);
@@ -94,3 +118,58 @@ extern "C" double* VBBL_SG12_9(double p0, double p1,
 
     return roots;
 }
+
+/*
+Array version of VBBL_SG12_9 - polynomials is an array of 20*n doubles (for each
+polynomial: 10 real parts and then 10 imaginary parts of coefficients) and roots
+is output array of 18*n doubles (9 real parts and then 9 imaginary parts).
+*/
+extern "C" void VBBL_SG12_9Array(double *polynomials, int n, double *roots) {
+    static thread_local VBBinaryLensing VBBL;
+    complex complex_poly[10], complex_roots[9];
+    double *poly, *out;
+    int i, j;
+
+    for (i = 0; i < n; i++) {
+        poly = polynomials + 20 * i;
+        out = roots + 18 * i;
+        for (j = 0; j < 10; j++)
+            complex_poly[j] = complex(poly[j], poly[j+10]);
+        for (j = 0; j < 9; j++)
+            complex_roots[j] = complex(0., 0.);
+
+        VBBL.cmplx_roots_gen(complex_roots, complex_poly, 9, true, true);
+
+        for (j = 0; j < 9; j++) {
+            out[j] = complex_roots[j].re;
+            out[j+9] = complex_roots[j].im;
+        }
+    }
+}
+
+/*
+Skowron & Gould 2012 solver with roots provided as starting points - polynomial
+is an array of 2*(degree+1) doubles (real parts and then imaginary parts of
+coefficients) and roots is an array of 2*degree doubles with starting points,
+which is overwritten with the roots found.
+*/
+extern "C" void VBBL_SG12WarmStart(double *polynomial, int degree, double *roots) {
+    static thread_local VBBinaryLensing VBBL;
+    complex complex_poly[10], complex_roots[9];
+    int j;
+
+    if (degree < 2 || degree > 9)
+        return;
+
+    for (j = 0; j <= degree; j++)
+        complex_poly[j] = complex(polynomial[j], polynomial[j+degree+1]);
+    for (j = 0; j < degree; j++)
+        complex_roots[j] = complex(roots[j], roots[j+degree]);
+
+    VBBL.cmplx_roots_gen(complex_roots, complex_poly, degree, true, true);
+
+    for (j = 0; j < degree; j++) {
+        roots[j] = complex_roots[j].re;
+        roots[j+degree] = complex_roots[j].im;
+    }
+}
@@ -5,19 +5,24 @@
 
 /*
 Based on code written by Przemek Mroz
+
+The GIL is released during calculations, hence, VBBinaryLensing instances are
+thread_local and so are static variables in VBBinaryLensingLibrary.cpp.
 */
 
 static PyObject * 
 VBBinaryLensing_BinaryMagDark_wrapper(PyObject *self, PyObject *args) {
   double a, q, y1, y2, RSv, a1, tolerance, mag;
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
 
   if (!PyArg_ParseTuple(args, "ddddddd", &a, &q, &y1, &y2, &RSv, &tolerance, &a1)) return NULL;
 
   VBBL.Tol = tolerance;
   VBBL.a1 = a1;
 
+  Py_BEGIN_ALLOW_THREADS
   mag = VBBL.BinaryMag2(a, q, y1, y2, RSv);
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
@@ -25,13 +30,15 @@ VBBinaryLensing_BinaryMagDark_wrapper(PyObject *self, PyObject *args) {
 static PyObject *
 VBBinaryLensing_BinaryMagFinite_wrapper(PyObject *self, PyObject *args) {
   double a, q, y1, y2, RSv, tolerance, mag;
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
 
   if (!PyArg_ParseTuple(args, "dddddd", &a, &q, &y1, &y2, &RSv, &tolerance)) return NULL;
 
   VBBL.Tol = tolerance;
 
+  Py_BEGIN_ALLOW_THREADS
   mag = VBBL.BinaryMag2(a, q, y1, y2, RSv);
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
@@ -39,11 +46,13 @@ VBBinaryLensing_BinaryMagFinite_wrapper(PyObject *self, PyObject *args) {
 static PyObject *
 VBBinaryLensing_BinaryMagPoint_wrapper(PyObject *self, PyObject *args) {
   double a, q, y1, y2, mag;
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
 
   if (!PyArg_ParseTuple(args, "dddd", &a, &q, &y1, &y2)) return NULL;
 
+  Py_BEGIN_ALLOW_THREADS
   mag = VBBL.BinaryMag0(a, q, y1, y2);
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
@@ -51,15 +60,86 @@ VBBinaryLensing_BinaryMagPoint_wrapper(PyObject *self, PyObject *args) {
 static PyObject *
 VBBinaryLensing_BinaryMagPointShear_wrapper(PyObject *self, PyObject *args) {
   double a, q, y1, y2, K, G, Gi, mag;
-  static VBBinaryLensing_shear VBBL;
+  static thread_local VBBinaryLensing_shear VBBL;
 
   if (!PyArg_ParseTuple(args, "ddddddd", &a, &q, &y1, &y2, &K, &G, &Gi)) return NULL;
 
+  Py_BEGIN_ALLOW_THREADS
   mag = VBBL.BinaryMag0_shear(a, q, y1, y2, K, G, Gi);
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
 
+/*
+Array versions of BinaryMagDark and BinaryMagFinite. Single instance of
+VBBinaryLensing (per thread) is shared by these functions. Arguments are the same as for
+scalar versions, but s, y1, y2 are buffers of doubles (e.g., contiguous numpy
+arrays) and the last argument is output buffer filled with magnifications.
+*/
+static thread_local VBBinaryLensing VBBL_array;
+
+static int
+check_buffers(Py_buffer *s, Py_buffer *y1, Py_buffer *y2, Py_buffer *mags) {
+  Py_ssize_t n = mags->len;
+
+  if (s->len != n || y1->len != n || y2->len != n) {
+    PyErr_SetString(PyExc_ValueError, "VBBL array functions require input and output arrays of the same size");
+    return 0;
+  }
+  if (n % sizeof(double) != 0) {
+    PyErr_SetString(PyExc_ValueError, "VBBL array functions require arrays of doubles");
+    return 0;
+  }
+  return 1;
+}
+
+static PyObject *
+BinaryMag2_array(PyObject *args, int dark) {
+  Py_buffer s, y1, y2, mags;
+  double q, RSv, tolerance, a1 = 0.;
+  Py_ssize_t i, n;
+  int ok;
+
+  if (dark)
+    ok = PyArg_ParseTuple(args, "y*dy*y*dddw*", &s, &q, &y1, &y2, &RSv, &tolerance, &a1, &mags);
+  else
+    ok = PyArg_ParseTuple(args, "y*dy*y*ddw*", &s, &q, &y1, &y2, &RSv, &tolerance, &mags);
+  if (!ok) return NULL;
+
+  if (check_buffers(&s, &y1, &y2, &mags)) {
+    n = mags.len / sizeof(double);
+    Py_BEGIN_ALLOW_THREADS
+    VBBL_array.Tol = tolerance;
+    VBBL_array.a1 = a1;
+    for (i = 0; i < n; i++)
+      ((double *)mags.buf)[i] = VBBL_array.BinaryMag2(
+          ((double *)s.buf)[i], q, ((double *)y1.buf)[i], ((double *)y2.buf)[i], RSv);
+    Py_END_ALLOW_THREADS
+    ok = 1;
+  } else {
+    ok = 0;
+  }
+
+  PyBuffer_Release(&s);
+  PyBuffer_Release(&y1);
+  PyBuffer_Release(&y2);
+  PyBuffer_Release(&mags);
+  if (!ok) return NULL;
+
+  Py_RETURN_NONE;
+}
+
+static PyObject *
+VBBinaryLensing_BinaryMagDarkArray_wrapper(PyObject *self, PyObject *args) {
+  return BinaryMag2_array(args, 1);
+}
+
+static PyObject *
+VBBinaryLensing_BinaryMagFiniteArray_wrapper(PyObject *self, PyObject *args) {
+  return BinaryMag2_array(args, 0);
+}
+
 PyObject * makelist(double *array, size_t size) {
     PyObject *l = PyList_New(size);
     for (size_t i = 0; i != size; ++i) {
@@ -70,7 +150,7 @@ PyObject * makelist(double *array, size_t size) {
 
 static PyObject *
 VBBL_SG12_5_wrapper(PyObject *self, PyObject *args) {
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
   complex complex_poly[6], complex_roots[5];
   double roots[10];
   double p0, p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11;
@@ -98,18 +178,20 @@ VBBL_SG12_5_wrapper(PyObject *self, PyObject *args) {
 static PyObject * 
 VBBinaryLensing_BinaryMag_wrapper(PyObject *self, PyObject *args) {
   double a, q, y1, y2, mag;
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
 
   if (!PyArg_ParseTuple(args, "dddd", &a, &q, &y1, &y2)) return NULL;
 
+  Py_BEGIN_ALLOW_THREADS
   mag = VBBL.BinaryMag0(a, q, y1, y2);
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("d", mag);
 }
 
 static PyObject *
 VBBL_SG12_9_wrapper(PyObject *self, PyObject *args) {
-  static VBBinaryLensing VBBL;
+  static thread_local VBBinaryLensing VBBL;
   complex complex_poly[10], complex_roots[9];
   double roots[18];
   double p0, p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11, p12, p13, p14, p15, p16, p17, p18, p19;
@@ -138,14 +220,114 @@ VBBL_SG12_9_wrapper(PyObject *self, PyObject *args) {
   return makelist(roots, 18);
 }
 
+/*
+Array version of VBBL_SG12_9. The first argument is a buffer of 20*n doubles:
+for each polynomial there are 10 real parts followed by 10 imaginary parts of
+coefficients (i.e., the same order as arguments of VBBL_SG12_9). The second
+argument is output buffer of 18*n doubles, which is filled with 9 real parts
+followed by 9 imaginary parts of roots of each polynomial.
+*/
+static PyObject *
+VBBL_SG12_9Array_wrapper(PyObject *self, PyObject *args) {
+  static thread_local VBBinaryLensing VBBL;
+  complex complex_poly[10], complex_roots[9];
+  Py_buffer polynomials, roots;
+  Py_ssize_t i, n;
+  double *poly, *out;
+  int j, ok;
+
+  if (!PyArg_ParseTuple(args, "y*w*", &polynomials, &roots)) return NULL;
+
+  n = polynomials.len / (20 * sizeof(double));
+  ok = (polynomials.len == n * 20 * (Py_ssize_t)sizeof(double) && roots.len == n * 18 * (Py_ssize_t)sizeof(double));
+  if (ok) {
+    Py_BEGIN_ALLOW_THREADS
+    for (i = 0; i < n; i++) {
+      poly = (double *)polynomials.buf + 20 * i;
+      out = (double *)roots.buf + 18 * i;
+      for (j = 0; j < 10; j++)
+        complex_poly[j] = complex(poly[j], poly[j+10]);
+      for (j = 0; j < 9; j++)
+        complex_roots[j] = complex(0., 0.);
+
+      VBBL.cmplx_roots_gen(complex_roots, complex_poly, 9, true, true);
+
+      for (j = 0; j < 9; j++) {
+        out[j] = complex_roots[j].re;
+        out[j+9] = complex_roots[j].im;
+      }
+    }
+    Py_END_ALLOW_THREADS
+  } else {
+    PyErr_SetString(PyExc_ValueError, "VBBL_SG12_9Array requires buffers of 20*n and 18*n doubles");
+  }
+
+  PyBuffer_Release(&polynomials);
+  PyBuffer_Release(&roots);
+  if (!ok) return NULL;
+
+  Py_RETURN_NONE;
+}
+
+/*
+Skowron & Gould 2012 solver with roots provided as starting points
+("warm start"). The first argument is a buffer of 2*(degree+1) doubles:
+real parts and then imaginary parts of coefficients. The second argument
+is a buffer of 2*degree doubles with starting points (real parts and then
+imaginary parts), which is overwritten with the roots found.
+*/
+static PyObject *
+VBBL_SG12WarmStart_wrapper(PyObject *self, PyObject *args) {
+  static thread_local VBBinaryLensing VBBL;
+  complex complex_poly[10], complex_roots[9];
+  Py_buffer polynomial, roots;
+  Py_ssize_t degree;
+  double *poly, *out;
+  int j, ok;
+
+  if (!PyArg_ParseTuple(args, "y*w*", &polynomial, &roots)) return NULL;
+
+  degree = roots.len / (2 * sizeof(double));
+  ok = (degree >= 2 && degree <= 9 && roots.len == 2 * degree * (Py_ssize_t)sizeof(double) &&
+        polynomial.len == 2 * (degree + 1) * (Py_ssize_t)sizeof(double));
+  if (ok) {
+    poly = (double *)polynomial.buf;
+    out = (double *)roots.buf;
+    for (j = 0; j <= degree; j++)
+      complex_poly[j] = complex(poly[j], poly[j+degree+1]);
+    for (j = 0; j < degree; j++)
+      complex_roots[j] = complex(out[j], out[j+degree]);
+
+    VBBL.cmplx_roots_gen(complex_roots, complex_poly, (int)degree, true, true);
+
+    for (j = 0; j < degree; j++) {
+      out[j] = complex_roots[j].re;
+      out[j+degree] = complex_roots[j].im;
+    }
+  } else {
+    PyErr_SetString(PyExc_ValueError,
+                    "VBBL_SG12WarmStart requires buffers of 2*(degree+1) and 2*degree doubles (degree from 2 to 9)");
+  }
+
+  PyBuffer_Release(&polynomial);
+  PyBuffer_Release(&roots);
+  if (!ok) return NULL;
+
+  Py_RETURN_NONE;
+}
+
 static PyMethodDef VBBLMethods[] = {
     {"VBBinaryLensing_BinaryMagDark", VBBinaryLensing_BinaryMagDark_wrapper, METH_VARARGS, "some notes here"},
     {"VBBinaryLensing_BinaryMagFinite", VBBinaryLensing_BinaryMagFinite_wrapper, METH_VARARGS, "some notes here"},
+    {"VBBinaryLensing_BinaryMagDarkArray", VBBinaryLensing_BinaryMagDarkArray_wrapper, METH_VARARGS, "some notes here"},
+    {"VBBinaryLensing_BinaryMagFiniteArray", VBBinaryLensing_BinaryMagFiniteArray_wrapper, METH_VARARGS, "some notes here"},
     {"VBBinaryLensing_BinaryMagPoint", VBBinaryLensing_BinaryMagPoint_wrapper, METH_VARARGS, "some notes here"},
     {"VBBinaryLensing_BinaryMagPointShear", VBBinaryLensing_BinaryMagPointShear_wrapper, METH_VARARGS, "some notes here"},
     {"VBBL_SG12_5", VBBL_SG12_5_wrapper, METH_VARARGS, "some notes here"},
     {"VBBL_BinaryMag", VBBinaryLensing_BinaryMag_wrapper, METH_VARARGS, "some notes here"},
     {"VBBL_SG12_9", VBBL_SG12_9_wrapper, METH_VARARGS, "some notes here"},
+    {"VBBL_SG12_9Array", VBBL_SG12_9Array_wrapper, METH_VARARGS, "some notes here"},
+    {"VBBL_SG12WarmStart", VBBL_SG12WarmStart_wrapper, METH_VARARGS, "some notes here"},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 